@@ -0,0 +1,89 @@
+from argparse import ArgumentParser
+from collections.abc import Callable
+from time import perf_counter
+from typing import Any
+
+from draive import (
+    DataModel,
+    Field,
+    LMMCompletionChunk,
+    Missing,
+    MultimodalContent,
+    ToolCallStatus,
+)
+from draive.parameters import ParametrizedData
+
+
+class ExampleModel(DataModel):
+    identifier: str
+    count: int
+    ratio: float | None = None
+    tags: list[str] = Field(default_factory=list)
+    label: str = Field(alias="name", default="")
+    note: str | Missing
+
+
+def generic_initializer[Model: ParametrizedData](
+    model: type[Model],
+) -> Callable[..., Model]:
+    # previous construction path - generic initializer for all classes
+    def construct(**kwargs: Any) -> Model:
+        instance: Model = object.__new__(model)
+        ParametrizedData.__init__(instance, **kwargs)
+        return instance
+
+    return construct
+
+
+def measure(
+    construct: Callable[..., Any],
+    kwargs: dict[str, Any],
+    /,
+    *,
+    count: int,
+) -> float:
+    start: float = perf_counter()
+    for _ in range(count):
+        construct(**kwargs)
+
+    return (perf_counter() - start) / count
+
+
+def main() -> None:
+    parser = ArgumentParser(description="ParametrizedData construction latency")
+    parser.add_argument("--count", type=int, default=200_000)
+    arguments = parser.parse_args()
+
+    content: MultimodalContent = MultimodalContent.of("token")
+    for name, model, kwargs in (
+        (
+            "ExampleModel",
+            ExampleModel,
+            {"identifier": "id", "count": 1, "tags": ["a", "b"], "name": "label"},
+        ),
+        (
+            "ToolCallStatus",
+            ToolCallStatus,
+            {"identifier": "id", "tool": "tool", "status": "RUNNING"},
+        ),
+        (
+            "MultimodalContent",
+            MultimodalContent,
+            {"elements": ("token",)},
+        ),
+        (
+            "LMMCompletionChunk",
+            LMMCompletionChunk,
+            {"content": content},
+        ),
+    ):
+        before: float = measure(generic_initializer(model), kwargs, count=arguments.count)
+        after: float = measure(model, kwargs, count=arguments.count)
+        print(
+            f"{name:>18}: generic={before * 1e9:.0f}ns"
+            f" compiled={after * 1e9:.0f}ns speedup={before / after:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
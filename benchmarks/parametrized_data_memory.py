@@ -0,0 +1,89 @@
+import gc
+import tracemalloc
+from argparse import ArgumentParser
+from collections.abc import Callable
+from time import perf_counter
+from typing import Any
+
+from draive import (
+    ConversationMessage,
+    DataModel,
+    LMMCompletionChunk,
+    MultimodalContent,
+)
+
+
+class ExampleModel(DataModel, slots=True):
+    identifier: str
+    count: int
+    ratio: float | None = None
+
+
+class DictExample:
+    # previous layout - instances keeping parameters in the attributes dict
+    def __init__(
+        self,
+        identifier: str,
+        count: int,
+        ratio: float | None = None,
+    ) -> None:
+        self.identifier: str = identifier
+        self.count: int = count
+        self.ratio: float | None = ratio
+
+
+def measure(
+    construct: Callable[[int], Any],
+    /,
+    *,
+    count: int,
+) -> tuple[float, float]:
+    gc.collect()
+    tracemalloc.start()
+    start: float = perf_counter()
+    instances: list[Any] = [construct(index) for index in range(count)]
+    duration: float = perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    return size / count, duration
+
+
+def main() -> None:
+    parser = ArgumentParser(description="ParametrizedData instances memory usage")
+    parser.add_argument("--count", type=int, default=1_000_000)
+    arguments = parser.parse_args()
+
+    content: MultimodalContent = MultimodalContent.of("token")
+    constructors: tuple[tuple[str, Callable[[int], Any]], ...] = (
+        (
+            "DictExample",
+            lambda index: DictExample(identifier="id", count=index),
+        ),
+        (
+            "ExampleModel",
+            lambda index: ExampleModel(identifier="id", count=index),
+        ),
+        (
+            "LMMCompletionChunk",
+            lambda _: LMMCompletionChunk.unchecked(content=content),
+        ),
+        (
+            "ConversationMessage",
+            lambda _: ConversationMessage.unchecked(
+                identifier="id",
+                role="model",
+                content=content,
+            ),
+        ),
+    )
+    for name, construct in constructors:
+        size, duration = measure(construct, count=arguments.count)
+        print(
+            f"{name:>20}: {size:.0f}B per instance,"
+            f" {size * arguments.count / 2**20:.1f}MiB total, created in {duration:.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
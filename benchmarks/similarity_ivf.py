@@ -0,0 +1,70 @@
+from argparse import ArgumentParser
+from time import perf_counter
+from typing import Any
+
+import numpy as np
+from draive import Embedded, IVFVectorIndex, VectorIndex, similarity_search
+from numpy.typing import NDArray
+
+
+def main() -> None:
+    parser = ArgumentParser(description="IVFVectorIndex recall@k and latency against exact search")
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--dimensions", type=int, default=256)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--limit", type=int, default=10)
+    arguments = parser.parse_args()
+
+    generator = np.random.default_rng(seed=42)
+    # clustered data resembles real embeddings better than uniform noise
+    centers: NDArray[Any] = generator.normal(size=(arguments.size // 500, arguments.dimensions))
+    vectors: NDArray[np.float32] = (
+        centers[generator.integers(0, centers.shape[0], arguments.size)]
+        + generator.normal(scale=0.5, size=(arguments.size, arguments.dimensions))
+    ).astype(np.float32)
+    queries: NDArray[np.float32] = (
+        vectors[generator.integers(0, arguments.size, arguments.queries)]
+        + generator.normal(scale=0.3, size=(arguments.queries, arguments.dimensions))
+    ).astype(np.float32)
+    embedded: list[Embedded[int]] = [
+        Embedded(value=idx, vector=vector) for idx, vector in enumerate(vectors.tolist())
+    ]
+
+    start: float = perf_counter()
+    exact_index: VectorIndex[int] = VectorIndex.of(embedded)
+    print(f"exact index build: {perf_counter() - start:.2f}s")
+
+    start = perf_counter()
+    expected: list[set[int]] = [
+        set(similarity_search(query, exact_index, limit=arguments.limit)) for query in queries
+    ]
+    exact_latency: float = (perf_counter() - start) / arguments.queries
+    print(f"exact search: {exact_latency * 1000:.2f}ms/query")
+
+    start = perf_counter()
+    index: IVFVectorIndex[int] = IVFVectorIndex.of(embedded, seed=42)
+    print(f"ivf index build: {perf_counter() - start:.2f}s ({index.clusters} clusters)")
+
+    for probes in (1, 2, 4, 8, 16, 32, 64):
+        start = perf_counter()
+        found: list[list[int]] = [
+            index.search(query, limit=arguments.limit, probes=probes) for query in queries
+        ]
+        latency: float = (perf_counter() - start) / arguments.queries
+        recall: float = float(
+            np.mean(
+                [
+                    len(expected_set.intersection(result)) / arguments.limit
+                    for expected_set, result in zip(expected, found, strict=True)
+                ]
+            )
+        )
+        print(
+            f"probes={probes:>3}: recall@{arguments.limit}={recall:.3f}"
+            f" latency={latency * 1000:.2f}ms/query"
+            f" speedup={exact_latency / latency:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+from argparse import ArgumentParser
+from time import perf_counter
+from typing import Any
+
+import numpy as np
+from draive import Embedded, QuantizedVectorIndex, similarity_search
+from numpy.typing import NDArray
+
+
+def main() -> None:
+    parser = ArgumentParser(
+        description="QuantizedVectorIndex memory, recall@k and latency against similarity_search"
+    )
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--dimensions", type=int, default=768)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=10)
+    arguments = parser.parse_args()
+
+    generator = np.random.default_rng(seed=42)
+    centers: NDArray[Any] = generator.normal(size=(arguments.size // 500, arguments.dimensions))
+    vectors: NDArray[np.float32] = (
+        centers[generator.integers(0, centers.shape[0], arguments.size)]
+        + generator.normal(scale=0.5, size=(arguments.size, arguments.dimensions))
+    ).astype(np.float32)
+    queries: NDArray[np.float32] = (
+        vectors[generator.integers(0, arguments.size, arguments.queries)]
+        + generator.normal(scale=0.3, size=(arguments.queries, arguments.dimensions))
+    ).astype(np.float32)
+    vectors_list: list[NDArray[np.float32]] = list(vectors)
+
+    start: float = perf_counter()
+    expected: list[set[int]] = [
+        set(similarity_search(query, vectors_list, limit=arguments.limit)) for query in queries
+    ]
+    exact_latency: float = (perf_counter() - start) / arguments.queries
+    print(f"float32 vectors: {vectors.nbytes / 2**20:.1f}MiB")
+    print(f"similarity_search: {exact_latency * 1000:.2f}ms/query")
+
+    embedded: list[Embedded[int]] = [
+        Embedded(value=idx, vector=vector) for idx, vector in enumerate(vectors.tolist())
+    ]
+    for quantization in ("int8", "binary"):
+        for oversampling in (1, 4, 16, 64):
+            index: QuantizedVectorIndex[int] = QuantizedVectorIndex.of(
+                embedded,
+                quantization=quantization,
+                oversampling=oversampling,
+            )
+            start = perf_counter()
+            found: list[list[int]] = [
+                index.search(query, limit=arguments.limit) for query in queries
+            ]
+            latency: float = (perf_counter() - start) / arguments.queries
+            recall: float = float(
+                np.mean(
+                    [
+                        len(expected_set.intersection(result)) / arguments.limit
+                        for expected_set, result in zip(expected, found, strict=True)
+                    ]
+                )
+            )
+            print(
+                f"{quantization:>6} oversampling={oversampling:>2}:"
+                f" codes={index.codes_size / 2**20:.1f}MiB"
+                f" recall@{arguments.limit}={recall:.3f}"
+                f" latency={latency * 1000:.2f}ms/query"
+            )
+
+
+if __name__ == "__main__":
+    main()
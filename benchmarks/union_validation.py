@@ -0,0 +1,114 @@
+from argparse import ArgumentParser
+from collections.abc import Callable
+from time import perf_counter
+from types import UnionType
+from typing import Any, get_args
+
+from draive import (
+    AudioURLContent,
+    ConversationMessage,
+    ImageBase64Content,
+    ImageURLContent,
+)
+from draive.parameters import ParameterValidationError, ParameterValidator
+from draive.parameters.validation import parameter_validator
+from draive.types import MultimodalContentElement
+
+
+def validator(
+    annotation: Any,
+    /,
+) -> ParameterValidator[Any]:
+    return parameter_validator(
+        annotation,
+        verifier=None,
+        globalns=None,
+        localns=None,
+        recursion_guard=frozenset(),
+    )
+
+
+def trial_validator(
+    alternatives: tuple[Any, ...],
+    /,
+) -> ParameterValidator[Any]:
+    # previous union validation - trying all alternatives in order
+    validators: list[ParameterValidator[Any]] = [
+        validator(alternative) for alternative in alternatives
+    ]
+
+    def union_validator(
+        value: Any,
+        context: Any,
+    ) -> Any:
+        for alternative in validators:
+            try:
+                return alternative(value, context)
+
+            except ParameterValidationError:
+                continue
+
+        raise ParameterValidationError.invalid_type(
+            expected=UnionType,
+            received=value,
+            context=context,
+        )
+
+    return union_validator
+
+
+def measure(
+    validator: Callable[[Any, Any], Any],
+    values: list[Any],
+    /,
+    *,
+    count: int,
+) -> float:
+    start: float = perf_counter()
+    for _ in range(count):
+        for value in values:
+            validator(value, ("benchmark",))
+
+    return (perf_counter() - start) / (count * len(values))
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Union validation latency")
+    parser.add_argument("--count", type=int, default=20_000)
+    arguments = parser.parse_args()
+
+    payload: list[Any] = [
+        "text",
+        ImageURLContent(image_url="https://miquido.com/image"),
+        ImageBase64Content(image_base64="aW1hZ2U="),
+        AudioURLContent(audio_url="https://miquido.com/audio"),
+        {"image_url": "https://miquido.com/image"},
+        {"audio_url": "https://miquido.com/audio"},
+    ]
+    before: float = measure(
+        trial_validator(get_args(MultimodalContentElement)),
+        payload,
+        count=arguments.count,
+    )
+    after: float = measure(validator(MultimodalContentElement), payload, count=arguments.count)
+    print(
+        f"MultimodalContentElement: trial={before * 1e9:.0f}ns"
+        f" dispatched={after * 1e9:.0f}ns speedup={before / after:.2f}x"
+    )
+
+    message: dict[str, Any] = {
+        "role": "model",
+        "content": {"elements": payload * 4},
+    }
+    start: float = perf_counter()
+    for _ in range(arguments.count // 10):
+        ConversationMessage.from_dict(message)
+
+    print(
+        f"ConversationMessage with {len(payload) * 4} elements:"
+        f" {(perf_counter() - start) / (arguments.count // 10) * 1e6:.1f}us"
+    )
+
+
+if __name__ == "__main__":
+    main()
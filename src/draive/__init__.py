@@ -10,13 +10,24 @@ from draive.agents import (
 from draive.conversation import (
     Conversation,
     ConversationCompletion,
+    ConversationContextBudget,
+    ConversationMemoryTrimming,
     ConversationMessage,
     ConversationMessageChunk,
     ConversationResponseStream,
     conversation_completion,
     lmm_conversation_completion,
 )
-from draive.embedding import Embedded, Embedder, Embedding, embed_text
+from draive.embedding import (
+    Embedded,
+    Embedder,
+    Embedding,
+    EmbeddingCacheStorage,
+    SQLiteEmbeddingCacheStorage,
+    embed_text,
+    embedding_batches,
+    embedding_cache,
+)
 from draive.generation import (
     ImageGeneration,
     ImageGenerator,
@@ -45,6 +56,10 @@ from draive.lmm import (
     tool,
 )
 from draive.metrics import (
+    CacheHits,
+    CacheHitUsage,
+    CacheUsage,
+    FunctionCacheUsage,
     Metric,
     MetricsTrace,
     MetricsTraceReport,
@@ -58,6 +73,7 @@ from draive.mistral import (
     MistralEmbeddingConfig,
     MistralException,
     mistral_embed_text,
+    mistral_embedding_identifier,
     mistral_lmm_invocation,
 )
 from draive.openai import (
@@ -66,10 +82,15 @@ from draive.openai import (
     OpenAIEmbeddingConfig,
     OpenAIException,
     OpenAIImageGenerationConfig,
+    openai_count_text_tokens,
+    openai_count_texts_tokens,
     openai_embed_text,
+    openai_embedding_identifier,
     openai_generate_image,
     openai_lmm_invocation,
+    openai_tokenization,
     openai_tokenize_text,
+    openai_tokenize_texts,
 )
 from draive.parameters import (
     Argument,
@@ -90,9 +111,30 @@ from draive.scope import (
     ScopeState,
     ctx,
 )
-from draive.similarity import mmr_similarity_search, similarity_score, similarity_search
-from draive.splitters import split_text
-from draive.tokenization import TextTokenizer, Tokenization, count_text_tokens, tokenize_text
+from draive.similarity import (
+    IVFVectorIndex,
+    QuantizedVectorIndex,
+    VectorIndex,
+    VectorStore,
+    batch_similarity_search,
+    mmr_similarity_search,
+    similarity_score,
+    similarity_scores,
+    similarity_search,
+)
+from draive.splitters import split_text, split_text_stream, split_texts
+from draive.tokenization import (
+    TextsTokenCounter,
+    TextsTokenizer,
+    TextTokenCounter,
+    TextTokenizer,
+    Tokenization,
+    count_text_tokens,
+    count_texts_tokens,
+    tokenization_cache,
+    tokenize_text,
+    tokenize_texts,
+)
 from draive.types import (
     JSON,
     AudioBase64Content,
@@ -127,8 +169,16 @@ from draive.types import (
 from draive.utils import (
     MISSING,
     AsyncStream,
+    CacheBackend,
+    CacheSerializer,
+    CacheStatistics,
+    FileCacheBackend,
+    MemoryCacheBackend,
     Missing,
+    PickleCacheSerializer,
+    SQLiteCacheBackend,
     cache,
+    cache_statistics,
     freeze,
     getenv_bool,
     getenv_float,
@@ -160,26 +210,42 @@ __all__ = [
     "AudioURLContent",
     "auto_retry",
     "BaseAgent",
+    "batch_similarity_search",
     "BasicValue",
     "cache",
+    "cache_statistics",
+    "CacheBackend",
+    "CacheSerializer",
+    "CacheStatistics",
+    "CacheHits",
+    "CacheHitUsage",
+    "CacheUsage",
     "conversation_completion",
     "conversation_completion",
     "Conversation",
     "Conversation",
     "ConversationCompletion",
+    "ConversationContextBudget",
+    "ConversationMemoryTrimming",
     "ConversationMessage",
     "ConversationMessageChunk",
     "ConversationResponseStream",
     "count_text_tokens",
+    "count_texts_tokens",
     "ctx",
     "DataModel",
     "embed_text",
     "Embedded",
     "Embedder",
     "Embedding",
+    "embedding_batches",
+    "embedding_cache",
+    "EmbeddingCacheStorage",
     "Field",
+    "FileCacheBackend",
     "freeze",
     "frozenlist",
+    "FunctionCacheUsage",
     "generate_image",
     "generate_model",
     "generate_text",
@@ -193,6 +259,7 @@ __all__ = [
     "ImageGeneration",
     "ImageGenerator",
     "ImageURLContent",
+    "IVFVectorIndex",
     "Instruction",
     "is_missing",
     "JSON",
@@ -210,6 +277,7 @@ __all__ = [
     "LMMToolResponse",
     "load_env",
     "Memory",
+    "MemoryCacheBackend",
     "Metric",
     "metrics_log_reporter",
     "MetricsTrace",
@@ -218,6 +286,7 @@ __all__ = [
     "Missing",
     "MISSING",
     "mistral_embed_text",
+    "mistral_embedding_identifier",
     "mistral_lmm_invocation",
     "MistralChatConfig",
     "MistralClient",
@@ -229,9 +298,14 @@ __all__ = [
     "MultimodalContent",
     "not_missing",
     "openai_embed_text",
+    "openai_embedding_identifier",
     "openai_generate_image",
     "openai_lmm_invocation",
+    "openai_count_text_tokens",
+    "openai_count_texts_tokens",
+    "openai_tokenization",
     "openai_tokenize_text",
+    "openai_tokenize_texts",
     "OpenAIChatConfig",
     "OpenAIClient",
     "OpenAIEmbeddingConfig",
@@ -245,23 +319,35 @@ __all__ = [
     "ParameterValidator",
     "ParameterVerifier",
     "ParameterVerifier",
+    "PickleCacheSerializer",
     "RateLimitError",
+    "QuantizedVectorIndex",
     "ReadOnlyMemory",
     "ScopeDependencies",
     "ScopeDependency",
     "ScopeState",
     "setup_logging",
     "similarity_score",
+    "similarity_scores",
     "similarity_search",
     "split_sequence",
     "split_text",
+    "split_text_stream",
+    "split_texts",
+    "SQLiteCacheBackend",
+    "SQLiteEmbeddingCacheStorage",
     "State",
     "TextGeneration",
     "TextGenerator",
+    "TextsTokenCounter",
+    "TextsTokenizer",
+    "TextTokenCounter",
     "TextTokenizer",
     "timeout",
     "Tokenization",
+    "tokenization_cache",
     "tokenize_text",
+    "tokenize_texts",
     "TokenUsage",
     "TokenUsage",
     "tool",
@@ -278,5 +364,7 @@ __all__ = [
     "VideoBase64Content",
     "VideoContent",
     "VideoDataContent",
+    "VectorIndex",
+    "VectorStore",
     "VideoURLContent",
 ]
@@ -1,3 +1,4 @@
+from draive.conversation.budget import ConversationContextBudget, ConversationMemoryTrimming
 from draive.conversation.call import conversation_completion
 from draive.conversation.completion import ConversationCompletion
 from draive.conversation.lmm import lmm_conversation_completion
@@ -12,6 +13,8 @@ __all__ = [
     "conversation_completion",
     "Conversation",
     "ConversationCompletion",
+    "ConversationContextBudget",
+    "ConversationMemoryTrimming",
     "ConversationMessageChunk",
     "ConversationResponseStream",
     "ConversationMessage",
@@ -0,0 +1,88 @@
+import json
+from collections.abc import Sequence
+from typing import Self
+
+from draive.conversation.model import ConversationMessage
+from draive.parameters import DataModel, State, ToolSpecification
+from draive.scope import ctx
+from draive.tokenization import count_texts_tokens
+
+__all__ = [
+    "ConversationContextBudget",
+    "ConversationMemoryTrimming",
+]
+
+
+class ConversationContextBudget(State):
+    # limit of prompt tokens used by instruction, tools, memory and input, None is no limit
+    prompt_tokens: int | None = None
+
+
+class ConversationMemoryTrimming(DataModel):
+    messages: int
+    tokens: int
+
+    def __add__(
+        self,
+        other: Self,
+    ) -> Self:
+        return self.__class__(
+            messages=self.messages + other.messages,
+            tokens=self.tokens + other.tokens,
+        )
+
+
+def budgeted_memory(
+    memory: Sequence[ConversationMessage],
+    /,
+    *,
+    instruction: str,
+    tools: Sequence[ToolSpecification],
+    input: ConversationMessage,  # noqa: A002
+    prompt_tokens: int,
+) -> Sequence[ConversationMessage]:
+    """\
+    Drop the oldest memory messages which do not fit in prompt_tokens \
+    together with instruction, tools and input. Tokens are counted using \
+    the current Tokenization state, media are counted using their text representation. \
+    Number of dropped messages and tokens is recorded as ConversationMemoryTrimming metric.
+    """
+    if not memory:
+        return memory
+
+    # count everything at once - instruction, tools and input come first
+    counts: list[int] = count_texts_tokens(
+        [
+            instruction,
+            *(json.dumps(tool) for tool in tools),
+            input.content.as_string(),
+            *(message.content.as_string() for message in memory),
+        ]
+    )
+    available_tokens: int = prompt_tokens - sum(counts[: len(tools) + 2])
+    memory_counts: list[int] = counts[len(tools) + 2 :]
+
+    # keep the most recent messages that fit within the budget
+    kept_count: int = 0
+    kept_tokens: int = 0
+    for message_tokens in reversed(memory_counts):
+        if kept_tokens + message_tokens > available_tokens:
+            break
+
+        kept_count += 1
+        kept_tokens += message_tokens
+
+    trimmed_count: int = len(memory) - kept_count
+    if trimmed_count:
+        ctx.log_debug(
+            "Trimming %d oldest conversation memory messages to fit prompt tokens budget",
+            trimmed_count,
+        )
+
+    ctx.record(
+        ConversationMemoryTrimming(
+            messages=trimmed_count,
+            tokens=sum(memory_counts[:trimmed_count]),
+        )
+    )
+    return memory[trimmed_count:]
@@ -3,6 +3,7 @@ from datetime import UTC, datetime
 from typing import Any, Literal, overload
 from uuid import uuid4
 
+from draive.conversation.budget import ConversationContextBudget, budgeted_memory
 from draive.conversation.model import (
     ConversationMessage,
     ConversationMessageChunk,
@@ -94,39 +95,50 @@ async def lmm_conversation_completion(
             case [*tools]:
                 toolbox = Toolbox(*tools)
 
-        context: list[LMMContextElement] = [
-            LMMInstruction.of(instruction),
-        ]
+        lmm_instruction: LMMInstruction = LMMInstruction.of(instruction)
 
         conversation_memory: Memory[ConversationMessage]
+        memory_messages: Sequence[ConversationMessage]
         match memory:
             case None:
                 conversation_memory = ReadOnlyMemory()
+                memory_messages = ()
 
             case Memory() as memory:
-                context.extend(
-                    message.as_lmm_context_element() for message in await memory.recall()
-                )
                 conversation_memory = memory
+                memory_messages = await memory.recall()
 
-            case [*memory_messages]:
-                context.extend(message.as_lmm_context_element() for message in memory_messages)
-                conversation_memory = ReadOnlyMemory(elements=memory_messages)
+            case [*messages]:
+                conversation_memory = ReadOnlyMemory(elements=messages)
+                memory_messages = messages
 
         request_message: ConversationMessage
         match input:
             case ConversationMessage() as message:
-                context.append(LMMInput.of(message.content))
                 request_message = message
 
             case content:
-                context.append(LMMInput.of(content))
                 request_message = ConversationMessage(
                     role="user",
                     created=datetime.now(UTC),
                     content=MultimodalContent.of(content),
                 )
 
+        if (prompt_tokens := ctx.state(ConversationContextBudget).prompt_tokens) is not None:
+            memory_messages = budgeted_memory(
+                memory_messages,
+                instruction=lmm_instruction.content,
+                tools=toolbox.available_tools(),
+                input=request_message,
+                prompt_tokens=prompt_tokens,
+            )
+
+        context: list[LMMContextElement] = [
+            lmm_instruction,
+            *(message.as_lmm_context_element() for message in memory_messages),
+            LMMInput.of(request_message.content),
+        ]
+
         if stream:
             return ctx.stream(
                 generator=_lmm_conversation_completion_stream(
@@ -165,7 +177,7 @@ async def _lmm_conversation_completion(
         ):
             case LMMCompletion() as completion:
                 ctx.log_debug("Received conversation result")
-                response_message: ConversationMessage = ConversationMessage(
+                response_message: ConversationMessage = ConversationMessage.unchecked(
                     role="model",
                     created=datetime.now(UTC),
                     content=completion.content,
@@ -184,7 +196,7 @@ async def _lmm_conversation_completion(
                 if direct_content := [
                     response.content for response in responses if response.direct
                 ]:
-                    response_message: ConversationMessage = ConversationMessage(
+                    response_message: ConversationMessage = ConversationMessage.unchecked(
                         role="model",
                         created=datetime.now(UTC),
                         content=MultimodalContent.of(*direct_content),
@@ -226,7 +238,7 @@ async def _lmm_conversation_completion_stream(
                     ctx.log_debug("Received conversation result chunk")
                     response_content = response_content.extending(chunk.content)
 
-                    yield ConversationMessageChunk(
+                    yield ConversationMessageChunk.unchecked(
                         identifier=response_identifier,
                         content=chunk.content,
                     )
@@ -255,7 +267,7 @@ async def _lmm_conversation_completion_stream(
                         response.content for response in responses if response.direct
                     ]:
                         response_content = MultimodalContent.of(*direct_content)
-                        yield ConversationMessageChunk(
+                        yield ConversationMessageChunk.unchecked(
                             identifier=response_identifier,
                             content=response_content,
                         )
@@ -272,7 +284,7 @@ async def _lmm_conversation_completion_stream(
         # remember messages when finishing stream
         await conversation_memory.remember(
             request_message,
-            ConversationMessage(
+            ConversationMessage.unchecked(
                 identifier=response_identifier,
                 role="model",
                 created=datetime.now(UTC),
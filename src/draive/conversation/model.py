@@ -20,7 +20,7 @@ __all__ = [
 ]
 
 
-class ConversationMessage(DataModel):
+class ConversationMessage(DataModel, slots=True):
     @classmethod
     def user(
         cls,
@@ -71,7 +71,7 @@ class ConversationMessage(DataModel):
         return bool(self.content)
 
 
-class ConversationMessageChunk(DataModel):
+class ConversationMessageChunk(DataModel, slots=True):
     identifier: str
     content: MultimodalContent
 
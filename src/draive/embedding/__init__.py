@@ -1,3 +1,9 @@
+from draive.embedding.batching import embedding_batches
+from draive.embedding.cache import (
+    EmbeddingCacheStorage,
+    SQLiteEmbeddingCacheStorage,
+    embedding_cache,
+)
 from draive.embedding.call import embed_text
 from draive.embedding.embedded import Embedded
 from draive.embedding.embedder import Embedder
@@ -8,4 +14,8 @@ __all__ = [
     "Embedded",
     "Embedder",
     "Embedding",
+    "embedding_batches",
+    "embedding_cache",
+    "EmbeddingCacheStorage",
+    "SQLiteEmbeddingCacheStorage",
 ]
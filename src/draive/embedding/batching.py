@@ -0,0 +1,53 @@
+from collections.abc import Sequence
+
+from draive.tokenization import count_texts_tokens
+
+__all__ = [
+    "embedding_batches",
+]
+
+
+def embedding_batches(
+    values: Sequence[str],
+    /,
+    *,
+    batch_size: int,
+    batch_tokens: int | None = None,
+) -> list[list[int]]:
+    """\
+    Split values into batches of indices for embedding requests.
+    Batches contain at most batch_size values. When batch_tokens is provided \
+    values are also packed up to batch_tokens tokens per batch, counted using \
+    the current Tokenization state. Values are sorted by the number of tokens before \
+    packing, so batches do not preserve the order of values and results have to be \
+    placed back using returned indices. A value exceeding batch_tokens on its own \
+    is placed in a separate batch.
+    """
+    assert batch_size > 0  # nosec: B101
+    if batch_tokens is None:
+        return [
+            list(range(start, min(start + batch_size, len(values))))
+            for start in range(0, len(values), batch_size)
+        ]
+
+    assert batch_tokens > 0  # nosec: B101
+    tokens: list[int] = count_texts_tokens(values)
+    batches: list[list[int]] = []
+    current_batch: list[int] = []
+    current_tokens: int = 0
+    # packing values of similar length leaves less unused budget per request
+    for index in sorted(range(len(values)), key=tokens.__getitem__):
+        if current_batch and (
+            len(current_batch) >= batch_size or current_tokens + tokens[index] > batch_tokens
+        ):
+            batches.append(current_batch)
+            current_batch = []
+            current_tokens = 0
+
+        current_batch.append(index)
+        current_tokens += tokens[index]
+
+    if current_batch:
+        batches.append(current_batch)
+
+    return batches
@@ -0,0 +1,214 @@
+import sqlite3
+from asyncio import Lock, to_thread
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from hashlib import sha256
+from pathlib import Path
+from typing import Any, Protocol, runtime_checkable
+
+import numpy as np
+from numpy.typing import NDArray
+
+from draive.embedding.embedded import Embedded
+from draive.embedding.embedder import Embedder
+from draive.metrics import CacheHitUsage
+from draive.scope import ctx
+
+__all__ = [
+    "embedding_cache",
+    "EmbeddingCacheStorage",
+    "SQLiteEmbeddingCacheStorage",
+]
+
+
+@runtime_checkable
+class EmbeddingCacheStorage(Protocol):
+    async def load(
+        self,
+        keys: Sequence[str],
+    ) -> dict[str, NDArray[np.float32] | list[float]]: ...
+
+    async def store(
+        self,
+        entries: Mapping[str, NDArray[np.float32] | list[float]],
+    ) -> None: ...
+
+
+def embedding_cache(
+    embedder: Embedder[str],
+    /,
+    *,
+    identifier: Callable[..., str] | str,
+    limit: int = 4096,
+    storage: EmbeddingCacheStorage | None = None,
+) -> Embedder[str]:
+    """\
+    Content addressed cache for text embeddings. \
+    Entries are keyed by the embedding identifier (provider, model and dimensions) \
+    and the text hash. Duplicates within a single call are embedded once, \
+    cached vectors are served from in memory lru and then from the optional storage. \
+    Only missing texts are sent to the wrapped embedder. \
+    Hits and misses are recorded as CacheHitUsage metric named "embedding" of the current scope.
+
+    Parameters
+    ----------
+    embedder: Embedder[str]
+        embedder used to resolve cache misses
+    identifier: Callable[..., str] | str
+        identifier of the embedding model, a function receives call extra arguments \
+        and is evaluated within the current scope i.e. to read model configuration
+    limit: int
+        limit of in memory cache entries, default is 4096
+    storage: EmbeddingCacheStorage | None
+        optional persistent storage consulted after in memory cache
+
+    Returns
+    -------
+    Embedder[str]
+        embedder using provided cache
+    """
+    assert limit > 0  # nosec: B101
+    cached: OrderedDict[str, NDArray[np.float32] | list[float]] = OrderedDict()
+
+    async def cached_embedder(
+        values: Iterable[str],
+        **extra: Any,
+    ) -> list[Embedded[str]]:
+        texts: list[str] = list(values)
+        prefix: str = identifier(**extra) if callable(identifier) else identifier
+        keys: list[str] = [
+            f"{prefix}|{sha256(text.encode(), usedforsecurity=False).hexdigest()}" for text in texts
+        ]
+        # deduplicate texts within the call
+        unique: dict[str, str] = dict(zip(keys, texts, strict=True))
+
+        vectors: dict[str, NDArray[np.float32] | list[float]] = {}
+        for key in unique:
+            if (vector := cached.get(key)) is not None:
+                cached.move_to_end(key)
+                vectors[key] = vector
+
+        hits: int = len(vectors)
+        if storage is not None and len(vectors) < len(unique):
+            stored: dict[str, NDArray[np.float32] | list[float]] = await storage.load(
+                [key for key in unique if key not in vectors]
+            )
+            hits += len(stored)
+            vectors.update(stored)
+            _remember(cached, stored, limit=limit)
+
+        missing: list[str] = [key for key in unique if key not in vectors]
+        if missing:
+            embedded: list[Embedded[str]] = await embedder(
+                [unique[key] for key in missing],
+                **extra,
+            )
+            fresh: dict[str, NDArray[np.float32] | list[float]] = {
+                key: element.vector for key, element in zip(missing, embedded, strict=True)
+            }
+            vectors.update(fresh)
+            _remember(cached, fresh, limit=limit)
+            if storage is not None:
+                await storage.store(fresh)
+
+        ctx.record(
+            CacheHitUsage.of(
+                "embedding",
+                hits=hits,
+                misses=len(missing),
+            )
+        )
+
+        return [
+            Embedded(
+                value=text,
+                vector=vectors[key],
+            )
+            for key, text in zip(keys, texts, strict=True)
+        ]
+
+    return cached_embedder
+
+
+def _remember(
+    cached: OrderedDict[str, NDArray[np.float32] | list[float]],
+    entries: Mapping[str, NDArray[np.float32] | list[float]],
+    /,
+    limit: int,
+) -> None:
+    for key, vector in entries.items():
+        cached[key] = vector
+        cached.move_to_end(key)
+
+    while len(cached) > limit:
+        cached.popitem(last=False)
+
+
+class SQLiteEmbeddingCacheStorage(EmbeddingCacheStorage):
+    """\
+    Embedding cache storage using local SQLite database. \
+    Vectors are stored as float32 blobs, database operations run in a worker thread.
+
+    Parameters
+    ----------
+    path: Path | str
+        path to the database file
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+    ) -> None:
+        self._connection: sqlite3.Connection = sqlite3.connect(
+            path,
+            check_same_thread=False,
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+        self._connection.commit()
+        self._lock: Lock = Lock()
+
+    async def load(
+        self,
+        keys: Sequence[str],
+    ) -> dict[str, NDArray[np.float32] | list[float]]:
+        async with self._lock:
+            return await to_thread(self._load, keys)
+
+    async def store(
+        self,
+        entries: Mapping[str, NDArray[np.float32] | list[float]],
+    ) -> None:
+        async with self._lock:
+            await to_thread(self._store, entries)
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _load(
+        self,
+        keys: Sequence[str],
+    ) -> dict[str, NDArray[np.float32] | list[float]]:
+        result: dict[str, NDArray[np.float32] | list[float]] = {}
+        # stay below the default limit of sqlite query variables
+        for start in range(0, len(keys), 512):
+            chunk: Sequence[str] = keys[start : start + 512]
+            rows: list[tuple[str, bytes]] = self._connection.execute(
+                f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(chunk))})",  # nosec: B608
+                tuple(chunk),
+            ).fetchall()
+            for key, vector in rows:
+                result[key] = np.frombuffer(vector, dtype="<f4")
+
+        return result
+
+    def _store(
+        self,
+        entries: Mapping[str, NDArray[np.float32] | list[float]],
+    ) -> None:
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+            [(key, np.asarray(vector, dtype="<f4").tobytes()) for key, vector in entries.items()],
+        )
+        self._connection.commit()
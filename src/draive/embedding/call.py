@@ -1,7 +1,10 @@
-from collections.abc import Iterable
-from typing import Any
+from asyncio import FIRST_COMPLETED, Task, wait
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator, Iterable
+from typing import Any, Literal, overload
 
 from draive.embedding.embedded import Embedded
+from draive.embedding.embedder import Embedder
 from draive.embedding.state import Embedding
 from draive.scope import ctx
 
@@ -10,11 +13,132 @@ __all__ = [
 ]
 
 
+@overload
+async def embed_text(
+    values: Iterable[str] | AsyncIterable[str],
+    *,
+    stream: Literal[True],
+    stream_batch_size: int = 32,
+    stream_concurrency: int = 4,
+    ordered: bool = True,
+    **extra: Any,
+) -> AsyncIterator[list[Embedded[str]]]: ...
+
+
+@overload
 async def embed_text(
     values: Iterable[str],
+    *,
+    stream: Literal[False] = False,
     **extra: Any,
-) -> list[Embedded[str]]:
-    return await ctx.state(Embedding).embed_text(
-        values=values,
-        **extra,
-    )
+) -> list[Embedded[str]]: ...
+
+
+async def embed_text(
+    values: Iterable[str] | AsyncIterable[str],
+    *,
+    stream: bool = False,
+    stream_batch_size: int = 32,
+    stream_concurrency: int = 4,
+    ordered: bool = True,
+    **extra: Any,
+) -> AsyncIterator[list[Embedded[str]]] | list[Embedded[str]]:
+    """\
+    Embed texts using the current Embedding state.
+    When streaming, values are split into batches of stream_batch_size elements \
+    with at most stream_concurrency batches being embedded at the same time. \
+    Embedded batches are yielded in the order of values when ordered is True \
+    or as soon as each of them completes otherwise. \
+    Extra arguments i.e. batch_size are passed to the embedding provider in both modes.
+    """
+    if stream:
+        assert stream_batch_size > 0  # nosec: B101
+        assert stream_concurrency > 0  # nosec: B101
+        return _embedded_batches(
+            ctx.state(Embedding).embed_text,
+            values,
+            batch_size=stream_batch_size,
+            concurrency=stream_concurrency,
+            ordered=ordered,
+            extra=extra,
+        )
+
+    else:
+        assert isinstance(values, Iterable)  # nosec: B101
+        return await ctx.state(Embedding).embed_text(
+            values=values,
+            **extra,
+        )
+
+
+async def _embedded_batches(  # noqa: PLR0913
+    embedder: Embedder[str],
+    values: Iterable[str] | AsyncIterable[str],
+    /,
+    *,
+    batch_size: int,
+    concurrency: int,
+    ordered: bool,
+    extra: dict[str, Any],
+) -> AsyncGenerator[list[Embedded[str]], None]:
+    running: deque[Task[list[Embedded[str]]]] = deque()
+    try:
+        async for batch in _batches(values, batch_size=batch_size):
+            running.append(ctx.spawn_subtask(embedder, batch, **extra))
+            if len(running) < concurrency:
+                continue  # start next batch
+
+            for embedded in await _completed(running, ordered=ordered):
+                yield embedded
+
+        while running:
+            for embedded in await _completed(running, ordered=ordered):
+                yield embedded
+
+    finally:  # do not leave requests running when the consumer stops early
+        for task in running:
+            task.cancel()
+
+
+async def _completed(
+    running: deque[Task[list[Embedded[str]]]],
+    /,
+    *,
+    ordered: bool,
+) -> list[list[Embedded[str]]]:
+    if ordered:
+        return [await running.popleft()]
+
+    done, _ = await wait(running, return_when=FIRST_COMPLETED)
+    completed: list[list[Embedded[str]]] = []
+    for task in list(running):
+        if task in done:
+            running.remove(task)
+            completed.append(task.result())
+
+    return completed
+
+
+async def _batches(
+    values: Iterable[str] | AsyncIterable[str],
+    /,
+    *,
+    batch_size: int,
+) -> AsyncGenerator[list[str], None]:
+    batch: list[str] = []
+    if isinstance(values, AsyncIterable):
+        async for value in values:
+            batch.append(value)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+
+    else:
+        for value in values:
+            batch.append(value)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+
+    if batch:
+        yield batch
@@ -1,3 +1,10 @@
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from draive.parameters import Field, ParameterValidationContext, ParameterValidationError
 from draive.parameters.state import State
 
 __all__ = [
@@ -5,6 +12,43 @@ __all__ = [
 ]
 
 
-class Embedded[Value](State):
+def _validated_vector(
+    value: Any,
+    context: ParameterValidationContext,
+) -> NDArray[np.float32] | list[float]:
+    match value:
+        # arrays are kept without conversion to python floats
+        case np.ndarray() if value.ndim == 1:  # pyright: ignore[reportUnknownMemberType]
+            return np.ascontiguousarray(value, dtype=np.float32)
+
+        case np.ndarray():
+            raise ParameterValidationError.invalid_value(
+                expected="1-D vector",
+                received=f"array of shape {value.shape}",  # pyright: ignore[reportUnknownMemberType]
+                context=context,
+            )
+
+        case [*elements] if all(
+            isinstance(element, float | int) and not isinstance(element, bool)
+            for element in elements
+        ):
+            return [float(element) for element in elements]
+
+        case _:
+            raise ParameterValidationError.invalid_type(
+                expected=Sequence[float],
+                received=value,
+                context=context,
+            )
+
+
+class Embedded[Value](State, slots=True):
     value: Value
-    vector: list[float]
+    vector: NDArray[np.float32] | list[float] = Field(validator=_validated_vector)
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ != self.__class__:
+            return False
+
+        # arrays can't be compared element wise as a single boolean
+        return self.value == other.value and np.array_equal(self.vector, other.vector)
@@ -1,3 +1,4 @@
+from draive.metrics.cache import CacheHits, CacheHitUsage, CacheUsage, FunctionCacheUsage
 from draive.metrics.function import ArgumentsTrace, ExceptionTrace, ResultTrace
 from draive.metrics.log_reporter import metrics_log_reporter
 from draive.metrics.metric import Metric
@@ -7,6 +8,10 @@ from draive.metrics.trace import MetricsTrace
 
 __all__ = [
     "ArgumentsTrace",
+    "CacheHits",
+    "CacheHitUsage",
+    "CacheUsage",
+    "FunctionCacheUsage",
     "Metric",
     "metrics_log_reporter",
     "MetricsTrace",
@@ -0,0 +1,116 @@
+from collections.abc import Callable
+from typing import Any, Self
+
+from draive.parameters import DataModel
+from draive.utils import CacheStatistics, cache_statistics
+
+__all__ = [
+    "CacheHits",
+    "CacheHitUsage",
+    "CacheUsage",
+    "FunctionCacheUsage",
+]
+
+
+class CacheHits(DataModel):
+    hits: int
+    misses: int
+
+    def __add__(
+        self,
+        other: Self,
+    ) -> Self:
+        return self.__class__(
+            hits=self.hits + other.hits,
+            misses=self.misses + other.misses,
+        )
+
+
+class CacheHitUsage(DataModel):
+    @classmethod
+    def of(
+        cls,
+        name: str,
+        /,
+        *,
+        hits: int,
+        misses: int,
+    ) -> Self:
+        """\
+        Prepare metric counting hits and misses of a single cache lookup \
+        i.e. ctx.record(CacheHitUsage.of("embedding", hits=1, misses=0)). \
+        Counts of caches with the same name are summed.
+        """
+        return cls(
+            usage={
+                name: CacheHits(
+                    hits=hits,
+                    misses=misses,
+                ),
+            },
+        )
+
+    usage: dict[str, CacheHits]
+
+    def __add__(
+        self,
+        other: Self,
+    ) -> Self:
+        usage: dict[str, CacheHits] = dict(self.usage)
+        for key, value in other.usage.items():
+            if current := usage.get(key):
+                usage[key] = current + value
+            else:
+                usage[key] = value
+
+        return self.__class__(usage=usage)
+
+
+class FunctionCacheUsage(DataModel):
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+
+
+class CacheUsage(DataModel):
+    @classmethod
+    def of(
+        cls,
+        function: Callable[..., Any],
+        /,
+        *,
+        name: str | None = None,
+    ) -> Self:
+        """\
+        Prepare metric using current statistics of a function wrapped in cache \
+        i.e. ctx.record(CacheUsage.of(cached_function)). \
+        Statistics are named using function qualified name by default.
+        """
+        statistics: CacheStatistics = cache_statistics(function)
+        return cls(
+            usage={
+                name or function.__qualname__: FunctionCacheUsage(
+                    hits=statistics.hits,
+                    misses=statistics.misses,
+                    evictions=statistics.evictions,
+                    expirations=statistics.expirations,
+                    size=statistics.size,
+                ),
+            },
+        )
+
+    usage: dict[str, FunctionCacheUsage]
+
+    def __add__(
+        self,
+        other: Self,
+    ) -> Self:
+        # statistics are cumulative - keep the latest snapshot of each cache
+        return self.__class__(
+            usage={
+                **self.usage,
+                **other.usage,
+            },
+        )
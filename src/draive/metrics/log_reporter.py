@@ -37,7 +37,8 @@ def _report(
     report_log: str = f"@{report.label}({report.duration:.2f}s):"
     for metric_name, metric in report.metrics.items():
         metric_log: str = ""
-        for key, value in vars(metric).items():
+        for key in metric.__PARAMETERS__:
+            value: Any = getattr(metric, key)
             if value_log := _value_report(
                 value,
                 list_items_limit=list_items_limit,
@@ -72,7 +73,8 @@ def _state_report(
     item_character_limit: int | None,
 ) -> str | None:
     state_log: str = ""
-    for key, element in vars(value).items():
+    for key in value.__PARAMETERS__:
+        element: Any = getattr(value, key)
         element_log: str | None = _value_report(
             element,
             list_items_limit=list_items_limit,
@@ -1,11 +1,12 @@
 from draive.mistral.client import MistralClient
 from draive.mistral.config import MistralChatConfig, MistralEmbeddingConfig
-from draive.mistral.embedding import mistral_embed_text
+from draive.mistral.embedding import mistral_embed_text, mistral_embedding_identifier
 from draive.mistral.errors import MistralException
 from draive.mistral.lmm import mistral_lmm_invocation
 
 __all__ = [
     "mistral_embed_text",
+    "mistral_embedding_identifier",
     "mistral_lmm_invocation",
     "MistralChatConfig",
     "MistralClient",
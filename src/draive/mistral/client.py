@@ -1,11 +1,11 @@
 import json
 from asyncio import gather
 from collections.abc import AsyncIterable, Iterable
-from itertools import chain
 from typing import Any, Literal, Self, cast, final, overload
 
 from httpx import AsyncClient, Response
 
+from draive.embedding import embedding_batches
 from draive.mistral.config import MistralChatConfig, MistralEmbeddingConfig
 from draive.mistral.errors import MistralException
 from draive.mistral.models import (
@@ -99,19 +99,27 @@ class MistralClient(ScopeDependency):
         inputs: Iterable[str],
     ) -> list[list[float]]:
         inputs_list: list[str] = list(inputs)
-        return list(
-            chain(
-                *await gather(
-                    *[
-                        self._create_text_embedding(
-                            model=config.model,
-                            texts=list(inputs_list[index : index + config.batch_size]),
-                        )
-                        for index in range(0, len(inputs_list), config.batch_size)
-                    ]
+        batches: list[list[int]] = embedding_batches(
+            inputs_list,
+            batch_size=config.batch_size,
+            batch_tokens=config.batch_tokens if not_missing(config.batch_tokens) else None,
+        )
+        results: list[list[list[float]]] = await gather(
+            *[
+                self._create_text_embedding(
+                    model=config.model,
+                    texts=[inputs_list[index] for index in batch],
                 )
-            )
+                for batch in batches
+            ]
         )
+        # batches might be reordered, place results back in the inputs order
+        embeddings: list[list[float]] = [[] for _ in inputs_list]
+        for batch, batch_results in zip(batches, results, strict=True):
+            for index, embedding in zip(batch, batch_results, strict=True):
+                embeddings[index] = embedding
+
+        return embeddings
 
     async def _create_chat_completion(  # noqa: PLR0913
         self,
@@ -26,3 +26,4 @@ class MistralChatConfig(DataModel):
 class MistralEmbeddingConfig(DataModel):
     model: str = "mistral-embed"
     batch_size: int = 32
+    batch_tokens: int | Missing = MISSING
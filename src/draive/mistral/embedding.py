@@ -8,6 +8,7 @@ from draive.scope import ctx
 
 __all__ = [
     "mistral_embed_text",
+    "mistral_embedding_identifier",
 ]
 
 
@@ -33,3 +34,11 @@ async def mistral_embed_text(
                 strict=True,
             )
         ]
+
+
+def mistral_embedding_identifier(
+    **extra: Any,
+) -> str:
+    # identifies vectors produced by mistral_embed_text, used as embedding cache key prefix
+    config: MistralEmbeddingConfig = ctx.state(MistralEmbeddingConfig).updated(**extra)
+    return f"mistral|{config.model}"
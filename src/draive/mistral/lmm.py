@@ -21,6 +21,7 @@ from draive.types import (
     LMMToolRequest,
     LMMToolRequests,
     LMMToolResponse,
+    MultimodalContent,
 )
 
 __all__ = [
@@ -240,7 +241,9 @@ async def _chat_completion(
         ctx.record(ResultTrace.of(message))
         match message:
             case str(content):
-                return LMMCompletion.of(content)
+                return LMMCompletion.unchecked(
+                    content=MultimodalContent.unchecked(elements=(content,)),
+                )
 
             # API docs say that it can be only a string in response
             # however library model allows list as well
@@ -269,7 +272,7 @@ async def _chat_completion_stream(
     )
     match output:
         case LMMCompletion() as completion:
-            yield LMMCompletionChunk.of(completion.content)
+            yield LMMCompletionChunk.unchecked(content=completion.content)
 
         case other:
             yield other
@@ -4,17 +4,28 @@ from draive.openai.config import (
     OpenAIEmbeddingConfig,
     OpenAIImageGenerationConfig,
 )
-from draive.openai.embedding import openai_embed_text
+from draive.openai.embedding import openai_embed_text, openai_embedding_identifier
 from draive.openai.errors import OpenAIException
 from draive.openai.images import openai_generate_image
 from draive.openai.lmm import openai_lmm_invocation
-from draive.openai.tokenization import openai_tokenize_text
+from draive.openai.tokenization import (
+    openai_count_text_tokens,
+    openai_count_texts_tokens,
+    openai_tokenization,
+    openai_tokenize_text,
+    openai_tokenize_texts,
+)
 
 __all__ = [
     "openai_embed_text",
+    "openai_embedding_identifier",
     "openai_generate_image",
     "openai_lmm_invocation",
+    "openai_count_text_tokens",
+    "openai_count_texts_tokens",
+    "openai_tokenization",
     "openai_tokenize_text",
+    "openai_tokenize_texts",
     "OpenAIChatConfig",
     "OpenAIClient",
     "OpenAIEmbeddingConfig",
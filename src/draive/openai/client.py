@@ -1,9 +1,11 @@
 from asyncio import gather, sleep
+from base64 import b64decode
 from collections.abc import Iterable
-from itertools import chain
 from random import uniform
 from typing import Literal, Self, cast, final, overload
 
+import numpy as np
+from numpy.typing import NDArray
 from openai import AsyncAzureOpenAI, AsyncOpenAI, AsyncStream
 from openai import RateLimitError as OpenAIRateLimitError
 from openai._types import NOT_GIVEN, NotGiven
@@ -21,6 +23,7 @@ from openai.types.create_embedding_response import CreateEmbeddingResponse
 from openai.types.image import Image
 from openai.types.images_response import ImagesResponse
 
+from draive.embedding import embedding_batches
 from draive.openai.config import (
     OpenAIChatConfig,
     OpenAIEmbeddingConfig,
@@ -168,28 +171,34 @@ class OpenAIClient(ScopeDependency):
         self,
         config: OpenAIEmbeddingConfig,
         inputs: Iterable[str],
-    ) -> list[list[float]]:
+    ) -> list[NDArray[np.float32] | list[float]]:
         inputs_list: list[str] = list(inputs)
-        return list(
-            chain(
-                *await gather(
-                    *[
-                        self._create_text_embedding(
-                            texts=list(inputs_list[index : index + config.batch_size]),
-                            model=config.model,
-                            dimensions=config.dimensions
-                            if not_missing(config.dimensions)
-                            else NOT_GIVEN,
-                            encoding_format=cast(Literal["float", "base64"], config.encoding_format)
-                            if not_missing(config.encoding_format)
-                            else NOT_GIVEN,
-                            timeout=config.timeout if not_missing(config.timeout) else NOT_GIVEN,
-                        )
-                        for index in range(0, len(inputs_list), config.batch_size)
-                    ]
+        batches: list[list[int]] = embedding_batches(
+            inputs_list,
+            batch_size=config.batch_size,
+            batch_tokens=config.batch_tokens if not_missing(config.batch_tokens) else None,
+        )
+        results: list[list[NDArray[np.float32] | list[float]]] = await gather(
+            *[
+                self._create_text_embedding(
+                    texts=[inputs_list[index] for index in batch],
+                    model=config.model,
+                    dimensions=config.dimensions if not_missing(config.dimensions) else NOT_GIVEN,
+                    encoding_format=cast(Literal["float", "base64"], config.encoding_format)
+                    if not_missing(config.encoding_format)
+                    else NOT_GIVEN,
+                    timeout=config.timeout if not_missing(config.timeout) else NOT_GIVEN,
                 )
-            )
+                for batch in batches
+            ]
         )
+        # batches might be reordered, place results back in the inputs order
+        embeddings: list[NDArray[np.float32] | list[float]] = [[] for _ in inputs_list]
+        for batch, batch_results in zip(batches, results, strict=True):
+            for index, embedding in zip(batch, batch_results, strict=True):
+                embeddings[index] = embedding
+
+        return embeddings
 
     async def _create_text_embedding(  # noqa: PLR0913
         self,
@@ -198,7 +207,7 @@ class OpenAIClient(ScopeDependency):
         dimensions: int | NotGiven,
         encoding_format: Literal["float", "base64"] | NotGiven,
         timeout: float | NotGiven,
-    ) -> list[list[float]]:
+    ) -> list[NDArray[np.float32] | list[float]]:
         attempts: int = 64  # we do want retry on rate limit but we have to fail eventually
         while True:
             try:
@@ -209,6 +218,17 @@ class OpenAIClient(ScopeDependency):
                     encoding_format=encoding_format,
                     timeout=timeout,
                 )
+                if encoding_format == "base64":
+                    # client leaves requested base64 payload as it is,
+                    # decode it directly to float32 arrays without python floats
+                    return [
+                        np.frombuffer(
+                            b64decode(cast(str, element.embedding)),
+                            dtype="<f4",
+                        )
+                        for element in response.data
+                    ]
+
                 return [element.embedding for element in response.data]
 
             except OpenAIRateLimitError as exc:  # always retry on rate limit after delay
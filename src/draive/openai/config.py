@@ -31,6 +31,7 @@ class OpenAIEmbeddingConfig(DataModel):
     model: str = "text-embedding-3-small"
     dimensions: int | Missing = MISSING
     batch_size: int = 32
+    batch_tokens: int | Missing = MISSING
     encoding_format: Literal["float", "base64"] | Missing = MISSING
     timeout: float | Missing = MISSING
 
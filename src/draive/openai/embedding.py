@@ -1,6 +1,9 @@
 from collections.abc import Iterable
 from typing import Any
 
+import numpy as np
+from numpy.typing import NDArray
+
 from draive.embedding import Embedded
 from draive.openai.client import OpenAIClient
 from draive.openai.config import OpenAIEmbeddingConfig
@@ -8,6 +11,7 @@ from draive.scope import ctx
 
 __all__ = [
     "openai_embed_text",
+    "openai_embedding_identifier",
 ]
 
 
@@ -17,7 +21,9 @@ async def openai_embed_text(
 ) -> list[Embedded[str]]:
     config: OpenAIEmbeddingConfig = ctx.state(OpenAIEmbeddingConfig).updated(**extra)
     with ctx.nested("text_embedding", metrics=[config]):
-        results: list[list[float]] = await ctx.dependency(OpenAIClient).embedding(
+        results: list[NDArray[np.float32] | list[float]] = await ctx.dependency(
+            OpenAIClient
+        ).embedding(
             config=config,
             inputs=[str(value) for value in values],
         )
@@ -33,3 +39,11 @@ async def openai_embed_text(
                 strict=True,
             )
         ]
+
+
+def openai_embedding_identifier(
+    **extra: Any,
+) -> str:
+    # identifies vectors produced by openai_embed_text, used as embedding cache key prefix
+    config: OpenAIEmbeddingConfig = ctx.state(OpenAIEmbeddingConfig).updated(**extra)
+    return f"openai|{config.model}|{config.dimensions}"
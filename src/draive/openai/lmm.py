@@ -37,7 +37,7 @@ from draive.types import (
 )
 from draive.types.audio import AudioBase64Content, AudioDataContent, AudioURLContent
 from draive.types.images import ImageDataContent
-from draive.types.multimodal import MultimodalContentElement
+from draive.types.multimodal import MultimodalContent, MultimodalContentElement
 from draive.types.video import VideoBase64Content, VideoDataContent, VideoURLContent
 from draive.utils import not_missing
 
@@ -323,7 +323,9 @@ async def _chat_completion(
             if content := completion_message.content:
                 ctx.record(ResultTrace.of(content))
                 # TODO: OpenAI models generating media?
-                return LMMCompletion.of(content)
+                return LMMCompletion.unchecked(
+                    content=MultimodalContent.unchecked(elements=(content,)),
+                )
 
             else:
                 raise OpenAIException("Invalid OpenAI completion", completion)
@@ -383,7 +385,9 @@ async def _chat_completion_stream(  # noqa: C901, PLR0912, PLR0915
                     continue  # skip empty parts
                 accumulated_completion += part_text
                 # TODO: OpenAI models generating media?
-                yield LMMCompletionChunk.of(part_text)
+                yield LMMCompletionChunk.unchecked(
+                    content=MultimodalContent.unchecked(elements=(part_text,)),
+                )
 
             elif tool_calls := element.delta.tool_calls:
                 # tool calls come in parts, we have to merge them manually
@@ -1,20 +1,96 @@
+from collections.abc import Sequence
+
 from tiktoken import Encoding, encoding_for_model
 
 from draive.openai.config import OpenAIChatConfig
 from draive.scope import ctx
+from draive.tokenization import Tokenization
 from draive.utils import Missing, cache, not_missing
 
 __all__ = [
+    "openai_count_text_tokens",
+    "openai_count_texts_tokens",
+    "openai_tokenization",
     "openai_tokenize_text",
+    "openai_tokenize_texts",
 ]
 
 
 def openai_tokenize_text(
     text: str,
 ) -> list[int]:
+    return _current_encoding().encode(text=text)
+
+
+def openai_tokenize_texts(
+    texts: Sequence[str],
+) -> list[list[int]]:
+    # tiktoken encodes batches using its own thread pool
+    return _current_encoding().encode_batch(text=list(texts))
+
+
+def openai_count_text_tokens(
+    text: str,
+) -> int:
+    return len(_current_encoding().encode(text=text))
+
+
+def openai_count_texts_tokens(
+    texts: Sequence[str],
+) -> list[int]:
+    return [len(tokens) for tokens in _current_encoding().encode_batch(text=list(texts))]
+
+
+def openai_tokenization(
+    model_name: str | None = None,
+) -> Tokenization:
+    """\
+    Prepare Tokenization state using tiktoken encoding of the given model. \
+    Encoding is resolved once instead of reading OpenAIChatConfig on each call. \
+    When model_name is not provided all functions use model from the current OpenAIChatConfig.
+    """
+    if model_name is None:
+        return Tokenization(
+            tokenize_text=openai_tokenize_text,
+            tokenize_texts=openai_tokenize_texts,
+            count_text_tokens=openai_count_text_tokens,
+            count_texts_tokens=openai_count_texts_tokens,
+        )
+
+    encoding: Encoding = _encoding(model_name=model_name)
+
+    def tokenize_text(
+        text: str,
+    ) -> list[int]:
+        return encoding.encode(text=text)
+
+    def tokenize_texts(
+        texts: Sequence[str],
+    ) -> list[list[int]]:
+        return encoding.encode_batch(text=list(texts))
+
+    def count_text_tokens(
+        text: str,
+    ) -> int:
+        return len(encoding.encode(text=text))
+
+    def count_texts_tokens(
+        texts: Sequence[str],
+    ) -> list[int]:
+        return [len(tokens) for tokens in encoding.encode_batch(text=list(texts))]
+
+    return Tokenization(
+        tokenize_text=tokenize_text,
+        tokenize_texts=tokenize_texts,
+        count_text_tokens=count_text_tokens,
+        count_texts_tokens=count_texts_tokens,
+    )
+
+
+def _current_encoding() -> Encoding:
     model_name: str | Missing = ctx.state(OpenAIChatConfig).model
     if not_missing(model_name):
-        return _encoding(model_name=model_name).encode(text=text)
+        return _encoding(model_name=model_name)
 
     else:
         raise ValueError("Missing model name in OpenAIChatConfig")
@@ -155,6 +155,8 @@ class DataParameter:
         self.alias: str | None = alias
         self.description: str | None = description
         self.annotation: Any = annotation
+        self.default: Any | Missing = default
+        self.default_factory: ParameterDefaultFactory[Any] | Missing = default_factory
         self.default_value: Callable[[], Any | Missing]
         if not_missing(default_factory):
             self.default_value = default_factory
@@ -269,6 +271,129 @@ class DataParameter:
                 )
 
 
+def _is_class_var(
+    annotation: Any,
+    /,
+) -> bool:
+    if isinstance(annotation, str):  # not resolved annotations i.e. using future annotations
+        return annotation.startswith(("ClassVar", "typing.ClassVar"))
+
+    else:
+        return (get_origin(annotation) or annotation) is ClassVar
+
+
+def _prepare_slots(
+    bases: tuple[type, ...],
+    classdict: dict[str, Any],
+    /,
+    *,
+    slots: bool,
+) -> dict[str, Any]:
+    # declare slots for parameters before creating the type to avoid instance dicts
+    # returns default values of all parameters including inherited ones
+    inherited: set[str] = set()
+    # defaults are collected from bases in reverse to keep the MRO precedence
+    defaults: dict[str, Any] = {}
+    for base in reversed(bases):
+        inherited.update(getattr(base, "__PARAMETERS__", ()))
+        defaults.update(getattr(base, "__PARAMETERS_DEFAULTS__", {}))
+
+    parameters: list[str] = []
+    for key, annotation in classdict.get("__annotations__", {}).items():
+        if _is_class_var(annotation) or key.startswith("_"):
+            continue
+
+        if key not in inherited:
+            parameters.append(key)
+
+    overridden: list[str] = [key for key in (*parameters, *inherited) if key in classdict]
+    for key in overridden:
+        defaults[key] = classdict[key]
+
+    if not bases:  # root type allows weak references to all instances
+        classdict["__slots__"] = (*classdict.get("__slots__", ()), "__weakref__")
+
+    # slotted parameters can't be combined with other slotted parameters
+    # using multiple inheritance, types without own parameters are slotted
+    # unless they override defaults which remain available as class attributes
+    elif slots or not (parameters or overridden):
+        classdict["__slots__"] = (*classdict.get("__slots__", ()), *parameters)
+        # class attributes would conflict with slots, keep defaults aside
+        for key in overridden:
+            del classdict[key]
+
+    return defaults
+
+
+def _compiled_init(
+    data_type: type[Any],
+    /,
+    parameters: dict[str, DataParameter],
+) -> Callable[..., None]:
+    # prepare __init__ specialized for given parameters, equivalent of ParametrizedData.__init__
+    # validators and defaults are bound directly, validation contexts are prepared upfront
+    namespace: dict[str, Any] = {
+        "MISSING": MISSING,
+        "ParameterValidationError": ParameterValidationError,
+        "_setattr": object.__setattr__,
+        "_data_type": data_type,
+        "_generic_init": ParametrizedData.__init__,
+    }
+    lines: list[str] = [
+        "def __init__(self, *args, **kwargs):",
+        # subclasses with custom initializers can call it through super().__init__
+        "    if self.__class__ is not _data_type:",
+        "        return _generic_init(self, *args, **kwargs)",
+        "    assert not args, 'Positional unkeyed arguments are not supported'",
+    ]
+    for index, parameter in enumerate(parameters.values()):
+        validator: str = f"_validator_{index}"
+        context: str = f"_context_{index}"
+        namespace[validator] = parameter.validator
+        namespace[context] = (data_type.__qualname__, f".{parameter.name}")
+        lines.append(f"    value = kwargs.get({parameter.name!r}, MISSING)")
+        if parameter.alias:
+            lines.append("    if value is MISSING:")
+            lines.append(f"        value = kwargs.get({parameter.alias!r}, MISSING)")
+
+        if not_missing(parameter.default_factory):
+            namespace[f"_default_{index}"] = parameter.default_factory
+            lines.append("    if value is MISSING:")
+            lines.append(f"        value = _default_{index}()")
+            lines.append(f"    _setattr(self, {parameter.name!r}, {validator}(value, {context}))")
+
+        elif not_missing(parameter.default):
+            namespace[f"_default_{index}"] = parameter.default
+            lines.append("    if value is MISSING:")
+            lines.append(f"        value = _default_{index}")
+            lines.append(f"    _setattr(self, {parameter.name!r}, {validator}(value, {context}))")
+
+        elif parameter.allows_missing:
+            lines.append(
+                f"    _setattr(self, {parameter.name!r},"
+                f" MISSING if value is MISSING else {validator}(value, {context}))"
+            )
+
+        else:
+            lines.append("    if value is MISSING:")
+            lines.append(f"        raise ParameterValidationError.missing(context={context})")
+            lines.append(f"    _setattr(self, {parameter.name!r}, {validator}(value, {context}))")
+
+    lines.append("__init__.__parametrized_data_init__ = True")
+    exec(  # nosec: B102
+        compile(
+            "\n".join(lines),
+            f"<{data_type.__module__}.{data_type.__qualname__}.__init__>",
+            "exec",
+        ),
+        namespace,
+    )
+    init: Callable[..., None] = namespace["__init__"]
+    init.__module__ = data_type.__module__
+    init.__qualname__ = f"{data_type.__qualname__}.__init__"
+    return init
+
+
 @dataclass_transform(
     kw_only_default=True,
     frozen_default=True,
@@ -277,6 +402,7 @@ class DataParameter:
 class ParametrizedDataMeta(type):
     _: Any
     __PARAMETERS__: dict[str, DataParameter]
+    __PARAMETERS_DEFAULTS__: dict[str, Any]
     __PARAMETERS_SPECIFICATION__: ParametersSpecification | Missing
 
     def __new__(
@@ -284,8 +410,15 @@ class ParametrizedDataMeta(type):
         name: str,
         bases: tuple[type, ...],
         classdict: dict[str, Any],
+        *,
+        slots: bool = False,
         **kwargs: Any,
     ) -> Any:
+        defaults: dict[str, Any] = _prepare_slots(
+            bases,
+            classdict,
+            slots=slots,
+        )
         data_type = type.__new__(
             cls,
             name,
@@ -306,13 +439,13 @@ class ParametrizedDataMeta(type):
             localns,
         ).items():
             # do not include ClassVars and private or dunder items
-            if ((get_origin(annotation) or annotation) is ClassVar) or key.startswith("_"):
+            if _is_class_var(annotation) or key.startswith("_"):
                 continue
 
             parameter: DataParameter = DataParameter.of(
                 annotation,
                 name=key,
-                default=getattr(data_type, key, MISSING),
+                default=defaults.get(key, MISSING),
                 globalns=globalns,
                 localns=localns,
                 recursion_guard=recursion_guard,
@@ -334,6 +467,7 @@ class ParametrizedDataMeta(type):
                 continue  # skip if we already have missing specification
 
         data_type.__PARAMETERS__ = parameters  # pyright: ignore[reportConstantRedefinition]
+        data_type.__PARAMETERS_DEFAULTS__ = defaults  # pyright: ignore[reportConstantRedefinition]
         if not_missing(properties_specification):
             data_type.__PARAMETERS_SPECIFICATION__ = {  # pyright: ignore[reportConstantRedefinition]
                 "type": "object",
@@ -344,8 +478,14 @@ class ParametrizedDataMeta(type):
         else:
             data_type.__PARAMETERS_SPECIFICATION__ = MISSING  # pyright: ignore[reportConstantRedefinition]
 
-        data_type.__slots__ = frozenset(parameters.keys())  # pyright: ignore[reportAttributeAccessIssue]
-        data_type.__match_args__ = data_type.__slots__  # pyright: ignore[reportAttributeAccessIssue]
+        # replace only generic or generated initializers, keep custom ones
+        if "__init__" not in classdict and _has_parametrized_init(data_type):
+            data_type.__init__ = _compiled_init(  # pyright: ignore[reportAttributeAccessIssue]
+                data_type,
+                parameters=parameters,
+            )
+
+        data_type.__match_args__ = tuple(parameters.keys())  # pyright: ignore[reportAttributeAccessIssue]
         data_type._ = ParameterPath(data_type, data_type)  # pyright: ignore[reportUnknownMemberType, reportAttributeAccessIssue]
         return data_type
 
@@ -353,6 +493,7 @@ class ParametrizedDataMeta(type):
 class ParametrizedData(metaclass=ParametrizedDataMeta):
     _: ClassVar[Self]
     __PARAMETERS__: ClassVar[dict[str, DataParameter]]
+    __PARAMETERS_DEFAULTS__: ClassVar[dict[str, Any]]
     __PARAMETERS_SPECIFICATION__: ClassVar[ParametersSpecification | Missing]
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:  # pyright: ignore[reportUnknownParameterType, reportMissingParameterType]
@@ -376,6 +517,28 @@ class ParametrizedData(metaclass=ParametrizedDataMeta):
                 ),
             )
 
+    @classmethod
+    def unchecked(
+        cls,
+        /,
+        **parameters: Any,
+    ) -> Self:
+        """\
+        Create an instance from trusted values skipping validation. \
+        Parameters have to use names instead of aliases, omitted parameters \
+        use default values as they are or MISSING. Use only with values which are already \
+        valid i.e. parts of other validated instances.
+        """
+        instance: Self = object.__new__(cls)
+        for name, parameter in cls.__PARAMETERS__.items():
+            object.__setattr__(
+                instance,
+                name,
+                parameters[name] if name in parameters else parameter.default_value(),
+            )
+
+        return instance
+
     @classmethod
     def path[Parameter](
         cls,
@@ -432,18 +595,67 @@ class ParametrizedData(metaclass=ParametrizedDataMeta):
         )
 
     # TODO: find a way to generate signature similar to dataclass __init__
-    # or try using ParameterPath if found a way to generate setters
     def updated(
         self,
         /,
         **parameters: Any,
     ) -> Self:
-        if parameters:
-            return self.__class__(**{**vars(self), **parameters})
-
-        else:
+        """\
+        Create a copy with given parameters replaced. Only the replaced parameters \
+        are validated, remaining values are shared with the current instance. \
+        Parameters can be provided using names or aliases.
+        """
+        if not parameters:
             return self
 
+        data_type: type[Self] = self.__class__
+        if not _has_parametrized_init(data_type):
+            # custom initializers may derive values, use full initialization for those
+            return data_type(
+                **{
+                    **{name: getattr(self, name) for name in data_type.__PARAMETERS__},
+                    **parameters,
+                }
+            )
+
+        updated: Self = object.__new__(data_type)
+        for name, parameter in data_type.__PARAMETERS__.items():
+            if name in parameters:
+                value = parameter.validated(
+                    parameters[name],
+                    context=(data_type.__qualname__,),
+                )
+
+            elif parameter.alias and parameter.alias in parameters:
+                value = parameter.validated(
+                    parameters[parameter.alias],
+                    context=(data_type.__qualname__,),
+                )
+
+            else:
+                value = getattr(self, name)
+
+            object.__setattr__(updated, name, value)
+
+        return updated
+
+    def updating[Parameter](
+        self,
+        path: ParameterPath[Self, Parameter] | Parameter,
+        /,
+        value: Parameter,
+    ) -> Self:
+        """\
+        Create a copy with value pointed by the path replaced i.e. \
+        `model.updating(Model._.nested.value, 42)`. Only the instances on the path \
+        are copied, all other values are shared with the current instance.
+        """
+        assert isinstance(  # nosec: B101
+            path, ParameterPath
+        ), "Prepare parameter path by using Self._.path.to.property"
+
+        return cast(ParameterPath[Self, Parameter], path).updating(self, value)
+
     def __str__(self) -> str:
         return str(self.as_dict())
 
@@ -459,6 +671,16 @@ class ParametrizedData(metaclass=ParametrizedDataMeta):
             for key in self.__class__.__PARAMETERS__.keys()
         )
 
+    def __getstate__(self) -> dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__class__.__PARAMETERS__}
+
+    def __setstate__(
+        self,
+        state: dict[str, Any],
+    ) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
     def __setattr__(
         self,
         __name: str,
@@ -473,6 +695,19 @@ class ParametrizedData(metaclass=ParametrizedDataMeta):
         raise RuntimeError(f"{self.__class__.__qualname__} is frozen and can't be modified")
 
 
+# mark the default validator, validation of unions relies on its behavior
+ParametrizedData.validator.__func__.__parametrized_data_validator__ = True  # pyright: ignore[reportFunctionMemberAccess]
+
+
+def _has_parametrized_init(
+    data_type: type[Any],
+    /,
+) -> bool:
+    return data_type.__init__ is ParametrizedData.__init__ or getattr(
+        data_type.__init__, "__parametrized_data_init__", False
+    )
+
+
 # based on python dataclass asdict but simplified
 def _data_dict(  # noqa: PLR0911
     data: Any,
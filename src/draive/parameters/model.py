@@ -6,7 +6,7 @@ from uuid import UUID
 
 from draive.parameters import ParametrizedData
 from draive.parameters.schema import json_schema, simplified_schema
-from draive.utils import Missing, not_missing
+from draive.utils import CacheSerializer, Missing, not_missing
 
 __all__ = [
     "DataModel",
@@ -90,8 +90,38 @@ class DataModel(ParametrizedData):
                 f"Failed to encode {self.__class__.__name__} to json:\n{asdict(self)}"
             ) from exc
 
+    @classmethod
+    def cache_serializer(cls) -> CacheSerializer[Self]:
+        """\
+        Serializer of model instances for cache backends using json representation.
+        """
+        return _ModelCacheSerializer(cls)
+
     def __str__(self) -> str:
         return self.as_json(
             aliased=True,
             indent=2,
         )
+
+
+class _ModelCacheSerializer[Model: DataModel](CacheSerializer[Model]):
+    def __init__(
+        self,
+        model: type[Model],
+        /,
+    ) -> None:
+        self._model: type[Model] = model
+
+    def encode(
+        self,
+        value: Model,
+        /,
+    ) -> bytes:
+        return value.as_json().encode()
+
+    def decode(
+        self,
+        data: bytes,
+        /,
+    ) -> Model:
+        return self._model.from_json(data)
@@ -3,7 +3,7 @@ import types
 import typing
 from abc import ABC, abstractmethod
 from collections.abc import Callable
-from typing import Any, final, get_args, get_origin, overload
+from typing import Any, cast, final, get_args, get_origin, overload
 
 from draive.utils import freeze
 
@@ -26,6 +26,14 @@ class ParameterPathComponent(ABC):
         /,
     ) -> Any: ...
 
+    @abstractmethod
+    def updating(
+        self,
+        subject: Any,
+        /,
+        value: Any,
+    ) -> Any: ...
+
 
 @final
 class ParameterPathAttributeComponent(ParameterPathComponent):
@@ -77,6 +85,15 @@ class ParameterPathAttributeComponent(ParameterPathComponent):
     ) -> Any:
         return self._resolve(subject)
 
+    def updating(
+        self,
+        subject: Any,
+        /,
+        value: Any,
+    ) -> Any:
+        # only ParametrizedData types can be updated, it validates just the replaced value
+        return subject.updated(**{self._attribute: value})
+
 
 @final
 class ParameterPathItemComponent(ParameterPathComponent):
@@ -126,6 +143,31 @@ class ParameterPathItemComponent(ParameterPathComponent):
     ) -> Any:
         return self._resolve(subject)
 
+    def updating(
+        self,
+        subject: Any,
+        /,
+        value: Any,
+    ) -> Any:
+        match subject:
+            case tuple():
+                updated_tuple: list[Any] = list(subject)  # pyright: ignore[reportUnknownArgumentType]
+                updated_tuple[self._item] = value
+                return tuple(updated_tuple)
+
+            case list():
+                updated_list: list[Any] = list(subject)  # pyright: ignore[reportUnknownArgumentType]
+                updated_list[self._item] = value
+                return updated_list
+
+            case dict():
+                updated_dict: dict[Any, Any] = dict(subject)  # pyright: ignore[reportUnknownArgumentType]
+                updated_dict[self._item] = value
+                return updated_dict
+
+            case other:
+                raise TypeError("Unsupported item update", type(other))  # pyright: ignore[reportUnknownArgumentType]
+
 
 @final
 class ParameterPath[Root, Parameter]:
@@ -282,3 +324,33 @@ class ParameterPath[Root, Parameter]:
             f"'{type(resolved)}' instead of '{self._parameter}'"
         )
         return resolved
+
+    def updating(
+        self,
+        root: Root,
+        /,
+        value: Parameter,
+    ) -> Root:
+        assert isinstance(root, get_origin(self._root) or self._root), (  # nosec: B101
+            f"ParameterPath '{self.__repr__()}' used on unexpected root of "
+            f"'{type(root)}' instead of '{self._root}'"
+        )
+
+        if not self._components:
+            return cast(Root, value)
+
+        # resolve all values on the path, then rebuild them from the end
+        # sharing everything which is not on the path
+        subjects: list[Any] = [root]
+        for component in self._components[:-1]:
+            subjects.append(component.resolve(subjects[-1]))
+
+        updated: Any = value
+        for component, subject in zip(
+            reversed(self._components),
+            reversed(subjects),
+            strict=True,
+        ):
+            updated = component.updating(subject, updated)
+
+        return updated
@@ -301,12 +301,66 @@ def _prepare_union_validator(
         )
         for alternative in elements_annotation
     ]
+    alternatives_origins: list[Any] = [
+        resolve_annotation(
+            alternative,
+            globalns=globalns,
+            localns=localns,
+        )
+        for alternative in elements_annotation
+    ]
+    alternatives_types: list[tuple[type[Any], ...] | None] = [
+        _accepted_types(origin, args) for origin, args in alternatives_origins
+    ]
+    # validators to try for each type of value, alternatives which can't accept
+    # given type are skipped, mappings are matched against keys of parametrized types
+    dispatch: dict[
+        type[Any],
+        tuple[tuple[ParameterValidator[Any], Callable[[Any], bool] | None], ...],
+    ] = {}
+
+    def dispatched(
+        value_type: type[Any],
+        /,
+    ) -> tuple[tuple[ParameterValidator[Any], Callable[[Any], bool] | None], ...]:
+        # prepared lazily - parametrized types can be incomplete when preparing validators
+        validators: tuple[tuple[ParameterValidator[Any], Callable[[Any], bool] | None], ...] = (
+            tuple(
+                (
+                    validator,
+                    _prepare_mapping_matcher(origin)
+                    if issubclass(value_type, collections_abc.Mapping)
+                    and hasattr(origin, "__PARAMETERS__")
+                    else None,
+                )
+                for validator, (origin, _), accepted in zip(
+                    alternatives_validators,
+                    alternatives_origins,
+                    alternatives_types,
+                    strict=True,
+                )
+                if accepted is None or issubclass(value_type, accepted)
+            )
+        )
+        dispatch[value_type] = validators
+        return validators
 
     def union_validator(
         value: Any,
         context: ParameterValidationContext,
     ) -> Any:
-        for validator in alternatives_validators:
+        value_type: type[Any] = type(value)  # pyright: ignore[reportUnknownVariableType]
+        validators: tuple[tuple[ParameterValidator[Any], Callable[[Any], bool] | None], ...]
+        if (dispatched_validators := dispatch.get(value_type)) is not None:
+            validators = dispatched_validators
+
+        else:
+            validators = dispatched(value_type)
+
+        for validator, matches in validators:
+            if matches is not None and not matches(value):
+                continue  # skip types which would reject the value anyway
+
             try:
                 return validator(value, context)
 
@@ -322,6 +376,110 @@ def _prepare_union_validator(
     return union_validator
 
 
+def _accepted_types(  # noqa: PLR0911
+    origin: Any,
+    args: tuple[Any, ...],
+    /,
+) -> tuple[type[Any], ...] | None:
+    # types of values which can be accepted by validator of given annotation,
+    # None when it is not known and any value has to be tried
+    match origin:
+        case builtins.str:
+            return (str,)
+
+        case builtins.int:
+            return (int,)
+
+        case builtins.float:
+            return (float, int)
+
+        case builtins.bool:
+            return (int, str)
+
+        case types.NoneType:
+            return (types.NoneType,)
+
+        case draive_missing.Missing:
+            return (draive_missing.Missing, types.NoneType)
+
+        case typing.Literal if all(isinstance(option, str) for option in args):
+            return (str,)
+
+        case typing.Literal if all(isinstance(option, int) for option in args):
+            return (int,)
+
+        case parametrized if hasattr(parametrized, "__PARAMETERS__") and getattr(
+            parametrized.validator, "__parametrized_data_validator__", False
+        ):
+            return (parametrized, collections_abc.Mapping)
+
+        case _:  # including parametrized types with custom validators
+            return None
+
+
+def _prepare_mapping_matcher(
+    parametrized: Any,
+    /,
+) -> Callable[[Any], bool] | None:
+    if not getattr(parametrized.__init__, "__parametrized_data_init__", False) or not getattr(
+        parametrized.validator, "__parametrized_data_validator__", False
+    ):
+        return None  # custom initializers and validators can accept anything
+
+    required: list[tuple[str, str | None]] = []
+    literals: list[tuple[str, str | None, tuple[Any, ...], Any]] = []
+    for parameter in parametrized.__PARAMETERS__.values():
+        required_parameter: bool = not (parameter.has_default or parameter.allows_missing)
+        if typing.get_origin(parameter.annotation) is typing.Literal and (
+            # values provided by default factories can't be verified upfront
+            required_parameter or draive_missing.not_missing(parameter.default)
+        ):
+            literals.append(
+                (
+                    parameter.name,
+                    parameter.alias,
+                    typing.get_args(parameter.annotation),
+                    parameter.default,  # MISSING for required parameters
+                )
+            )
+
+        elif required_parameter:
+            required.append((parameter.name, parameter.alias))
+
+    if not required and not literals:
+        return None
+
+    def matches(
+        value: Any,
+    ) -> bool:
+        # discriminate using literal values and required keys
+        return all(
+            _mapping_value(value, name, alias=alias, default=default) in options
+            for name, alias, options, default in literals
+        ) and all(name in value or (alias and alias in value) for name, alias in required)
+
+    return matches
+
+
+def _mapping_value(
+    mapping: Any,
+    name: str,
+    /,
+    alias: str | None,
+    default: Any,
+) -> Any:
+    # resolve value the same way as initializers of parametrized types
+    value: Any = mapping.get(name, draive_missing.MISSING)
+    if value is draive_missing.MISSING and alias:
+        value = mapping.get(alias, draive_missing.MISSING)
+
+    if value is draive_missing.MISSING:
+        return default
+
+    else:
+        return value
+
+
 def _prepare_str_enum_validator(
     values: Sequence[str],
     /,
@@ -1,9 +1,20 @@
+from draive.similarity.batch import batch_similarity_search, similarity_scores
+from draive.similarity.index import VectorIndex
+from draive.similarity.ivf import IVFVectorIndex
 from draive.similarity.mmr import mmr_similarity_search
+from draive.similarity.quantized import QuantizedVectorIndex
 from draive.similarity.score import similarity_score
 from draive.similarity.search import similarity_search
+from draive.similarity.store import VectorStore
 
 __all__ = [
+    "batch_similarity_search",
+    "IVFVectorIndex",
     "mmr_similarity_search",
+    "QuantizedVectorIndex",
     "similarity_search",
     "similarity_score",
+    "similarity_scores",
+    "VectorIndex",
+    "VectorStore",
 ]
@@ -0,0 +1,91 @@
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from draive.similarity.index import VectorIndex
+from draive.similarity.normalization import normalized
+
+__all__ = [
+    "batch_similarity_search",
+    "similarity_scores",
+]
+
+# limit of scores matrix elements computed at once (64MiB of float32)
+_SCORES_CHUNK_ELEMENTS: int = 1 << 24
+
+
+def similarity_scores(
+    query_vectors: NDArray[Any] | list[NDArray[Any]] | list[list[float]],
+    values_vectors: VectorIndex[Any] | NDArray[Any] | list[NDArray[Any]] | list[list[float]],
+) -> NDArray[Any]:
+    queries, values = _prepared(query_vectors, values_vectors)
+    # (q, d) @ (d, n) -> (q, n) cosine similarity matrix
+    return queries @ values.T
+
+
+def batch_similarity_search(
+    query_vectors: NDArray[Any] | list[NDArray[Any]] | list[list[float]],
+    values_vectors: VectorIndex[Any] | NDArray[Any] | list[NDArray[Any]] | list[list[float]],
+    limit: int,
+) -> tuple[NDArray[np.intp], NDArray[Any]]:
+    assert limit > 0  # nosec: B101
+    queries, values = _prepared(query_vectors, values_vectors)
+    selected_count: int = min(limit, values.shape[0])
+    indices: NDArray[np.intp] = np.empty((queries.shape[0], selected_count), dtype=np.intp)
+    scores: NDArray[Any] = np.empty(
+        (queries.shape[0], selected_count),
+        dtype=np.result_type(queries.dtype, values.dtype),
+    )
+    if selected_count == 0:
+        return (indices, scores)
+
+    # split queries to keep the scores matrix memory bounded
+    chunk_size: int = max(_SCORES_CHUNK_ELEMENTS // values.shape[0], 1)
+    for start in range(0, queries.shape[0], chunk_size):
+        chunk_scores: NDArray[Any] = queries[start : start + chunk_size] @ values.T
+        selected: NDArray[np.intp]
+        if selected_count < values.shape[0]:
+            selected = np.argpartition(-chunk_scores, selected_count - 1, axis=1)[
+                :, :selected_count
+            ]
+
+        else:
+            selected = np.broadcast_to(
+                np.arange(selected_count, dtype=np.intp),
+                chunk_scores.shape,
+            )
+
+        selected_scores: NDArray[Any] = np.take_along_axis(chunk_scores, selected, axis=1)
+        order: NDArray[np.intp] = np.argsort(-selected_scores, axis=1, kind="stable")
+        indices[start : start + chunk_size] = np.take_along_axis(selected, order, axis=1)
+        scores[start : start + chunk_size] = np.take_along_axis(selected_scores, order, axis=1)
+
+    return (indices, scores)
+
+
+def _prepared(
+    query_vectors: NDArray[Any] | list[NDArray[Any]] | list[list[float]],
+    values_vectors: VectorIndex[Any] | NDArray[Any] | list[NDArray[Any]] | list[list[float]],
+) -> tuple[NDArray[Any], NDArray[Any]]:
+    queries: NDArray[Any]
+    values: NDArray[Any]
+    if isinstance(values_vectors, VectorIndex):
+        # index keeps vectors already normalized
+        values = values_vectors.vectors
+        queries = normalized(np.asarray(query_vectors, dtype=np.float32))
+
+    else:
+        values = normalized(np.asarray(values_vectors))
+        queries = normalized(np.asarray(query_vectors))
+
+    if queries.ndim == 1:
+        queries = np.expand_dims(queries, axis=0)
+
+    if values.shape[0] == 0:
+        values = values.reshape(0, queries.shape[1])
+
+    if queries.shape[1] != values.shape[1]:
+        raise ValueError("Number of columns has to be the same for both arguments.")
+
+    return (queries, values)
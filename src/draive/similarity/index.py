@@ -0,0 +1,235 @@
+from collections.abc import Iterable, Sequence
+from typing import Any, Self
+from uuid import uuid4
+
+import numpy as np
+from numpy.typing import NDArray
+
+from draive.embedding import Embedded
+from draive.similarity.normalization import normalized
+from draive.similarity.selection import top_indices
+
+__all__ = [
+    "VectorIndex",
+]
+
+
+class VectorIndex[Value]:
+    """\
+    In memory vector index keeping L2 normalized float32 vectors in a single matrix. \
+    Vectors are normalized once when added so each search is a single matrix-vector product. \
+    Storage grows geometrically and removed entries are replaced by the last one, \
+    which makes both add and remove amortized O(1) per element. \
+    Positions of entries change on removal, use identifiers to refer to entries. \
+    This index is not thread safe.
+
+    Parameters
+    ----------
+    dimensions: int | None
+        number of vector dimensions, resolved from the first added vector when not provided
+    capacity: int
+        number of initially preallocated entries, default is 64
+    """
+
+    @classmethod
+    def of(
+        cls,
+        elements: Iterable[Embedded[Value]],
+        /,
+        identifiers: Iterable[str] | None = None,
+    ) -> Self:
+        embedded: list[Embedded[Value]] = list(elements)
+        index: Self = cls(capacity=max(len(embedded), 1))
+        index.add(
+            embedded,
+            identifiers=identifiers,
+        )
+        return index
+
+    def __init__(
+        self,
+        dimensions: int | None = None,
+        capacity: int = 64,
+    ) -> None:
+        assert capacity > 0  # nosec: B101
+        self._dimensions: int | None = dimensions
+        self._capacity: int = capacity
+        self._vectors: NDArray[np.float32] = np.empty(
+            (capacity, dimensions or 0),
+            dtype=np.float32,
+        )
+        self._count: int = 0
+        self._identifiers: list[str] = []
+        self._values: list[Value] = []
+        self._positions: dict[str, int] = {}
+
+    @property
+    def dimensions(self) -> int | None:
+        return self._dimensions
+
+    @property
+    def vectors(self) -> NDArray[np.float32]:
+        # view of normalized vectors, valid until the next index modification
+        return self._vectors[: self._count]
+
+    @property
+    def values(self) -> Sequence[Value]:
+        return self._values
+
+    @property
+    def identifiers(self) -> Sequence[str]:
+        return self._identifiers
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(
+        self,
+        identifier: str,
+    ) -> bool:
+        return identifier in self._positions
+
+    def value(
+        self,
+        identifier: str,
+        /,
+    ) -> Value:
+        return self._values[self._positions[identifier]]
+
+    def add(
+        self,
+        elements: Iterable[Embedded[Value]],
+        /,
+        identifiers: Iterable[str] | None = None,
+    ) -> list[str]:
+        embedded: list[Embedded[Value]] = list(elements)
+        if not embedded:
+            return []
+
+        elements_identifiers: list[str]
+        if identifiers is None:
+            elements_identifiers = [uuid4().hex for _ in embedded]
+
+        else:
+            elements_identifiers = list(identifiers)
+            if len(elements_identifiers) != len(embedded):
+                raise ValueError("Number of identifiers has to match number of elements")
+
+        vectors: NDArray[np.float32] = normalized(
+            np.asarray(
+                [element.vector for element in embedded],
+                dtype=np.float32,
+            )
+        )
+        if vectors.ndim != 2:  # noqa: PLR2004
+            raise ValueError("Embedded vectors have to be one dimensional")
+
+        if self._dimensions is None:
+            self._dimensions = vectors.shape[1]
+            self._vectors = np.empty(
+                (self._capacity, self._dimensions),
+                dtype=np.float32,
+            )
+
+        elif vectors.shape[1] != self._dimensions:
+            raise ValueError(
+                f"Invalid vector dimensions - expected {self._dimensions}"
+                f" while received {vectors.shape[1]}"
+            )
+
+        self._reserve(self._count + len(embedded))
+        for identifier, element, vector in zip(
+            elements_identifiers,
+            embedded,
+            vectors,
+            strict=True,
+        ):
+            if (position := self._positions.get(identifier)) is not None:
+                # replace existing entry
+                self._vectors[position] = vector
+                self._values[position] = element.value
+
+            else:
+                position = self._count
+                self._vectors[position] = vector
+                self._values.append(element.value)
+                self._identifiers.append(identifier)
+                self._positions[identifier] = position
+                self._count += 1
+
+        return elements_identifiers
+
+    def remove(
+        self,
+        *identifiers: str,
+    ) -> None:
+        for identifier in identifiers:
+            position: int | None = self._positions.pop(identifier, None)
+            if position is None:
+                continue  # ignore missing
+
+            last: int = self._count - 1
+            if position != last:
+                # move the last entry in place of removed one
+                moved_identifier: str = self._identifiers[last]
+                self._vectors[position] = self._vectors[last]
+                self._values[position] = self._values[last]
+                self._identifiers[position] = moved_identifier
+                self._positions[moved_identifier] = position
+
+            del self._values[last]
+            del self._identifiers[last]
+            self._count = last
+
+    def scores(
+        self,
+        query_vector: NDArray[Any] | list[float],
+        /,
+    ) -> NDArray[np.float32]:
+        query: NDArray[np.float32] = normalized(
+            np.asarray(query_vector, dtype=np.float32).reshape(-1)
+        )
+        if self._dimensions is not None and query.shape[0] != self._dimensions:
+            raise ValueError(
+                f"Invalid query dimensions - expected {self._dimensions}"
+                f" while received {query.shape[0]}"
+            )
+
+        return self.vectors @ query
+
+    def search(
+        self,
+        query_vector: NDArray[Any] | list[float],
+        /,
+        limit: int,
+        score_threshold: float | None = None,
+    ) -> list[Value]:
+        assert limit > 0  # nosec: B101
+        if not self._count:
+            return []
+
+        return [
+            self._values[index]
+            for index in top_indices(
+                self.scores(query_vector),
+                limit=limit,
+                score_threshold=score_threshold,
+            )
+        ]
+
+    def _reserve(
+        self,
+        count: int,
+        /,
+    ) -> None:
+        if count <= self._capacity:
+            return  # enough space
+
+        capacity: int = max(count, self._capacity * 2)
+        vectors: NDArray[np.float32] = np.empty(
+            (capacity, self._vectors.shape[1]),
+            dtype=np.float32,
+        )
+        vectors[: self._count] = self._vectors[: self._count]
+        self._vectors = vectors
+        self._capacity = capacity
@@ -0,0 +1,264 @@
+import json
+from collections.abc import Callable, Iterable, Sequence
+from pathlib import Path
+from typing import Any, Self, cast
+
+import numpy as np
+from numpy.typing import NDArray
+
+from draive.embedding import Embedded
+from draive.similarity.normalization import normalized
+from draive.similarity.selection import top_indices
+
+__all__ = [
+    "IVFVectorIndex",
+]
+
+
+class IVFVectorIndex[Value]:
+    """\
+    Approximate nearest neighbour index based on inverted file lists. \
+    Vectors are clustered with spherical k-means and stored grouped by cluster, \
+    search scans only the clusters closest to the query. \
+    Increasing probes improves recall at the cost of latency, \
+    probing all clusters gives exact results. \
+    Index is immutable after being built.
+
+    Parameters
+    ----------
+    centroids: NDArray[np.float32]
+        normalized clusters centroids
+    offsets: NDArray[np.intp]
+        start offsets of each cluster within vectors, with total count as the last element
+    vectors: NDArray[np.float32]
+        normalized vectors ordered by cluster
+    values: Sequence[Value]
+        values associated with vectors, in the same order
+    probes: int
+        default number of clusters scanned on search, default is 8
+    """
+
+    @classmethod
+    def of(  # noqa: PLR0913
+        cls,
+        elements: Iterable[Embedded[Value]],
+        /,
+        *,
+        clusters: int | None = None,
+        probes: int = 8,
+        iterations: int = 16,
+        training_sample: int | None = None,
+        seed: int | None = None,
+    ) -> Self:
+        embedded: list[Embedded[Value]] = list(elements)
+        if not embedded:
+            raise ValueError("Can't build an index without elements")
+
+        vectors: NDArray[np.float32] = normalized(
+            np.asarray(
+                [element.vector for element in embedded],
+                dtype=np.float32,
+            )
+        )
+        clusters_count: int = min(
+            clusters or max(int(np.sqrt(len(embedded))), 1),
+            len(embedded),
+        )
+        generator: np.random.Generator = np.random.default_rng(seed)
+        centroids: NDArray[np.float32] = _spherical_kmeans(
+            vectors,
+            clusters=clusters_count,
+            iterations=iterations,
+            # 256 points per cluster is usually enough to place centroids well
+            training_sample=training_sample or clusters_count * 256,
+            generator=generator,
+        )
+        assignments: NDArray[np.intp] = _assign(vectors, centroids=centroids)
+        order: NDArray[np.intp] = np.argsort(assignments, kind="stable")
+        offsets: NDArray[np.intp] = np.zeros(clusters_count + 1, dtype=np.intp)
+        offsets[1:] = np.cumsum(np.bincount(assignments, minlength=clusters_count))
+
+        return cls(
+            centroids=centroids,
+            offsets=offsets,
+            vectors=vectors[order],
+            values=[embedded[index].value for index in cast(list[int], order.tolist())],
+            probes=probes,
+        )
+
+    @classmethod
+    def load(
+        cls,
+        path: Path | str,
+        /,
+        *,
+        probes: int = 8,
+        decode_value: Callable[[Any], Value] = lambda value: value,
+    ) -> Self:
+        with np.load(path, allow_pickle=False) as stored:
+            return cls(
+                centroids=stored["centroids"],
+                offsets=stored["offsets"],
+                vectors=stored["vectors"],
+                values=[decode_value(value) for value in json.loads(str(stored["values"]))],
+                probes=probes,
+            )
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        centroids: NDArray[np.float32],
+        offsets: NDArray[np.intp],
+        vectors: NDArray[np.float32],
+        values: Sequence[Value],
+        probes: int = 8,
+    ) -> None:
+        assert probes > 0  # nosec: B101
+        assert centroids.shape[0] + 1 == offsets.shape[0]  # nosec: B101
+        assert vectors.shape[0] == len(values) == offsets[-1]  # nosec: B101
+        self._centroids: NDArray[np.float32] = centroids
+        self._offsets: NDArray[np.intp] = offsets
+        self._vectors: NDArray[np.float32] = vectors
+        self._values: Sequence[Value] = values
+        self._probes: int = probes
+
+    @property
+    def clusters(self) -> int:
+        return self._centroids.shape[0]
+
+    @property
+    def values(self) -> Sequence[Value]:
+        return self._values
+
+    def __len__(self) -> int:
+        return self._vectors.shape[0]
+
+    def save(
+        self,
+        path: Path | str,
+        /,
+        *,
+        encode_value: Callable[[Value], Any] = lambda value: value,
+    ) -> None:
+        # values are stored as json, use encode_value to make them json compatible
+        # writing to a file keeps the path as it is, numpy would append .npz suffix
+        with Path(path).open("wb") as file:
+            np.savez(
+                file,
+                centroids=self._centroids,
+                offsets=self._offsets,
+                vectors=self._vectors,
+                values=np.array(json.dumps([encode_value(value) for value in self._values])),
+            )
+
+    def search(
+        self,
+        query_vector: NDArray[Any] | list[float],
+        /,
+        limit: int,
+        score_threshold: float | None = None,
+        probes: int | None = None,
+    ) -> list[Value]:
+        return [
+            self._values[index]
+            for index in self.search_indices(
+                query_vector,
+                limit=limit,
+                score_threshold=score_threshold,
+                probes=probes,
+            )
+        ]
+
+    def search_indices(
+        self,
+        query_vector: NDArray[Any] | list[float],
+        /,
+        limit: int,
+        score_threshold: float | None = None,
+        probes: int | None = None,
+    ) -> list[int]:
+        assert limit > 0  # nosec: B101
+        query: NDArray[np.float32] = normalized(
+            np.asarray(query_vector, dtype=np.float32).reshape(-1)
+        )
+        if query.shape[0] != self._vectors.shape[1]:
+            raise ValueError(
+                f"Invalid query dimensions - expected {self._vectors.shape[1]}"
+                f" while received {query.shape[0]}"
+            )
+
+        probed: list[int] = top_indices(
+            self._centroids @ query,
+            limit=min(probes or self._probes, self.clusters),
+        )
+        candidates: NDArray[np.intp] = np.concatenate(
+            [
+                np.arange(self._offsets[cluster], self._offsets[cluster + 1], dtype=np.intp)
+                for cluster in probed
+            ]
+        )
+        if candidates.shape[0] == 0:
+            return []
+
+        candidates_scores: NDArray[np.float32] = np.concatenate(
+            [
+                self._vectors[self._offsets[cluster] : self._offsets[cluster + 1]] @ query
+                for cluster in probed
+            ]
+        )
+        return candidates[
+            top_indices(
+                candidates_scores,
+                limit=limit,
+                score_threshold=score_threshold,
+            )
+        ].tolist()
+
+
+def _assign(
+    vectors: NDArray[np.float32],
+    /,
+    centroids: NDArray[np.float32],
+    chunk_size: int = 16384,
+) -> NDArray[np.intp]:
+    # assign in chunks to keep the similarity matrix memory bounded
+    assignments: NDArray[np.intp] = np.empty(vectors.shape[0], dtype=np.intp)
+    for start in range(0, vectors.shape[0], chunk_size):
+        assignments[start : start + chunk_size] = np.argmax(
+            vectors[start : start + chunk_size] @ centroids.T,
+            axis=1,
+        )
+
+    return assignments
+
+
+def _spherical_kmeans(
+    vectors: NDArray[np.float32],
+    /,
+    clusters: int,
+    iterations: int,
+    training_sample: int,
+    generator: np.random.Generator,
+) -> NDArray[np.float32]:
+    training: NDArray[np.float32]
+    if vectors.shape[0] > training_sample:
+        training = vectors[generator.choice(vectors.shape[0], training_sample, replace=False)]
+
+    else:
+        training = vectors
+
+    centroids: NDArray[np.float32] = training[
+        generator.choice(training.shape[0], clusters, replace=False)
+    ].copy()
+    for _ in range(iterations):
+        assignments: NDArray[np.intp] = _assign(training, centroids=centroids)
+        sums: NDArray[np.float32] = np.zeros_like(centroids)
+        np.add.at(sums, assignments, training)
+        counts: NDArray[np.intp] = np.bincount(assignments, minlength=clusters)
+        # reseed empty clusters using random training vectors
+        if empty := np.flatnonzero(counts == 0).tolist():
+            sums[empty] = training[generator.choice(training.shape[0], len(empty))]
+
+        centroids = normalized(sums)
+
+    return centroids
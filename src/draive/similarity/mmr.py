@@ -3,7 +3,8 @@ from typing import Any
 import numpy as np
 from numpy.typing import NDArray
 
-from draive.similarity.cosine import cosine
+from draive.similarity.index import VectorIndex
+from draive.similarity.normalization import normalized
 
 __all__ = [
     "mmr_similarity_search",
@@ -12,56 +13,73 @@ __all__ = [
 
 def mmr_similarity_search(
     query_vector: NDArray[Any] | list[float],
-    values_vectors: list[NDArray[Any]] | list[list[float]],
+    values_vectors: VectorIndex[Any] | list[NDArray[Any]] | list[list[float]],
     limit: int,
     lambda_multiplier: float = 0.5,
 ) -> list[int]:
     assert limit > 0  # nosec: B101
-    if not values_vectors:
+    if len(values_vectors) == 0:
         return []
 
-    query: NDArray[Any] = np.array(query_vector)
-    if query.ndim == 1:
-        query = np.expand_dims(query_vector, axis=0)
-    values: NDArray[Any] = np.array(values_vectors)
+    query: NDArray[Any]
+    values: NDArray[Any]
+    if isinstance(values_vectors, VectorIndex):
+        # index keeps vectors already normalized
+        query = normalized(np.asarray(query_vector, dtype=np.float32).reshape(-1))
+        values = values_vectors.vectors
 
-    # count similarity
-    similarity: NDArray[Any] = cosine(values, query)
-    # find most similar match for query
-    most_similar: int = int(np.argmax(similarity))
-    selected_indices: list[int] = [most_similar]
-    selected: NDArray[Any] = np.array([values[most_similar]])
+    else:
+        query = normalized(np.asarray(query_vector).reshape(-1))
+        values = normalized(np.asarray(values_vectors))
 
-    # then look one by one next best matches until the limit or end of alternatives
-    while len(selected_indices) < limit and len(selected_indices) < len(values_vectors):
-        best_score: float = -np.inf
-        best_index: int = -1
-        # count similarity to already selected results
-        similarity_to_selected: NDArray[Any] = cosine(values, selected)
+    if query.shape[0] != values.shape[1]:
+        raise ValueError("Number of columns has to be the same for both arguments.")
 
-        # then find the next best score
-        # (balancing between similarity to query and uniqueness of result)
-        for idx, similarity_score in enumerate(similarity):
-            if idx in selected_indices:
-                continue  # skip already added
+    return _mmr_selection(
+        query_similarity=values @ query,
+        values=values,
+        limit=limit,
+        lambda_multiplier=lambda_multiplier,
+    )
 
-            equation_score = (
-                lambda_multiplier * similarity_score
-                - (1 - lambda_multiplier) * similarity_to_selected[idx]
-            )
-            # check if has better score
-            if equation_score > best_score:
-                best_score = equation_score
-                best_index = idx
 
-        if best_index < 0:
-            break
+def _mmr_selection(
+    query_similarity: NDArray[Any],
+    values: NDArray[Any],
+    limit: int,
+    lambda_multiplier: float,
+) -> list[int]:
+    # values are expected to be normalized already - dot product is the cosine similarity
+    values_count: int = values.shape[0]
+    selection_limit: int = min(limit, values_count)
+    relevance: NDArray[Any] = lambda_multiplier * query_similarity
+    # running max of similarity to any already selected value
+    similarity_to_selected: NDArray[Any] = np.full(
+        values_count,
+        -np.inf,
+        dtype=query_similarity.dtype,
+    )
+    selected_mask: NDArray[np.bool_] = np.zeros(values_count, dtype=np.bool_)
+
+    # find most similar match for query
+    selected_index: int = int(np.argmax(query_similarity))
+    selected_indices: list[int] = [selected_index]
+    selected_mask[selected_index] = True
 
-        selected_indices.append(best_index)
-        selected = np.append(
-            selected,
-            [values[best_index]],  # pyright: ignore[reportUnknownArgumentType]
-            axis=0,
+    # then look one by one next best matches until the limit or end of alternatives
+    while len(selected_indices) < selection_limit:
+        # update similarity to selected using only the most recently selected value
+        np.maximum(
+            similarity_to_selected,
+            values @ values[selected_index],
+            out=similarity_to_selected,
         )
+        # balance between similarity to query and uniqueness of result
+        scores: NDArray[Any] = relevance - (1 - lambda_multiplier) * similarity_to_selected
+        scores[selected_mask] = -np.inf  # skip already added
+
+        selected_index = int(np.argmax(scores))
+        selected_indices.append(selected_index)
+        selected_mask[selected_index] = True
 
     return selected_indices
@@ -0,0 +1,25 @@
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+__all__ = [
+    "normalized",
+]
+
+
+def normalized(
+    vectors: NDArray[Any],
+    /,
+) -> NDArray[Any]:
+    # normalize rows (or a single vector) to unit length, zero vectors are left as zeros
+    norms: NDArray[Any] = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result: NDArray[Any] = np.divide(
+            vectors,
+            norms,
+            out=np.zeros(vectors.shape, dtype=np.result_type(vectors.dtype, np.float32)),
+            where=norms > 0,
+        )
+
+    return result
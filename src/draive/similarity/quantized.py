@@ -0,0 +1,236 @@
+from collections.abc import Callable, Iterable
+from typing import Any, Literal, Self
+
+import numpy as np
+from numpy.typing import NDArray
+
+from draive.embedding import Embedded
+from draive.similarity.normalization import normalized
+from draive.similarity.selection import top_indices
+from draive.similarity.store import VectorStore
+
+__all__ = [
+    "QuantizedVectorIndex",
+]
+
+# number of set bits for each byte value
+_POPCOUNT: NDArray[np.uint8] = np.array(
+    [bin(byte).count("1") for byte in range(256)],
+    dtype=np.uint8,
+)
+
+
+class QuantizedVectorIndex[Value]:
+    """\
+    Vector index searching over quantized vector codes with exact rescoring. \
+    The first pass scans compact codes to select limit * oversampling candidates, \
+    then candidates are rescored using exact cosine similarity of the float vectors. \
+    "int8" quantization uses per dimension symmetric scale (4x smaller than float32), \
+    "binary" quantization keeps only signs of dimensions and compares codes \
+    with Hamming distance (32x smaller than float32). \
+    Float vectors can be kept outside of memory i.e. when using a VectorStore memmap, \
+    then only the codes and the candidates rows are loaded to memory. \
+    Index is immutable after being built.
+
+    Parameters
+    ----------
+    vectors: NDArray[Any]
+        float vectors used for rescoring, can be a memory mapped array
+    value: Callable[[int], Value]
+        function providing value for a given vector position
+    quantization: Literal["int8", "binary"]
+        quantization method, default is "int8"
+    oversampling: int
+        multiplier of limit used to select candidates for rescoring, default is 4
+    """
+
+    @classmethod
+    def of(
+        cls,
+        elements: Iterable[Embedded[Value]],
+        /,
+        *,
+        quantization: Literal["int8", "binary"] = "int8",
+        oversampling: int = 4,
+    ) -> Self:
+        embedded: list[Embedded[Value]] = list(elements)
+        values: list[Value] = [element.value for element in embedded]
+        return cls(
+            np.asarray(
+                [element.vector for element in embedded],
+                dtype=np.float32,
+            ),
+            value=values.__getitem__,
+            quantization=quantization,
+            oversampling=oversampling,
+        )
+
+    @classmethod
+    def of_store(
+        cls,
+        store: VectorStore[Value],
+        /,
+        *,
+        quantization: Literal["int8", "binary"] = "int8",
+        oversampling: int = 4,
+    ) -> Self:
+        # rows appended to the store later are not included
+        return cls(
+            store.vectors,
+            value=store.value,
+            quantization=quantization,
+            oversampling=oversampling,
+        )
+
+    def __init__(  # noqa: PLR0913
+        self,
+        vectors: NDArray[Any],
+        /,
+        *,
+        value: Callable[[int], Value],
+        quantization: Literal["int8", "binary"] = "int8",
+        oversampling: int = 4,
+        chunk_size: int = 65536,
+    ) -> None:
+        assert oversampling > 0  # nosec: B101
+        assert chunk_size > 0  # nosec: B101
+        self._vectors: NDArray[Any] = vectors
+        self._value: Callable[[int], Value] = value
+        self._quantization: Literal["int8", "binary"] = quantization
+        self._oversampling: int = oversampling
+        self._chunk_size: int = chunk_size
+        self._dimensions: int = vectors.shape[1] if vectors.ndim == 2 else 0  # noqa: PLR2004
+        self._scale: NDArray[np.float32]
+        self._codes: NDArray[np.int8] | NDArray[np.uint8]
+        match quantization:
+            case "int8":
+                # scale each dimension separately to use the whole int8 range
+                maximum: NDArray[np.float32] = np.zeros(self._dimensions, dtype=np.float32)
+                for chunk in self._normalized_chunks():
+                    np.maximum(maximum, np.abs(chunk).max(axis=0), out=maximum)
+
+                self._scale = np.where(maximum > 0, maximum / 127, 1).astype(np.float32)
+                self._codes = np.empty(vectors.shape, dtype=np.int8)
+                for start, chunk in zip(
+                    range(0, vectors.shape[0], chunk_size),
+                    self._normalized_chunks(),
+                    strict=True,
+                ):
+                    self._codes[start : start + chunk_size] = np.rint(chunk / self._scale)
+
+            case "binary":
+                self._scale = np.ones(self._dimensions, dtype=np.float32)
+                self._codes = np.empty(
+                    (vectors.shape[0], (self._dimensions + 7) // 8),
+                    dtype=np.uint8,
+                )
+                for start, chunk in zip(
+                    range(0, vectors.shape[0], chunk_size),
+                    self._normalized_chunks(),
+                    strict=True,
+                ):
+                    self._codes[start : start + chunk_size] = np.packbits(chunk > 0, axis=1)
+
+    @property
+    def quantization(self) -> Literal["int8", "binary"]:
+        return self._quantization
+
+    @property
+    def codes_size(self) -> int:
+        # size of quantized codes in bytes
+        return self._codes.nbytes
+
+    def __len__(self) -> int:
+        return self._codes.shape[0]
+
+    def search(
+        self,
+        query_vector: NDArray[Any] | list[float],
+        /,
+        limit: int,
+        score_threshold: float | None = None,
+    ) -> list[Value]:
+        return [
+            self._value(index)
+            for index in self.search_indices(
+                query_vector,
+                limit=limit,
+                score_threshold=score_threshold,
+            )
+        ]
+
+    def search_indices(
+        self,
+        query_vector: NDArray[Any] | list[float],
+        /,
+        limit: int,
+        score_threshold: float | None = None,
+    ) -> list[int]:
+        assert limit > 0  # nosec: B101
+        if not len(self):
+            return []
+
+        query: NDArray[np.float32] = normalized(
+            np.asarray(query_vector, dtype=np.float32).reshape(-1)
+        )
+        if query.shape[0] != self._dimensions:
+            raise ValueError(
+                f"Invalid query dimensions - expected {self._dimensions}"
+                f" while received {query.shape[0]}"
+            )
+
+        candidates: NDArray[np.intp] = np.array(
+            top_indices(
+                self._approximate_scores(query),
+                limit=min(limit * self._oversampling, len(self)),
+            ),
+            dtype=np.intp,
+        )
+        candidates.sort()  # read rows in order, it matters for memory mapped vectors
+        exact_scores: NDArray[np.float32] = (
+            normalized(np.asarray(self._vectors[candidates], dtype=np.float32)) @ query
+        )
+        return candidates[
+            top_indices(
+                exact_scores,
+                limit=limit,
+                score_threshold=score_threshold,
+            )
+        ].tolist()
+
+    def _approximate_scores(
+        self,
+        query: NDArray[np.float32],
+        /,
+    ) -> NDArray[Any]:
+        scores: NDArray[Any]
+        match self._quantization:
+            case "int8":
+                # dot(codes * scale, query) == dot(codes, scale * query)
+                scaled_query: NDArray[np.float32] = self._scale * query
+                scores = np.empty(self._codes.shape[0], dtype=np.float32)
+                for start in range(0, self._codes.shape[0], self._chunk_size):
+                    scores[start : start + self._chunk_size] = (
+                        self._codes[start : start + self._chunk_size].astype(np.float32)
+                        @ scaled_query
+                    )
+
+            case "binary":
+                query_code: NDArray[np.uint8] = np.packbits(query > 0)
+                scores = np.empty(self._codes.shape[0], dtype=np.int32)
+                for start in range(0, self._codes.shape[0], self._chunk_size):
+                    # negated Hamming distance - higher is more similar
+                    scores[start : start + self._chunk_size] = -_POPCOUNT[
+                        np.bitwise_xor(self._codes[start : start + self._chunk_size], query_code)
+                    ].sum(axis=1, dtype=np.int32)
+
+        return scores
+
+    def _normalized_chunks(self) -> Iterable[NDArray[np.float32]]:
+        for start in range(0, self._vectors.shape[0], self._chunk_size):
+            yield normalized(
+                np.asarray(
+                    self._vectors[start : start + self._chunk_size],
+                    dtype=np.float32,
+                )
+            )
@@ -3,7 +3,9 @@ from typing import Any
 import numpy as np
 from numpy.typing import NDArray
 
-from draive.similarity.cosine import cosine
+from draive.similarity.index import VectorIndex
+from draive.similarity.normalization import normalized
+from draive.similarity.selection import top_indices
 
 __all__ = [
     "similarity_search",
@@ -12,27 +14,29 @@ __all__ = [
 
 def similarity_search(
     query_vector: NDArray[Any] | list[float],
-    values_vectors: list[NDArray[Any]] | list[list[float]],
+    values_vectors: VectorIndex[Any] | list[NDArray[Any]] | list[list[float]],
     limit: int,
     score_threshold: float | None = None,
 ) -> list[int]:
     assert limit > 0  # nosec: B101
-    if not values_vectors:
+    if len(values_vectors) == 0:
         return []
-    query: NDArray[Any] = np.array(query_vector)
-    if query.ndim == 1:
-        query = np.expand_dims(query_vector, axis=0)
-    values: NDArray[Any] = np.array(values_vectors)
-    matching_scores: NDArray[Any] = cosine(values, query)
-    sorted_indices: list[int] = list(reversed(np.argsort(matching_scores)))
-    if score_threshold:
-        return [
-            int(idx)
-            for idx in sorted_indices  # pyright: ignore[reportUnknownVariableType]
-        ][:limit]
+
+    matching_scores: NDArray[Any]
+    if isinstance(values_vectors, VectorIndex):
+        # index keeps vectors already normalized
+        matching_scores = values_vectors.scores(query_vector)
+
     else:
-        return [
-            int(idx)
-            for idx in sorted_indices  # pyright: ignore[reportUnknownVariableType]
-            if matching_scores[idx] > score_threshold  # pyright: ignore[reportUnknownArgumentType]
-        ][:limit]
+        query: NDArray[Any] = normalized(np.asarray(query_vector).reshape(-1))
+        values: NDArray[Any] = normalized(np.asarray(values_vectors))
+        if query.shape[0] != values.shape[1]:
+            raise ValueError("Number of columns has to be the same for both arguments.")
+
+        matching_scores = values @ query
+
+    return top_indices(
+        matching_scores,
+        limit=limit,
+        score_threshold=score_threshold,
+    )
@@ -0,0 +1,41 @@
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+__all__ = [
+    "top_indices",
+]
+
+
+def top_indices(
+    scores: NDArray[Any],
+    /,
+    limit: int,
+    score_threshold: float | None = None,
+) -> list[int]:
+    # select indices of the highest scores ordered from the best one
+    candidates: NDArray[np.intp] | None
+    candidates_scores: NDArray[Any]
+    if score_threshold is not None:
+        candidates = np.flatnonzero(scores > score_threshold)
+        candidates_scores = scores[candidates]
+
+    else:
+        candidates = None
+        candidates_scores = scores
+
+    selected: NDArray[np.intp]
+    if candidates_scores.shape[0] > limit:
+        # partial selection is linear - sort only the selected part
+        selected = np.argpartition(candidates_scores, -limit)[-limit:]
+        selected = selected[np.argsort(-candidates_scores[selected], kind="stable")]
+
+    else:
+        selected = np.argsort(-candidates_scores, kind="stable")
+
+    if candidates is not None:
+        return candidates[selected].tolist()
+
+    else:
+        return selected.tolist()
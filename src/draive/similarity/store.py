@@ -0,0 +1,314 @@
+import json
+from collections.abc import Callable, Iterable, Sequence
+from pathlib import Path
+from types import TracebackType
+from typing import Any, BinaryIO, Self, cast
+from uuid import uuid4
+
+import numpy as np
+from numpy.typing import NDArray
+
+from draive.embedding import Embedded
+from draive.similarity.selection import top_indices
+
+__all__ = [
+    "VectorStore",
+]
+
+_FORMAT_VERSION: int = 1
+_MANIFEST_FILE: str = "manifest.json"
+_VECTORS_FILE: str = "vectors.f32"
+_VALUES_FILE: str = "values.jsonl"
+_IDENTIFIERS_FILE: str = "identifiers.jsonl"
+
+
+class VectorStore[Value]:
+    """\
+    Append only, on disk storage of embedded values. \
+    Vectors are kept as raw little endian float32 rows accessed through np.memmap, \
+    so multiple processes opening the same store share its pages through the OS page cache \
+    instead of keeping own copies. \
+    Values are stored as json lines in a separate file and decoded lazily on access. \
+    The identifiers sidecar holds one json line per row with the identifier and \
+    the position of the row value within the values file. \
+    It is written last and marks rows as complete, which allows concurrent readers \
+    to use refresh to pick up rows appended by a single writer.
+
+    Parameters
+    ----------
+    path: Path | str
+        directory containing the store files
+    encode_value: Callable[[Value], Any]
+        function preparing json compatible representation of values, default is identity
+    decode_value: Callable[[Any], Value]
+        function restoring values from json representation, default is identity
+    """
+
+    @classmethod
+    def create(
+        cls,
+        path: Path | str,
+        /,
+        *,
+        dimensions: int,
+        encode_value: Callable[[Value], Any] = lambda value: value,
+        decode_value: Callable[[Any], Value] = lambda value: value,
+    ) -> Self:
+        directory: Path = Path(path)
+        directory.mkdir(parents=True, exist_ok=True)
+        if (directory / _MANIFEST_FILE).exists():
+            raise FileExistsError(f"Vector store already exists at {directory}")
+
+        for file in (_VECTORS_FILE, _VALUES_FILE, _IDENTIFIERS_FILE):
+            (directory / file).touch()
+
+        # manifest is written last - store is valid only when it exists
+        (directory / _MANIFEST_FILE).write_text(
+            json.dumps(
+                {
+                    "format": _FORMAT_VERSION,
+                    "dimensions": dimensions,
+                    "dtype": "<f4",
+                }
+            )
+        )
+
+        return cls(
+            directory,
+            encode_value=encode_value,
+            decode_value=decode_value,
+        )
+
+    def __init__(
+        self,
+        path: Path | str,
+        /,
+        *,
+        encode_value: Callable[[Value], Any] = lambda value: value,
+        decode_value: Callable[[Any], Value] = lambda value: value,
+    ) -> None:
+        self._path: Path = Path(path)
+        manifest: dict[str, Any] = json.loads((self._path / _MANIFEST_FILE).read_text())
+        if manifest.get("format") != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported vector store format: {manifest.get('format')}")
+
+        self._dimensions: int = int(manifest["dimensions"])
+        self._encode_value: Callable[[Value], Any] = encode_value
+        self._decode_value: Callable[[Any], Value] = decode_value
+        self._identifiers: list[str] = []
+        self._values_positions: list[tuple[int, int]] = []
+        self._positions: dict[str, int] = {}
+        self._identifiers_read_offset: int = 0
+        self._vectors: NDArray[np.float32] = np.empty((0, self._dimensions), dtype=np.float32)
+        self._norms: NDArray[np.float32] = np.empty(0, dtype=np.float32)
+        self._values_file: BinaryIO | None = None
+        self.refresh()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def dimensions(self) -> int:
+        return self._dimensions
+
+    @property
+    def vectors(self) -> NDArray[np.float32]:
+        # read only memory mapped vectors, not normalized
+        return self._vectors
+
+    @property
+    def identifiers(self) -> Sequence[str]:
+        return self._identifiers
+
+    def __len__(self) -> int:
+        return len(self._identifiers)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __contains__(
+        self,
+        identifier: str,
+    ) -> bool:
+        return identifier in self._positions
+
+    def position(
+        self,
+        identifier: str,
+        /,
+    ) -> int:
+        return self._positions[identifier]
+
+    def value(
+        self,
+        position: int,
+        /,
+    ) -> Value:
+        offset, length = self._values_positions[position]
+        if self._values_file is None:
+            self._values_file = (self._path / _VALUES_FILE).open("rb")
+
+        self._values_file.seek(offset)
+        return self._decode_value(json.loads(self._values_file.read(length)))
+
+    def embedded(
+        self,
+        position: int,
+        /,
+    ) -> Embedded[Value]:
+        return Embedded(
+            value=self.value(position),
+            vector=np.array(self._vectors[position]),  # copy row out of the memory map
+        )
+
+    def refresh(self) -> None:
+        # read rows completed since the last refresh, possibly by other processes
+        with (self._path / _IDENTIFIERS_FILE).open("rb") as file:
+            file.seek(self._identifiers_read_offset)
+            appended: bytes = file.read()
+
+        # use only complete lines, the last one might be still written
+        complete_length: int = appended.rfind(b"\n") + 1
+        if complete_length == 0:
+            return  # nothing new
+
+        for line in appended[:complete_length].splitlines():
+            identifier, offset, length = json.loads(line)
+            self._positions[identifier] = len(self._identifiers)
+            self._identifiers.append(identifier)
+            self._values_positions.append((offset, length))
+
+        self._identifiers_read_offset += complete_length
+        self._vectors = cast(
+            NDArray[np.float32],
+            np.memmap(
+                self._path / _VECTORS_FILE,
+                dtype="<f4",
+                mode="r",
+                shape=(len(self._identifiers), self._dimensions),
+            ),
+        )
+        # norms are small enough to keep in memory, compute only for new rows
+        self._norms = np.concatenate(
+            [
+                self._norms,
+                np.linalg.norm(self._vectors[self._norms.shape[0] :], axis=1),
+            ]
+        )
+
+    def append(
+        self,
+        elements: Iterable[Embedded[Value]],
+        /,
+        identifiers: Iterable[str] | None = None,
+    ) -> list[str]:
+        embedded: list[Embedded[Value]] = list(elements)
+        if not embedded:
+            return []
+
+        elements_identifiers: list[str]
+        if identifiers is None:
+            elements_identifiers = [uuid4().hex for _ in embedded]
+
+        else:
+            elements_identifiers = list(identifiers)
+            if len(elements_identifiers) != len(embedded):
+                raise ValueError("Number of identifiers has to match number of elements")
+
+        self.refresh()  # make sure we are appending after all rows written so far
+        if duplicates := set(elements_identifiers).intersection(self._positions):
+            raise ValueError(f"Duplicate identifiers in append only store: {duplicates}")
+
+        vectors: NDArray[np.float32] = np.asarray(
+            [element.vector for element in embedded],
+            dtype="<f4",
+        )
+        if vectors.ndim != 2 or vectors.shape[1] != self._dimensions:  # noqa: PLR2004
+            raise ValueError(f"Invalid vector dimensions - expected {self._dimensions}")
+
+        # write rows data first, identifiers mark them as complete
+        with (self._path / _VECTORS_FILE).open("ab") as file:
+            file.seek(0, 2)
+            vectors_offset: int = file.tell()
+            expected_offset: int = len(self._identifiers) * self._dimensions * 4
+            if vectors_offset != expected_offset:
+                # drop leftovers of an interrupted write
+                file.truncate(expected_offset)
+
+            file.write(vectors.tobytes())
+
+        positions: list[tuple[int, int]] = []
+        with (self._path / _VALUES_FILE).open("ab") as file:
+            file.seek(0, 2)
+            for element in embedded:
+                encoded: bytes = json.dumps(self._encode_value(element.value)).encode()
+                positions.append((file.tell(), len(encoded)))
+                file.write(encoded + b"\n")
+
+        with (self._path / _IDENTIFIERS_FILE).open("ab") as file:
+            file.write(
+                b"".join(
+                    json.dumps([identifier, offset, length]).encode() + b"\n"
+                    for identifier, (offset, length) in zip(
+                        elements_identifiers,
+                        positions,
+                        strict=True,
+                    )
+                )
+            )
+
+        self.refresh()
+        return elements_identifiers
+
+    def scores(
+        self,
+        query_vector: NDArray[Any] | list[float],
+        /,
+    ) -> NDArray[np.float32]:
+        query: NDArray[np.float32] = np.asarray(query_vector, dtype=np.float32).reshape(-1)
+        if query.shape[0] != self._dimensions:
+            raise ValueError(
+                f"Invalid query dimensions - expected {self._dimensions}"
+                f" while received {query.shape[0]}"
+            )
+
+        query_norm: float = float(np.linalg.norm(query))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores: NDArray[np.float32] = (self._vectors @ query) / (self._norms * query_norm)
+
+        scores[~np.isfinite(scores)] = 0.0
+        return scores
+
+    def search(
+        self,
+        query_vector: NDArray[Any] | list[float],
+        /,
+        limit: int,
+        score_threshold: float | None = None,
+    ) -> list[Value]:
+        assert limit > 0  # nosec: B101
+        if not self._identifiers:
+            return []
+
+        return [
+            self.value(position)
+            for position in top_indices(
+                self.scores(query_vector),
+                limit=limit,
+                score_threshold=score_threshold,
+            )
+        ]
+
+    def close(self) -> None:
+        if self._values_file is not None:
+            self._values_file.close()
+            self._values_file = None
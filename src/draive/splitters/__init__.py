@@ -1,5 +1,9 @@
 from draive.splitters.basic import split_text
+from draive.splitters.parallel import split_texts
+from draive.splitters.stream import split_text_stream
 
 __all__ = [
     "split_text",
+    "split_text_stream",
+    "split_texts",
 ]
@@ -1,4 +1,5 @@
-from collections.abc import Callable
+from bisect import bisect_right
+from collections.abc import Callable, Sequence
 
 __all__ = [
     "split_text",
@@ -16,14 +17,31 @@ def split_text(
     if count_size(text) < part_size:
         return [text]
 
+    return _split_and_merge(
+        text=text,
+        part_size=part_size,
+        count_size=count_size,
+        separators=separators,
+        part_overlap_size=part_overlap_size,
+    )
+
+
+def _split_and_merge(
+    text: str,
+    part_size: int,
+    count_size: Callable[[str], int],
+    separators: tuple[str, str] | str | None,
+    part_overlap_size: int | None,
+) -> list[str]:
     # split using provided separators
     splitter, parts = _split(
         text=text,
         separators=separators,
     )
-    # then merge
+    # then merge, counting size of each part only once
     return _merge(
         parts=parts,
+        sizes=[count_size(part) for part in parts],
         splitter=splitter,
         part_size=part_size,
         count_size=count_size,
@@ -62,69 +80,111 @@ def _split(
     return (splitter, parts)
 
 
-def _merge(  # noqa: C901
+def _merge(  # noqa: PLR0913
     parts: list[str],
+    sizes: list[int],
     part_size: int,
     count_size: Callable[[str], int],
     splitter: str,
     part_overlap_size: int | None,
 ) -> list[str]:
+    merger = _PartsMerger(
+        part_size=part_size,
+        count_size=count_size,
+        splitter=splitter,
+        part_overlap_size=part_overlap_size,
+    )
     result: list[str] = []
-    accumulator: list[str] = []
-    accumulator_size: int = 0
-    # iterate over splitted pats
-    for part in parts:
-        temp_size: int = count_size(part)
+    for part, size in zip(parts, sizes, strict=True):
+        if merged := merger.append(part, size=size):
+            result.extend(merged)
+
+    result.extend(merger.finish())
+    return result
+
+
+class _PartsMerger:
+    # merges parts incrementally, keeping only the currently accumulated parts
+
+    def __init__(
+        self,
+        part_size: int,
+        count_size: Callable[[str], int],
+        splitter: str,
+        part_overlap_size: int | None,
+    ) -> None:
+        self._part_size: int = part_size
+        self._count_size: Callable[[str], int] = count_size
+        self._splitter: str = splitter
+        self._part_overlap_size: int | None = part_overlap_size
+        self._accumulated: list[str] = []
+        # prefix sums of accumulated parts sizes
+        self._offsets: list[int] = [0]
+
+    def append(
+        self,
+        part: str,
+        /,
+        size: int,
+    ) -> Sequence[str]:
+        accumulated_size: int = self._offsets[-1]
         # check if can add to previous part
-        if accumulator_size + temp_size < part_size:
-            accumulator.append(part)
-            accumulator_size += temp_size
+        if accumulated_size + size < self._part_size:
+            self._accumulated.append(part)
+            self._offsets.append(accumulated_size + size)
+            return ()
+
+        result: list[str] = []
+        chunk: str = self._splitter.join(self._accumulated).strip()
+        if chunk:
+            result.append(chunk)
+
         # check if part is not too big on its own
-        elif temp_size > part_size:
-            chunk: str = splitter.join(accumulator).strip()
-            if chunk:
-                result.append(chunk)
+        if size > self._part_size:
             # do special splitting if it is too big indeed
             # force overlap and split on newlines and spaces
+            # its size is already known to exceed part_size so skip counting it again
             result.extend(
-                split_text(
+                _split_and_merge(
                     text=part,
-                    part_size=part_size,
+                    part_size=self._part_size,
                     separators=("\n", " "),
-                    part_overlap_size=part_overlap_size
-                    or int(part_size * 0.2),  # if there was no overlap force at least 20%
-                    count_size=count_size,
+                    part_overlap_size=self._part_overlap_size
+                    or int(self._part_size * 0.2),  # if there was no overlap force at least 20%
+                    count_size=self._count_size,
                 ),
             )
-            accumulator = []
-            accumulator_size = 0
+            self._accumulated = []
+            self._offsets = [0]
+
         # if we have overlap defined do overlap between last part and current (not fitting)
-        elif part_overlap_size := part_overlap_size:
-            chunk: str = splitter.join(accumulator).strip()
-            if chunk:
-                result.append(chunk)
-            overlap_size: int = 0
-            overlap: list[str] = []
-            for element in reversed(accumulator):
-                element_size: int = count_size(element)
-                if overlap_size + element_size < part_overlap_size:
-                    overlap.append(element)
-                    overlap_size += element_size
-                else:
-                    break
-
-            accumulator = [*reversed(overlap), part]
-            accumulator_size = overlap_size + temp_size
+        elif part_overlap_size := self._part_overlap_size:
+            # keep the longest suffix of accumulated parts smaller than overlap size
+            overlap_start: int = bisect_right(
+                self._offsets,
+                accumulated_size - part_overlap_size,
+                hi=len(self._accumulated),
+            )
+            overlap_offset: int = self._offsets[overlap_start]
+            self._accumulated = [*self._accumulated[overlap_start:], part]
+            self._offsets = [
+                *(offset - overlap_offset for offset in self._offsets[overlap_start:]),
+                accumulated_size - overlap_offset + size,
+            ]
+
         # otherwise make start a new part out of current
         else:
-            chunk: str = splitter.join(accumulator).strip()
-            if chunk:
-                result.append(chunk)
-            accumulator = [part]
-            accumulator_size = temp_size
+            self._accumulated = [part]
+            self._offsets = [0, size]
 
-    chunk: str = splitter.join(accumulator).strip()
-    if chunk:  # add leftover if any
-        result.append(chunk)
+        return result
 
-    return result
+    def finish(self) -> Sequence[str]:
+        chunk: str = self._splitter.join(self._accumulated).strip()
+        self._accumulated = []
+        self._offsets = [0]
+        if chunk:  # add leftover if any
+            return (chunk,)
+
+        else:
+            return ()
@@ -0,0 +1,170 @@
+from asyncio import AbstractEventLoop, Future, get_running_loop
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from os import cpu_count
+from typing import Literal, overload
+
+from tiktoken import Encoding, get_encoding
+
+from draive.splitters.basic import split_text
+from draive.utils import cache
+
+__all__ = [
+    "split_texts",
+]
+
+
+@overload
+async def split_texts(
+    texts: Iterable[str],
+    /,
+    part_size: int,
+    count_size: Callable[[str], int] | str,
+    separators: tuple[str, str] | str | None = None,
+    part_overlap_size: int | None = None,
+    *,
+    executor: Executor | None = None,
+    stream: Literal[True],
+) -> AsyncIterator[list[str]]: ...
+
+
+@overload
+async def split_texts(
+    texts: Iterable[str],
+    /,
+    part_size: int,
+    count_size: Callable[[str], int] | str,
+    separators: tuple[str, str] | str | None = None,
+    part_overlap_size: int | None = None,
+    *,
+    executor: Executor | None = None,
+    stream: Literal[False] = False,
+) -> list[list[str]]: ...
+
+
+async def split_texts(  # noqa: PLR0913
+    texts: Iterable[str],
+    /,
+    part_size: int,
+    count_size: Callable[[str], int] | str,
+    separators: tuple[str, str] | str | None = None,
+    part_overlap_size: int | None = None,
+    *,
+    executor: Executor | None = None,
+    stream: bool = False,
+) -> AsyncIterator[list[str]] | list[list[str]]:
+    """\
+    Split multiple texts using split_text in a pool of worker processes \
+    without blocking the event loop.
+    Results are provided per text in the order of texts, \
+    either all at once or streamed as soon as consecutive texts are split.
+
+    Parameters
+    ----------
+    texts: Iterable[str]
+        texts to be split
+    part_size: int
+        size limit of parts, see split_text
+    count_size: Callable[[str], int] | str
+        function counting text size, it has to be picklable to be sent to worker processes \
+        i.e. a module level function. String value is used as a tiktoken encoding name \
+        (i.e. "cl100k_base") to count tokens, the encoding is loaded once in each worker
+    separators: tuple[str, str] | str | None
+        separators used to split texts, see split_text
+    part_overlap_size: int | None
+        size of parts overlap, see split_text
+    executor: Executor | None
+        executor used to run splitting, default is a shared ProcessPoolExecutor
+    stream: bool
+        return results as an async iterator instead of a list
+
+    Returns
+    -------
+    AsyncIterator[list[str]] | list[list[str]]
+        parts of each text
+    """
+    results: AsyncGenerator[list[str], None] = _split_texts(
+        texts,
+        part_size=part_size,
+        count_size=count_size,
+        separators=separators,
+        part_overlap_size=part_overlap_size,
+        executor=executor or _shared_executor(),
+    )
+    if stream:
+        return results
+
+    else:
+        return [parts async for parts in results]
+
+
+async def _split_texts(  # noqa: PLR0913
+    texts: Iterable[str],
+    /,
+    *,
+    part_size: int,
+    count_size: Callable[[str], int] | str,
+    separators: tuple[str, str] | str | None,
+    part_overlap_size: int | None,
+    executor: Executor,
+) -> AsyncGenerator[list[str], None]:
+    loop: AbstractEventLoop = get_running_loop()
+    # submit texts gradually to avoid copying all of them to the pool at once
+    pending_limit: int = 2 * (cpu_count() or 1)
+    pending: deque[Future[list[str]]] = deque()
+    try:
+        for text in texts:
+            pending.append(
+                loop.run_in_executor(
+                    executor,
+                    _split_text,
+                    text,
+                    part_size,
+                    count_size,
+                    separators,
+                    part_overlap_size,
+                )
+            )
+            if len(pending) >= pending_limit:
+                yield await pending.popleft()
+
+        while pending:
+            yield await pending.popleft()
+
+    finally:  # do not leave submitted work when the consumer stops early
+        for future in pending:
+            future.cancel()
+
+
+def _split_text(
+    text: str,
+    part_size: int,
+    count_size: Callable[[str], int] | str,
+    separators: tuple[str, str] | str | None,
+    part_overlap_size: int | None,
+) -> list[str]:
+    # executed within worker process
+    return split_text(
+        text=text,
+        part_size=part_size,
+        count_size=_count_tokens(count_size) if isinstance(count_size, str) else count_size,
+        separators=separators,
+        part_overlap_size=part_overlap_size,
+    )
+
+
+@cache(limit=8)
+def _count_tokens(encoding_name: str) -> Callable[[str], int]:
+    encoding: Encoding = get_encoding(encoding_name)
+
+    def count_tokens(text: str) -> int:
+        # special tokens are not expected in documents - count them as regular text
+        return len(encoding.encode_ordinary(text))
+
+    return count_tokens
+
+
+@cache
+def _shared_executor() -> Executor:
+    return ProcessPoolExecutor()
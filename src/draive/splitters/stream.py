@@ -0,0 +1,285 @@
+from collections.abc import AsyncGenerator, AsyncIterable, Callable, Generator, Iterable
+from io import TextIOBase
+from pathlib import Path
+from typing import overload
+
+from draive.splitters.basic import _PartsMerger  # pyright: ignore[reportPrivateUsage]
+
+__all__ = [
+    "split_text_stream",
+]
+
+
+@overload
+def split_text_stream(
+    source: AsyncIterable[str],
+    /,
+    part_size: int,
+    count_size: Callable[[str], int],
+    separators: tuple[str, str] | str | None = None,
+    part_overlap_size: int | None = None,
+    block_size: int = 1 << 20,
+    buffer_size: int = 1 << 22,
+) -> AsyncGenerator[str, None]: ...
+
+
+@overload
+def split_text_stream(
+    source: Path | TextIOBase | Iterable[str],
+    /,
+    part_size: int,
+    count_size: Callable[[str], int],
+    separators: tuple[str, str] | str | None = None,
+    part_overlap_size: int | None = None,
+    block_size: int = 1 << 20,
+    buffer_size: int = 1 << 22,
+) -> Generator[str, None, None]: ...
+
+
+def split_text_stream(  # noqa: PLR0913
+    source: AsyncIterable[str] | Path | TextIOBase | Iterable[str],
+    /,
+    part_size: int,
+    count_size: Callable[[str], int],
+    separators: tuple[str, str] | str | None = None,
+    part_overlap_size: int | None = None,
+    block_size: int = 1 << 20,
+    buffer_size: int = 1 << 22,
+) -> AsyncGenerator[str, None] | Generator[str, None, None]:
+    """\
+    Split text read incrementally from a file, text stream or (async) iterable of text pieces.
+    Parts are yielded one at a time, only the currently merged parts and the unfinished \
+    part are kept in memory. Files and text streams are read in blocks of block_size characters.
+    Text is split using the primary separator (default is new paragraph), \
+    parts exceeding part_size are split further using new lines and spaces like in split_text. \
+    When buffered text without the primary separator exceeds buffer_size characters \
+    it is split at the last secondary separator (default is new line) or forcibly \
+    at the end of the buffer, which keeps memory bounded for texts i.e. logs without \
+    the primary separator. Results are the same as split_text results for texts \
+    exceeding part_size which contain the primary separator within every buffer_size characters.
+    """
+    splitter: str
+    alt_splitter: str
+    match separators:
+        case (str(primary), str(secondary)):
+            splitter = primary
+            alt_splitter = secondary
+
+        case str(primary):
+            splitter = primary
+            alt_splitter = "\n"
+
+        case None:
+            splitter = "\n\n"
+            alt_splitter = "\n"
+
+    merger = _PartsMerger(
+        part_size=part_size,
+        count_size=count_size,
+        splitter=splitter,
+        part_overlap_size=part_overlap_size,
+    )
+
+    buffer = _PartsBuffer(
+        splitter=splitter,
+        alt_splitter=alt_splitter,
+        part_size=part_size,
+        count_size=count_size,
+        buffer_size=buffer_size,
+    )
+
+    if isinstance(source, AsyncIterable):
+        return _split_async_pieces(
+            source,
+            buffer=buffer,
+            merger=merger,
+        )
+
+    elif isinstance(source, Path):
+        return _split_file(
+            source,
+            block_size=block_size,
+            buffer=buffer,
+            merger=merger,
+        )
+
+    elif isinstance(source, str):
+        return _split_pieces(
+            (source,),
+            buffer=buffer,
+            merger=merger,
+        )
+
+    elif isinstance(source, TextIOBase):
+        return _split_pieces(
+            _read_blocks(source, block_size=block_size),
+            buffer=buffer,
+            merger=merger,
+        )
+
+    else:
+        return _split_pieces(
+            source,
+            buffer=buffer,
+            merger=merger,
+        )
+
+
+def _split_file(
+    path: Path,
+    /,
+    *,
+    block_size: int,
+    buffer: "_PartsBuffer",
+    merger: _PartsMerger,
+) -> Generator[str, None, None]:
+    with path.open(encoding="utf-8") as file:
+        yield from _split_pieces(
+            _read_blocks(file, block_size=block_size),
+            buffer=buffer,
+            merger=merger,
+        )
+
+
+def _read_blocks(
+    stream: TextIOBase,
+    /,
+    *,
+    block_size: int,
+) -> Generator[str, None, None]:
+    while block := stream.read(block_size):
+        yield block
+
+
+def _split_pieces(
+    pieces: Iterable[str],
+    /,
+    *,
+    buffer: "_PartsBuffer",
+    merger: _PartsMerger,
+) -> Generator[str, None, None]:
+    for piece in pieces:
+        for part, size in buffer.append(piece):
+            yield from merger.append(part, size=size)
+
+    for part, size in buffer.finish():
+        yield from merger.append(part, size=size)
+
+    yield from merger.finish()
+
+
+async def _split_async_pieces(
+    pieces: AsyncIterable[str],
+    /,
+    *,
+    buffer: "_PartsBuffer",
+    merger: _PartsMerger,
+) -> AsyncGenerator[str, None]:
+    async for piece in pieces:
+        for part, size in buffer.append(piece):
+            for chunk in merger.append(part, size=size):
+                yield chunk
+
+    for part, size in buffer.finish():
+        for chunk in merger.append(part, size=size):
+            yield chunk
+
+    for chunk in merger.finish():
+        yield chunk
+
+
+class _PartsBuffer:
+    # collects text pieces and releases parts completed by the splitter
+    # pieces are joined only when releasing parts to avoid repeated concatenation
+
+    def __init__(  # noqa: PLR0913
+        self,
+        splitter: str,
+        alt_splitter: str,
+        part_size: int,
+        count_size: Callable[[str], int],
+        buffer_size: int,
+    ) -> None:
+        assert buffer_size > 0  # nosec: B101
+        self._splitter: str = splitter
+        self._alt_splitter: str = alt_splitter
+        self._part_size: int = part_size
+        self._count_size: Callable[[str], int] = count_size
+        self._buffer_size: int = buffer_size
+        # limit of buffered characters, grows when the buffered text is too small to release
+        self._limit: int = buffer_size
+        self._pieces: list[str] = []
+        self._length: int = 0
+        # end of the buffered text which can be the beginning of the splitter
+        self._tail: str = ""
+
+    def append(
+        self,
+        piece: str,
+        /,
+    ) -> list[tuple[str, int]]:
+        parts: list[tuple[str, int]]
+        # look for the splitter only in the new text and its possible beginning before it
+        if (self._tail + piece).find(self._splitter) < 0:
+            parts = []
+            self._buffer(piece)
+
+        else:
+            *completed, remaining = "".join((*self._pieces, piece)).split(self._splitter)
+            parts = [(part, self._count_size(part)) for part in completed]
+            self._pieces = []
+            self._length = 0
+            self._tail = ""
+            self._limit = self._buffer_size
+            self._buffer(remaining)
+
+        if self._length > self._limit:
+            parts.extend(self._release())
+
+        return parts
+
+    def finish(self) -> list[tuple[str, int]]:
+        remaining: str = "".join(self._pieces)
+        self._pieces = []
+        self._length = 0
+        self._tail = ""
+        return [(remaining, self._count_size(remaining))]
+
+    def _buffer(
+        self,
+        piece: str,
+        /,
+    ) -> None:
+        self._pieces.append(piece)
+        self._length += len(piece)
+        tail_length: int = len(self._splitter) - 1
+        self._tail = (self._tail + piece)[-tail_length:] if tail_length else ""
+
+    def _release(self) -> list[tuple[str, int]]:
+        # release text up to the last secondary splitter or the whole buffer if there is none
+        text: str = "".join(self._pieces)
+        part: str
+        remaining: str
+        match text.rfind(self._alt_splitter):
+            case index if index > 0:
+                part = text[:index]
+                remaining = text[index + len(self._alt_splitter) :]
+
+            case _:
+                part = text
+                remaining = ""
+
+        size: int = self._count_size(part)
+        if size <= self._part_size:
+            # releasing a part which is not exceeding part_size would merge it
+            # using the primary splitter, wait for more text instead
+            self._pieces = [text]
+            self._limit = self._length * 2
+            return []
+
+        self._pieces = []
+        self._length = 0
+        self._tail = ""
+        self._limit = self._buffer_size
+        self._buffer(remaining)
+        return [(part, size)]
@@ -1,10 +1,27 @@
-from draive.tokenization.call import count_text_tokens, tokenize_text
+from draive.tokenization.cache import tokenization_cache
+from draive.tokenization.call import (
+    count_text_tokens,
+    count_texts_tokens,
+    tokenize_text,
+    tokenize_texts,
+)
 from draive.tokenization.state import Tokenization
-from draive.tokenization.text import TextTokenizer
+from draive.tokenization.text import (
+    TextsTokenCounter,
+    TextsTokenizer,
+    TextTokenCounter,
+    TextTokenizer,
+)
 
 __all__ = [
     "count_text_tokens",
+    "count_texts_tokens",
+    "TextsTokenCounter",
+    "TextsTokenizer",
+    "TextTokenCounter",
     "TextTokenizer",
     "Tokenization",
+    "tokenization_cache",
     "tokenize_text",
+    "tokenize_texts",
 ]
@@ -0,0 +1,94 @@
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from hashlib import sha256
+
+from draive.metrics import CacheHitUsage
+from draive.scope import ctx
+from draive.tokenization.call import _count_texts_tokens  # pyright: ignore[reportPrivateUsage]
+from draive.tokenization.state import Tokenization
+
+__all__ = [
+    "tokenization_cache",
+]
+
+
+def tokenization_cache(
+    tokenization: Tokenization,
+    /,
+    *,
+    identifier: Callable[[], str] | str,
+    limit: int = 4096,
+) -> Tokenization:
+    """\
+    Cache token counts of the provided tokenization. \
+    Entries are keyed by the encoding identifier and the text hash, \
+    repeated counting of the same texts i.e. instructions or conversation memory \
+    costs a single lookup. Tokenizing texts is not cached. \
+    Hits and misses are recorded as CacheHitUsage metric named "tokenization" of the current scope.
+
+    Parameters
+    ----------
+    tokenization: Tokenization
+        tokenization used to count tokens of not cached texts
+    identifier: Callable[[], str] | str
+        identifier of the encoding, a function is evaluated within the current scope \
+        i.e. to read model configuration
+    limit: int
+        limit of cached entries, default is 4096
+
+    Returns
+    -------
+    Tokenization
+        tokenization using provided cache
+    """
+    assert limit > 0  # nosec: B101
+    cached: OrderedDict[tuple[str, bytes], int] = OrderedDict()
+
+    def keys(
+        texts: Sequence[str],
+    ) -> list[tuple[str, bytes]]:
+        encoding: str = identifier() if callable(identifier) else identifier
+        return [(encoding, sha256(text.encode(), usedforsecurity=False).digest()) for text in texts]
+
+    def count_texts_tokens(
+        texts: Sequence[str],
+    ) -> list[int]:
+        texts_keys: list[tuple[str, bytes]] = keys(texts)
+        counts: list[int] = [cached.get(key, -1) for key in texts_keys]
+        missing: list[int] = [index for index, count in enumerate(counts) if count < 0]
+        if missing:
+            for index, count in zip(
+                missing,
+                _count_texts_tokens(
+                    tokenization,
+                    texts=[texts[index] for index in missing],
+                ),
+                strict=True,
+            ):
+                counts[index] = count
+                cached[texts_keys[index]] = count
+
+        for key in texts_keys:
+            cached.move_to_end(key)
+
+        while len(cached) > limit:
+            cached.popitem(last=False)
+
+        ctx.record(
+            CacheHitUsage.of(
+                "tokenization",
+                hits=len(texts) - len(missing),
+                misses=len(missing),
+            )
+        )
+        return counts
+
+    def count_text_tokens(
+        text: str,
+    ) -> int:
+        return count_texts_tokens([text])[0]
+
+    return tokenization.updated(
+        count_text_tokens=count_text_tokens,
+        count_texts_tokens=count_texts_tokens,
+    )
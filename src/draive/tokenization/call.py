@@ -1,8 +1,13 @@
+from collections.abc import Sequence
+
 from draive.scope import ctx
 from draive.tokenization.state import Tokenization
 
 __all__ = [
     "count_text_tokens",
+    "count_texts_tokens",
+    "tokenize_text",
+    "tokenize_texts",
 ]
 
 
@@ -12,7 +17,50 @@ def tokenize_text(
     return ctx.state(Tokenization).tokenize_text(text=text)
 
 
+def tokenize_texts(
+    texts: Sequence[str],
+) -> list[list[int]]:
+    tokenization: Tokenization = ctx.state(Tokenization)
+    if tokenize := tokenization.tokenize_texts:
+        return tokenize(texts=texts)
+
+    else:
+        return [tokenization.tokenize_text(text=text) for text in texts]
+
+
 def count_text_tokens(
     text: str,
 ) -> int:
-    return len(ctx.state(Tokenization).tokenize_text(text=text))
+    tokenization: Tokenization = ctx.state(Tokenization)
+    if count := tokenization.count_text_tokens:
+        return count(text=text)
+
+    else:
+        return len(tokenization.tokenize_text(text=text))
+
+
+def count_texts_tokens(
+    texts: Sequence[str],
+) -> list[int]:
+    return _count_texts_tokens(
+        ctx.state(Tokenization),
+        texts=texts,
+    )
+
+
+def _count_texts_tokens(
+    tokenization: Tokenization,
+    /,
+    texts: Sequence[str],
+) -> list[int]:
+    if count := tokenization.count_texts_tokens:
+        return count(texts=texts)
+
+    elif tokenize := tokenization.tokenize_texts:
+        return [len(tokens) for tokens in tokenize(texts=texts)]
+
+    elif count_text := tokenization.count_text_tokens:
+        return [count_text(text=text) for text in texts]
+
+    else:
+        return [len(tokenization.tokenize_text(text=text)) for text in texts]
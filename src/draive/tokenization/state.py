@@ -1,5 +1,10 @@
 from draive.parameters import State
-from draive.tokenization.text import TextTokenizer
+from draive.tokenization.text import (
+    TextsTokenCounter,
+    TextsTokenizer,
+    TextTokenCounter,
+    TextTokenizer,
+)
 
 __all__ = [
     "Tokenization",
@@ -8,3 +13,7 @@ __all__ = [
 
 class Tokenization(State):
     tokenize_text: TextTokenizer
+    # optional specialized implementations, derived from tokenize_text when not provided
+    tokenize_texts: TextsTokenizer | None = None
+    count_text_tokens: TextTokenCounter | None = None
+    count_texts_tokens: TextsTokenCounter | None = None
@@ -1,7 +1,11 @@
+from collections.abc import Sequence
 from typing import Protocol, runtime_checkable
 
 __all__ = [
+    "TextTokenCounter",
     "TextTokenizer",
+    "TextsTokenCounter",
+    "TextsTokenizer",
 ]
 
 
@@ -10,5 +14,28 @@ class TextTokenizer(Protocol):
     def __call__(
         self,
         text: str,
-    ) -> list[int]:
-        ...
+    ) -> list[int]: ...
+
+
+@runtime_checkable
+class TextsTokenizer(Protocol):
+    def __call__(
+        self,
+        texts: Sequence[str],
+    ) -> list[list[int]]: ...
+
+
+@runtime_checkable
+class TextTokenCounter(Protocol):
+    def __call__(
+        self,
+        text: str,
+    ) -> int: ...
+
+
+@runtime_checkable
+class TextsTokenCounter(Protocol):
+    def __call__(
+        self,
+        texts: Sequence[str],
+    ) -> list[int]: ...
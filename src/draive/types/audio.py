@@ -8,17 +8,17 @@ __all__ = [
 ]
 
 
-class AudioURLContent(DataModel):
+class AudioURLContent(DataModel, slots=True):
     audio_url: str
     audio_transcription: str | None = None
 
 
-class AudioBase64Content(DataModel):
+class AudioBase64Content(DataModel, slots=True):
     audio_base64: str
     audio_transcription: str | None = None
 
 
-class AudioDataContent(DataModel):
+class AudioDataContent(DataModel, slots=True):
     audio_data: bytes
     audio_transcription: str | None = None
 
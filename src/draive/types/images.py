@@ -8,17 +8,17 @@ __all__ = [
 ]
 
 
-class ImageURLContent(DataModel):
+class ImageURLContent(DataModel, slots=True):
     image_url: str
     image_description: str | None = None
 
 
-class ImageBase64Content(DataModel):
+class ImageBase64Content(DataModel, slots=True):
     image_base64: str
     image_description: str | None = None
 
 
-class ImageDataContent(DataModel):
+class ImageDataContent(DataModel, slots=True):
     image_data: bytes
     image_description: str | None = None
 
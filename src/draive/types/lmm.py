@@ -21,7 +21,7 @@ __all__ = [
 ]
 
 
-class LMMInstruction(DataModel):
+class LMMInstruction(DataModel, slots=True):
     @classmethod
     def of(
         cls,
@@ -42,14 +42,15 @@ class LMMInstruction(DataModel):
         return bool(self.content)
 
 
-class LMMInput(DataModel):
+class LMMInput(DataModel, slots=True):
     @classmethod
     def of(
         cls,
         content: MultimodalContent | MultimodalContentElement,
         /,
     ) -> Self:
-        return cls(content=MultimodalContent.of(content))
+        # content is validated when making MultimodalContent
+        return cls.unchecked(content=MultimodalContent.of(content))
 
     content: MultimodalContent
 
@@ -57,14 +58,15 @@ class LMMInput(DataModel):
         return bool(self.content)
 
 
-class LMMCompletion(DataModel):
+class LMMCompletion(DataModel, slots=True):
     @classmethod
     def of(
         cls,
         content: MultimodalContent | MultimodalContentElement,
         /,
     ) -> Self:
-        return cls(content=MultimodalContent.of(content))
+        # content is validated when making MultimodalContent
+        return cls.unchecked(content=MultimodalContent.of(content))
 
     content: MultimodalContent
 
@@ -72,14 +74,15 @@ class LMMCompletion(DataModel):
         return bool(self.content)
 
 
-class LMMCompletionChunk(DataModel):
+class LMMCompletionChunk(DataModel, slots=True):
     @classmethod
     def of(
         cls,
         content: MultimodalContent | MultimodalContentElement,
         /,
     ) -> Self:
-        return cls(content=MultimodalContent.of(content))
+        # content is validated when making MultimodalContent
+        return cls.unchecked(content=MultimodalContent.of(content))
 
     content: MultimodalContent
 
@@ -87,20 +90,20 @@ class LMMCompletionChunk(DataModel):
         return bool(self.content)
 
 
-class LMMToolResponse(DataModel):
+class LMMToolResponse(DataModel, slots=True):
     identifier: str
     tool: str
     content: MultimodalContent
     direct: bool
 
 
-class LMMToolRequest(DataModel):
+class LMMToolRequest(DataModel, slots=True):
     identifier: str
     tool: str
     arguments: dict[str, Any] = Field(default_factory=dict)
 
 
-class LMMToolRequests(DataModel):
+class LMMToolRequests(DataModel, slots=True):
     requests: list[LMMToolRequest]
 
 
@@ -1,5 +1,5 @@
 from itertools import chain
-from typing import Self, final
+from typing import Self, cast, final
 
 from draive.parameters.model import DataModel
 from draive.types.audio import AudioBase64Content, AudioContent, AudioDataContent, AudioURLContent
@@ -16,7 +16,7 @@ MultimodalContentElement = VideoContent | ImageContent | AudioContent | str
 
 
 @final
-class MultimodalContent(DataModel):
+class MultimodalContent(DataModel, slots=True):
     @classmethod
     def of(
         cls,
@@ -26,6 +26,16 @@ class MultimodalContent(DataModel):
             case [MultimodalContent() as content]:
                 return content
 
+            case elements if all(isinstance(element, MultimodalContent) for element in elements):
+                # elements of other contents are already validated
+                return cls.unchecked(
+                    elements=tuple(
+                        chain.from_iterable(
+                            cast(MultimodalContent, element).elements for element in elements
+                        )
+                    ),
+                )
+
             case elements:
                 return cls(
                     elements=tuple(chain.from_iterable(_extract(element) for element in elements)),
@@ -58,7 +68,7 @@ class MultimodalContent(DataModel):
         self,
         *other: Self,
     ) -> Self:
-        return self.__class__(
+        return self.__class__.unchecked(
             elements=(
                 *self.elements,
                 *(element for content in other for element in content.elements),
@@ -87,7 +97,7 @@ class MultimodalContent(DataModel):
 
                     joined_elements.append(other)
 
-        return self.__class__(
+        return self.__class__.unchecked(
             elements=tuple(joined_elements),
         )
 
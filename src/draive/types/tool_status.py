@@ -7,7 +7,7 @@ __all__ = [
 ]
 
 
-class ToolCallStatus(DataModel):
+class ToolCallStatus(DataModel, slots=True):
     identifier: str
     tool: str
     status: Literal[
@@ -8,17 +8,17 @@ __all__ = [
 ]
 
 
-class VideoURLContent(DataModel):
+class VideoURLContent(DataModel, slots=True):
     video_url: str
     video_transcription: str | None = None
 
 
-class VideoBase64Content(DataModel):
+class VideoBase64Content(DataModel, slots=True):
     video_base64: str
     video_transcription: str | None = None
 
 
-class VideoDataContent(DataModel):
+class VideoDataContent(DataModel, slots=True):
     video_data: bytes
     video_transcription: str | None = None
 
@@ -1,4 +1,12 @@
-from draive.utils.cache import cache
+from draive.utils.cache import CacheStatistics, cache, cache_statistics
+from draive.utils.cache_backend import (
+    CacheBackend,
+    CacheSerializer,
+    FileCacheBackend,
+    MemoryCacheBackend,
+    PickleCacheSerializer,
+    SQLiteCacheBackend,
+)
 from draive.utils.env import getenv_bool, getenv_float, getenv_int, getenv_str, load_env
 from draive.utils.freeze import freeze
 from draive.utils.logs import setup_logging
@@ -11,6 +19,14 @@ from draive.utils.timeout import timeout
 __all__ = [
     "AsyncStream",
     "cache",
+    "CacheBackend",
+    "CacheSerializer",
+    "FileCacheBackend",
+    "MemoryCacheBackend",
+    "PickleCacheSerializer",
+    "SQLiteCacheBackend",
+    "cache_statistics",
+    "CacheStatistics",
     "freeze",
     "getenv_bool",
     "getenv_float",
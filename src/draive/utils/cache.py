@@ -1,18 +1,45 @@
-from asyncio import AbstractEventLoop, Task, get_running_loop, iscoroutinefunction, shield
-from collections import OrderedDict
-from collections.abc import Callable, Coroutine, Hashable
+import pickle  # nosec: B403
+from asyncio import (
+    AbstractEventLoop,
+    Task,
+    get_running_loop,
+    shield,
+    to_thread,
+)
+from collections import OrderedDict, deque
+from collections.abc import Callable, Coroutine, Hashable, Iterable
+from concurrent.futures import Future
+from dataclasses import fields as dataclass_fields
+from dataclasses import is_dataclass
+from enum import Enum
 from functools import _make_key, partial  # pyright: ignore[reportPrivateUsage]
+from hashlib import sha256
+from inspect import iscoroutinefunction
+from sys import getsizeof
+from threading import Lock
 from time import monotonic
-from typing import NamedTuple, cast, overload
+from types import MethodType
+from typing import Any, NamedTuple, cast, overload
 from weakref import ref
 
+from draive.utils.cache_backend import CacheBackend, CacheSerializer, PickleCacheSerializer
 from draive.utils.mimic import mimic_function
 
 __all__ = [
     "cache",
+    "cache_statistics",
+    "CacheStatistics",
 ]
 
 
+class CacheStatistics(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+
+
 @overload
 def cache[**Args, Result](
     function: Callable[Args, Result],
@@ -25,20 +52,34 @@ def cache[**Args, Result](
     *,
     limit: int = 1,
     expiration: float | None = None,
+    size_limit: int | None = None,
+    failure_expiration: float | None = None,
+    stale_expiration: float | None = None,
+    thread_safe: bool = False,
+    backend: CacheBackend | None = None,
+    serializer: CacheSerializer[Any] | None = None,
 ) -> Callable[[Callable[Args, Result]], Callable[Args, Result]]: ...
 
 
-def cache[**Args, Result](
+def cache[**Args, Result](  # noqa: PLR0913
     function: Callable[Args, Result] | None = None,
     *,
     limit: int = 1,
     expiration: float | None = None,
+    size_limit: int | None = None,
+    failure_expiration: float | None = None,
+    stale_expiration: float | None = None,
+    thread_safe: bool = False,
+    backend: CacheBackend | None = None,
+    serializer: CacheSerializer[Any] | None = None,
 ) -> Callable[[Callable[Args, Result]], Callable[Args, Result]] | Callable[Args, Result]:
     """\
     Simple lru function result cache with optional expire time. \
     Works for both sync and async functions. \
     It is not allowed to be used on class methods. \
-    This wrapper is not thread safe.
+    This wrapper is not thread safe unless thread_safe is set. \
+    Statistics of the cache can be read using cache_statistics. \
+    Results are kept in memory as they are unless a backend is provided.
 
     Parameters
     ----------
@@ -47,7 +88,41 @@ def cache[**Args, Result](
     limit: int
         limit of cache entries to keep, default is 1
     expiration: float | None
-        entries expiration time in seconds, default is None (not expiring)
+        entries expiration time in seconds, default is None (not expiring). \
+        Expired entries are removed on each access to the cache
+    size_limit: int | None
+        soft limit of the estimated total size of entries in bytes, default is None (no limit). \
+        Least recently used entries are evicted when exceeding, the most recent entry \
+        is kept regardless of its size. Size of async function results is accounted \
+        when completed. Ignored when using backend
+    failure_expiration: float | None
+        expiration time in seconds of failed async function results, 0 removes failed results \
+        as soon as they fail, default is None (same as expiration). Sync functions and \
+        functions using backend do not cache failures
+    stale_expiration: float | None
+        time in seconds for which async function results are still returned after expiration \
+        while refreshing them in the background, default is None (not returning stale results). \
+        Failed refresh keeps the stale result, refresh is retried after failure_expiration. \
+        Used only together with expiration and without backend
+    thread_safe: bool
+        guard sync function cache with a lock allowing to use it from multiple threads, \
+        concurrent calls with the same arguments wait for a single computation of the result, \
+        default is False. Async functions share results using tasks bound to a single event loop \
+        and are not affected
+    backend: CacheBackend | None
+        backend storing serialized results i.e. SQLiteCacheBackend to keep results \
+        between restarts, default is None (keeping results in memory without serialization). \
+        When using a backend entries are limited by the backend instead of limit, \
+        arguments are encoded canonically and hashed to make entry keys \
+        prefixed with the function qualified name. Methods are keyed by values \
+        of parametrized or dataclass instances and by the type name for other instances, \
+        sharing entries between them. Calls with arguments which can't be encoded \
+        i.e. locks or local functions are not cached. Backends are thread safe, \
+        concurrent calls with the same arguments share a single computation \
+        within the same event loop for async functions only
+    serializer: CacheSerializer[Any] | None
+        serializer of results used with backend, default is PickleCacheSerializer. \
+        DataModel results can use DataModel.cache_serializer()
 
     Returns
     -------
@@ -56,15 +131,53 @@ def cache[**Args, Result](
     """
 
     def _wrap(function: Callable[Args, Result]) -> Callable[Args, Result]:
-        if iscoroutinefunction(function):
+        if backend is not None:
+            if iscoroutinefunction(function):
+                return cast(
+                    Callable[Args, Result],
+                    _BackendAsyncCache(
+                        function,
+                        backend=backend,
+                        serializer=serializer or PickleCacheSerializer(),
+                        expiration=expiration,
+                    ),
+                )
+
+            else:
+                return cast(
+                    Callable[Args, Result],
+                    _BackendSyncCache(
+                        function,
+                        backend=backend,
+                        serializer=serializer or PickleCacheSerializer(),
+                        expiration=expiration,
+                    ),
+                )
+
+        elif iscoroutinefunction(function):
             return cast(
                 Callable[Args, Result],
                 _AsyncCache(
                     function,
                     limit=limit,
                     expiration=expiration,
+                    size_limit=size_limit,
+                    failure_expiration=failure_expiration,
+                    stale_expiration=stale_expiration,
                 ),
             )
+
+        elif thread_safe:
+            return cast(
+                Callable[Args, Result],
+                _ThreadSafeSyncCache(
+                    function,
+                    limit=limit,
+                    expiration=expiration,
+                    size_limit=size_limit,
+                ),
+            )
+
         else:
             return cast(
                 Callable[Args, Result],
@@ -72,6 +185,7 @@ def cache[**Args, Result](
                     function,
                     limit=limit,
                     expiration=expiration,
+                    size_limit=size_limit,
                 ),
             )
 
@@ -81,36 +195,298 @@ def cache[**Args, Result](
         return _wrap
 
 
+def cache_statistics(
+    function: Callable[..., Any],
+    /,
+) -> CacheStatistics:
+    """\
+    Read statistics of a function wrapped in cache. \
+    Methods share statistics of a single cache across all instances. \
+    Caches using a backend count only hits and misses.
+
+    Parameters
+    ----------
+    function: Callable[..., Any]
+        function wrapped in cache
+
+    Returns
+    -------
+    CacheStatistics
+        current statistics of the cache
+
+    Raises
+    ------
+    ValueError
+        when function is not wrapped in cache
+    """
+    cached: object = function
+    # methods are accessed through partial of the cache method call
+    if isinstance(cached, partial) and isinstance(cached.func, MethodType):
+        cached = cached.func.__self__
+
+    if isinstance(cached, _SyncCache | _AsyncCache | _BackendSyncCache | _BackendAsyncCache):
+        return cast(
+            _SyncCache[..., Any]
+            | _AsyncCache[..., Any]
+            | _BackendSyncCache[..., Any]
+            | _BackendAsyncCache[..., Any],
+            cached,
+        ).statistics
+
+    else:
+        raise ValueError(f"{function} is not wrapped in cache")
+
+
 class _CacheEntry[Entry](NamedTuple):
     value: Entry
     expire: float | None
+    size: int
 
 
-class _SyncCache[**Args, Result]:
+class _CacheEntries[Entry]:
+    # lru entries with expiration swept in the order of expire time
     def __init__(
         self,
-        function: Callable[Args, Result],
-        /,
+        *,
         limit: int,
         expiration: float | None,
+        size_limit: int | None,
     ) -> None:
-        self._function: Callable[Args, Result] = function
-        self._cached: OrderedDict[Hashable, _CacheEntry[Result]] = OrderedDict()
+        self._entries: OrderedDict[Hashable, _CacheEntry[Entry]] = OrderedDict()
+        # queue of expire times per expiration - appending keeps expire times ordered
+        self._expiring: dict[float, deque[tuple[float, Hashable]]] = {}
         self._limit: int = limit
-        if expiration := expiration:
+        self._expiration: float | None = expiration
+        self._size_limit: int | None = size_limit
+        self._size: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
 
-            def next_expire_time() -> float | None:
-                return monotonic() + expiration
-        else:
+    def __len__(self) -> int:
+        return len(self._entries)
 
-            def next_expire_time() -> float | None:
+    def get(
+        self,
+        key: Hashable,
+        /,
+    ) -> _CacheEntry[Entry] | None:
+        if self._expiring:
+            self._expire(monotonic())
+
+        match self._entries.get(key):
+            case None:
                 return None
 
-        self._next_expire_time: Callable[[], float | None] = next_expire_time
+            case entry:
+                self._entries.move_to_end(key)
+                return entry
+
+    def put(
+        self,
+        key: Hashable,
+        value: Entry,
+        /,
+        *,
+        size: int,
+    ) -> None:
+        if replaced := self._entries.pop(key, None):
+            self._size -= replaced.size
+
+        expire: float | None
+        if expiration := self._expiration:
+            expire = self._expire_after(key, expiration)
+
+        else:
+            expire = None
+
+        self._entries[key] = _CacheEntry(
+            value=value,
+            expire=expire,
+            size=size,
+        )
+        self._size += size
+        self._evict()
+
+    def resize(
+        self,
+        key: Hashable,
+        value: Entry,
+        /,
+        *,
+        size: int,
+    ) -> None:
+        match self._entries.get(key):
+            case None:
+                pass  # already removed
+
+            case entry if entry.value is value:
+                # replacing value of existing key keeps its lru position
+                self._entries[key] = entry._replace(size=size)
+                self._size += size - entry.size
+                self._evict()
+
+            case _:
+                pass  # already replaced
+
+    def expire(
+        self,
+        key: Hashable,
+        value: Entry,
+        /,
+        *,
+        expiration: float,
+    ) -> None:
+        match self._entries.get(key):
+            case None:
+                pass  # already removed
+
+            case entry if entry.value is value:
+                if expiration > 0:
+                    self._entries[key] = entry._replace(expire=self._expire_after(key, expiration))
+
+                else:
+                    del self._entries[key]
+                    self._size -= entry.size
+                    self.evictions += 1
+
+            case _:
+                pass  # already replaced
+
+    def _expire_after(
+        self,
+        key: Hashable,
+        expiration: float,
+        /,
+    ) -> float:
+        expire: float = monotonic() + expiration
+        if queue := self._expiring.get(expiration):
+            queue.append((expire, key))
+
+        else:
+            self._expiring[expiration] = deque(((expire, key),))
+
+        return expire
+
+    def _evict(self) -> None:
+        while len(self._entries) > self._limit:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= evicted.size
+            self.evictions += 1
+
+        if (size_limit := self._size_limit) is not None:
+            # soft limit - the most recently used entry is kept even when exceeding it
+            while self._size > size_limit and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+                self.evictions += 1
+
+    def _expire(
+        self,
+        now: float,
+        /,
+    ) -> None:
+        for queue in self._expiring.values():
+            while queue and queue[0][0] < now:
+                expire, key = queue.popleft()
+                match self._entries.get(key):
+                    case None:
+                        pass  # already removed
+
+                    case entry if entry.expire == expire:
+                        del self._entries[key]
+                        self._size -= entry.size
+                        self.expirations += 1
+
+                    case _:
+                        pass  # replaced or expiring at a different time
+
+
+def _estimated_size(
+    value: Any,
+    /,
+    *,
+    depth: int = 4,
+) -> int:
+    # approximate memory used by value, shared objects are counted multiple times
+    size: int = getsizeof(value)
+    if depth <= 0:
+        return size
+
+    match value:
+        case str() | bytes() | int() | float() | None:
+            return size
+
+        case dict():
+            return size + sum(
+                _estimated_size(key, depth=depth - 1) + _estimated_size(element, depth=depth - 1)
+                for key, element in cast(dict[Any, Any], value).items()
+            )
+
+        case list() | tuple() | set() | frozenset():
+            return size + sum(
+                _estimated_size(element, depth=depth - 1) for element in cast(Iterable[Any], value)
+            )
+
+        case _:
+            try:
+                return size + _estimated_size(vars(value), depth=depth - 1)
+
+            except TypeError:  # no attributes dict i.e. using slots
+                return size + sum(
+                    _estimated_size(getattr(value, name), depth=depth - 1)
+                    for name in _slots(cast(type[Any], type(value)))
+                    if hasattr(value, name)
+                )
+
+
+def _slots(
+    cls: type[Any],
+    /,
+) -> Iterable[str]:
+    for base in cls.__mro__:
+        match getattr(base, "__slots__", ()):
+            case str() as slot:
+                if slot != "__weakref__":
+                    yield slot
+
+            case slots:
+                for slot in cast(Iterable[str], slots):
+                    if slot != "__weakref__":
+                        yield slot
+
+
+class _SyncCache[**Args, Result]:
+    def __init__(
+        self,
+        function: Callable[Args, Result],
+        /,
+        limit: int,
+        expiration: float | None,
+        size_limit: int | None,
+    ) -> None:
+        self._function: Callable[Args, Result] = function
+        self._cached: _CacheEntries[Result] = _CacheEntries(
+            limit=limit,
+            expiration=expiration,
+            size_limit=size_limit,
+        )
+        self._sized: bool = size_limit is not None
+        self._hits: int = 0
+        self._misses: int = 0
 
         # mimic function attributes if able
         mimic_function(function, within=self)
 
+    @property
+    def statistics(self) -> CacheStatistics:
+        return CacheStatistics(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._cached.evictions,
+            expirations=self._cached.expirations,
+            size=len(self._cached),
+        )
+
     def __get__(
         self,
         instance: object,
@@ -133,33 +509,15 @@ class _SyncCache[**Args, Result]:
         *args: Args.args,
         **kwargs: Args.kwargs,
     ) -> Result:
-        key: Hashable = _make_key(
+        return self._resolve(
+            _make_key(
+                args=args,
+                kwds=kwargs,
+                typed=True,
+            ),
             args=args,
-            kwds=kwargs,
-            typed=True,
-        )
-
-        match self._cached.get(key):
-            case None:
-                pass
-
-            case entry:
-                if (expire := entry[1]) and expire < monotonic():
-                    # if still running let it complete if able
-                    del self._cached[key]  # continue the same way as if empty
-                else:
-                    self._cached.move_to_end(key)
-                    return entry[0]
-
-        result: Result = self._function(*args, **kwargs)
-        self._cached[key] = _CacheEntry(
-            value=result,
-            expire=self._next_expire_time(),
+            kwargs=kwargs,
         )
-        if len(self._cached) > self._limit:
-            # if still running let it complete if able
-            self._cached.popitem(last=False)
-        return result
 
     def __method_call__(
         self,
@@ -167,60 +525,158 @@ class _SyncCache[**Args, Result]:
         *args: Args.args,
         **kwargs: Args.kwargs,
     ) -> Result:
-        key: Hashable = _make_key(
-            args=(ref(__method_self), *args),
-            kwds=kwargs,
-            typed=True,
+        return self._resolve(
+            _make_key(
+                args=(ref(__method_self), *args),
+                kwds=kwargs,
+                typed=True,
+            ),
+            args=(__method_self, *args),
+            kwargs=kwargs,
         )
 
-        match self._cached.get(key):
-            case None:
-                pass
+    def _resolve(
+        self,
+        key: Hashable,
+        /,
+        *,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Result:
+        if entry := self._cached.get(key):
+            self._hits += 1
+            return entry.value
 
-            case entry:
-                if (expire := entry[1]) and expire < monotonic():
-                    # if still running let it complete if able
-                    del self._cached[key]  # continue the same way as if empty
-                else:
-                    self._cached.move_to_end(key)
-                    return entry[0]
+        self._misses += 1
+        result: Result = self._function(*args, **kwargs)
+        self._store(key, result)
+        return result
 
-        result: Result = self._function(__method_self, *args, **kwargs)  # pyright: ignore[reportUnknownVariableType, reportCallIssue]
-        self._cached[key] = _CacheEntry(
-            value=result,  # pyright: ignore[reportUnknownArgumentType]
-            expire=self._next_expire_time(),
+    def _store(
+        self,
+        key: Hashable,
+        value: Result,
+        /,
+    ) -> None:
+        self._cached.put(
+            key,
+            value,
+            size=_estimated_size(value) if self._sized else 0,
         )
-        if len(self._cached) > self._limit:
-            # if still running let it complete if able
-            self._cached.popitem(last=False)
-        return result  # pyright: ignore[reportUnknownArgumentType, reportUnknownVariableType]
 
 
-class _AsyncCache[**Args, Result]:
+class _ThreadSafeSyncCache[**Args, Result](_SyncCache[Args, Result]):
     def __init__(
         self,
-        function: Callable[Args, Coroutine[None, None, Result]],
+        function: Callable[Args, Result],
         /,
         limit: int,
         expiration: float | None,
+        size_limit: int | None,
     ) -> None:
-        self._function: Callable[Args, Coroutine[None, None, Result]] = function
-        self._cached: OrderedDict[Hashable, _CacheEntry[Task[Result]]] = OrderedDict()
-        self._limit: int = limit
-        if expiration := expiration:
+        super().__init__(
+            function,
+            limit=limit,
+            expiration=expiration,
+            size_limit=size_limit,
+        )
+        self._lock: Lock = Lock()
+        self._pending: dict[Hashable, Future[Result]] = {}
 
-            def next_expire_time() -> float | None:
-                return monotonic() + expiration
-        else:
+    @property
+    def statistics(self) -> CacheStatistics:
+        with self._lock:
+            return super().statistics
 
-            def next_expire_time() -> float | None:
-                return None
+    def _resolve(
+        self,
+        key: Hashable,
+        /,
+        *,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Result:
+        with self._lock:
+            if entry := self._cached.get(key):
+                self._hits += 1
+                return entry.value
+
+            pending: Future[Result] | None = self._pending.get(key)
+            computing: bool = pending is None
+            if pending is None:
+                self._misses += 1
+                pending = Future()
+                self._pending[key] = pending
+
+            else:  # computed by other thread - wait for its result
+                self._hits += 1
 
-        self._next_expire_time: Callable[[], float | None] = next_expire_time
+        if not computing:
+            return pending.result()
+
+        try:
+            result: Result = self._function(*args, **kwargs)
+
+        except BaseException as exc:
+            with self._lock:
+                del self._pending[key]
+
+            pending.set_exception(exc)
+            raise exc
+
+        with self._lock:
+            del self._pending[key]
+            self._store(key, result)
+
+        pending.set_result(result)
+        return result
+
+
+def _succeeded(
+    task: Task[Any],
+    /,
+) -> bool:
+    return not task.cancelled() and task.exception() is None
+
+
+class _AsyncCache[**Args, Result]:
+    def __init__(  # noqa: PLR0913
+        self,
+        function: Callable[Args, Coroutine[None, None, Result]],
+        /,
+        limit: int,
+        expiration: float | None,
+        size_limit: int | None,
+        failure_expiration: float | None,
+        stale_expiration: float | None,
+    ) -> None:
+        self._function: Callable[Args, Coroutine[None, None, Result]] = function
+        self._cached: _CacheEntries[Task[Result]] = _CacheEntries(
+            limit=limit,
+            # stale entries are kept until their stale period ends
+            expiration=expiration + (stale_expiration or 0) if expiration else None,
+            size_limit=size_limit,
+        )
+        self._sized: bool = size_limit is not None
+        self._failure_expiration: float | None = failure_expiration
+        self._stale_expiration: float | None = stale_expiration if expiration else None
+        self._refreshing: dict[Hashable, Task[Result]] = {}
+        self._hits: int = 0
+        self._misses: int = 0
 
         # mimic function attributes if able
         mimic_function(function, within=self)
 
+    @property
+    def statistics(self) -> CacheStatistics:
+        return CacheStatistics(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._cached.evictions,
+            expirations=self._cached.expirations,
+            size=len(self._cached),
+        )
+
     def __get__(
         self,
         instance: object,
@@ -243,68 +699,515 @@ class _AsyncCache[**Args, Result]:
         *args: Args.args,
         **kwargs: Args.kwargs,
     ) -> Result:
-        loop: AbstractEventLoop = get_running_loop()
-        key: Hashable = _make_key(
+        return await self._resolve(
+            _make_key(
+                args=args,
+                kwds=kwargs,
+                typed=True,
+            ),
             args=args,
-            kwds=kwargs,
-            typed=True,
+            kwargs=kwargs,
         )
 
+    async def __method_call__(
+        self,
+        __method_self: object,
+        *args: Args.args,
+        **kwargs: Args.kwargs,
+    ) -> Result:
+        return await self._resolve(
+            _make_key(
+                args=(ref(__method_self), *args),
+                kwds=kwargs,
+                typed=True,
+            ),
+            args=(__method_self, *args),
+            kwargs=kwargs,
+        )
+
+    async def _resolve(
+        self,
+        key: Hashable,
+        /,
+        *,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Result:
+        # expired or evicted tasks which are still running are allowed to complete
         match self._cached.get(key):
             case None:
                 pass
 
+            case entry if (
+                (stale_expiration := self._stale_expiration)
+                and entry.expire is not None
+                and entry.expire - stale_expiration < monotonic()
+                and entry.value.done()
+                # failures have their own expiration without the stale period
+                and (self._failure_expiration is None or _succeeded(entry.value))
+            ):
+                if _succeeded(entry.value):
+                    self._hits += 1
+                    # serve the stale result while refreshing it in the background
+                    self._refresh(
+                        key,
+                        args=args,
+                        kwargs=kwargs,
+                    )
+                    return entry.value.result()
+
+                # stale failure - compute again the same way as if empty
+
             case entry:
-                if (expire := entry[1]) and expire < monotonic():
-                    # if still running let it complete if able
-                    del self._cached[key]  # continue the same way as if empty
+                self._hits += 1
+                return await shield(entry.value)
+
+        self._misses += 1
+        task: Task[Result] = get_running_loop().create_task(self._function(*args, **kwargs))
+        self._store(key, task)
+        return await shield(task)
+
+    def _store(
+        self,
+        key: Hashable,
+        task: Task[Result],
+        /,
+    ) -> None:
+        self._cached.put(
+            key,
+            task,
+            size=0,  # size is known when completed
+        )
+        if self._sized or self._failure_expiration is not None:
+            task.add_done_callback(partial(self._completed, key))
+
+    def _completed(
+        self,
+        key: Hashable,
+        task: Task[Result],
+        /,
+    ) -> None:
+        if not _succeeded(task):
+            if self._failure_expiration is not None:
+                self._cached.expire(
+                    key,
+                    task,
+                    expiration=self._failure_expiration,
+                )
+
+        elif self._sized:
+            self._cached.resize(
+                key,
+                task,
+                size=_estimated_size(task.result()),
+            )
+
+    def _refresh(
+        self,
+        key: Hashable,
+        /,
+        *,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        if key in self._refreshing:
+            return  # already refreshing
+
+        loop: AbstractEventLoop = get_running_loop()
+        task: Task[Result] = loop.create_task(self._function(*args, **kwargs))
+        self._refreshing[key] = task
+
+        def refreshed(
+            task: Task[Result],
+            /,
+        ) -> None:
+            if not _succeeded(task):
+                # keep serving the stale result, retry after failure expiration if any
+                if failure_expiration := self._failure_expiration:
+                    loop.call_later(failure_expiration, self._refreshing.pop, key, None)
+
                 else:
-                    self._cached.move_to_end(key)
-                    return await shield(entry[0])
+                    del self._refreshing[key]
+
+            else:
+                del self._refreshing[key]
+                self._store(key, task)
+
+        task.add_done_callback(refreshed)
+
+
+def _backend_key(
+    prefix: str,
+    /,
+    *,
+    instance: object | None,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> str | None:
+    # keys have to be the same across processes - hash of canonically encoded arguments
+    # returns None when arguments can't be encoded
+    try:
+        arguments: str = _canonical_key((args, kwargs))
+        if instance is not None:
+            arguments = f"{_instance_key(instance)}:{arguments}"
+
+    except _UnencodableKey:
+        return None
+
+    return f"{prefix}:{sha256(arguments.encode()).hexdigest()}"
+
+
+class _UnencodableKey(Exception):
+    pass
+
+
+def _instance_key(
+    instance: object,
+    /,
+) -> str:
+    # instances holding data are identified by their values, other by their type
+    if hasattr(instance.__class__, "__PARAMETERS__") or is_dataclass(instance):
+        return _canonical_key(instance)
+
+    else:
+        return f"{instance.__class__.__module__}.{instance.__class__.__qualname__}"
+
+
+def _canonical_key(  # noqa: PLR0911
+    value: Any,
+    /,
+) -> str:
+    # encoding independent of the process i.e. of the hash based ordering of sets
+    match value:
+        case Enum() as member:
+            return f"{member.__class__.__qualname__}.{member.name}"
+
+        case None | bool() | int() | float() | str() | bytes():
+            return repr(value)
+
+        case tuple():
+            return f"({','.join(_canonical_key(element) for element in value)})"  # pyright: ignore[reportUnknownVariableType]
+
+        case list():
+            return f"[{','.join(_canonical_key(element) for element in value)}]"  # pyright: ignore[reportUnknownVariableType]
+
+        case set() | frozenset():
+            return f"{{{','.join(sorted(_canonical_key(element) for element in value))}}}"  # pyright: ignore[reportUnknownVariableType]
+
+        case dict():
+            return "{{{}}}".format(
+                ",".join(
+                    sorted(
+                        f"{_canonical_key(key)}:{_canonical_key(element)}"
+                        for key, element in cast(dict[Any, Any], value).items()
+                    )
+                )
+            )
+
+        case parametrized if hasattr(parametrized.__class__, "__PARAMETERS__"):
+            return f"{parametrized.__class__.__qualname__}" + _canonical_key(
+                {name: getattr(parametrized, name) for name in parametrized.__PARAMETERS__}
+            )
+
+        case dataclass if is_dataclass(dataclass) and not isinstance(dataclass, type):
+            return f"{dataclass.__class__.__qualname__}" + _canonical_key(
+                {
+                    field.name: getattr(dataclass, field.name)
+                    for field in dataclass_fields(dataclass)
+                }
+            )
+
+        case other:
+            return _represented_key(other)
 
-        task: Task[Result] = loop.create_task(self._function(*args, **kwargs))  # pyright: ignore[reportCallIssue]
-        self._cached[key] = _CacheEntry(
-            value=task,
-            expire=self._next_expire_time(),
+
+def _represented_key(
+    value: Any,
+    /,
+) -> str:
+    if value.__class__.__repr__ is not object.__repr__:
+        representation: str = repr(value)
+        # representations i.e. of functions or locks contain the memory address
+        if " at 0x" not in representation:
+            return f"{value.__class__.__qualname__}:{representation}"
+
+    # default representation contains the memory address
+    try:
+        return sha256(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)).hexdigest()
+
+    except (pickle.PicklingError, TypeError, AttributeError) as exc:
+        raise _UnencodableKey() from exc
+
+
+class _BackendSyncCache[**Args, Result]:
+    def __init__(
+        self,
+        function: Callable[Args, Result],
+        /,
+        backend: CacheBackend,
+        serializer: CacheSerializer[Result],
+        expiration: float | None,
+    ) -> None:
+        self._function: Callable[Args, Result] = function
+        self._backend: CacheBackend = backend
+        self._serializer: CacheSerializer[Result] = serializer
+        self._expiration: float | None = expiration
+        self._prefix: str = f"{function.__module__}.{function.__qualname__}"
+        self._hits: int = 0
+        self._misses: int = 0
+
+        # mimic function attributes if able
+        mimic_function(function, within=self)
+
+    @property
+    def statistics(self) -> CacheStatistics:
+        return CacheStatistics(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=0,
+            expirations=0,
+            size=0,
         )
-        if len(self._cached) > self._limit:
-            # if still running let it complete if able
-            self._cached.popitem(last=False)
-        return await shield(task)
 
-    async def __method_call__(
+    def __get__(
+        self,
+        instance: object,
+        owner: type | None = None,
+        /,
+    ) -> Callable[Args, Result]:
+        if owner is None:
+            return self
+        else:
+            return mimic_function(
+                self._function,
+                within=partial(
+                    self.__method_call__,
+                    instance,
+                ),
+            )
+
+    def __call__(
+        self,
+        *args: Args.args,
+        **kwargs: Args.kwargs,
+    ) -> Result:
+        return self._resolve(
+            instance=None,
+            args=args,
+            kwargs=kwargs,
+        )
+
+    def __method_call__(
         self,
         __method_self: object,
         *args: Args.args,
         **kwargs: Args.kwargs,
     ) -> Result:
-        loop: AbstractEventLoop = get_running_loop()
-        key: Hashable = _make_key(
-            args=(ref(__method_self), *args),
-            kwds=kwargs,
-            typed=True,
+        return self._resolve(
+            instance=__method_self,
+            args=args,
+            kwargs=kwargs,
         )
 
-        match self._cached.get(key):
-            case None:
-                pass
+    def _resolve(
+        self,
+        *,
+        instance: object | None,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Result:
+        key: str | None = _backend_key(
+            self._prefix,
+            instance=instance,
+            args=args,
+            kwargs=kwargs,
+        )
+        if key is None:  # arguments can't be encoded - skip caching
+            self._misses += 1
+            return self._compute(
+                instance=instance,
+                args=args,
+                kwargs=kwargs,
+            )
 
-            case entry:
-                if (expire := entry[1]) and expire < monotonic():
-                    # if still running let it complete if able
-                    del self._cached[key]  # continue the same way as if empty
-                else:
-                    self._cached.move_to_end(key)
-                    return await shield(entry[0])
+        if (data := self._backend.load(key)) is not None:
+            self._hits += 1
+            return self._serializer.decode(data)
 
-        task: Task[Result] = loop.create_task(
-            self._function(__method_self, *args, **kwargs),  # pyright: ignore[reportCallIssue, reportUnknownArgumentType]
+        self._misses += 1
+        result: Result = self._compute(
+            instance=instance,
+            args=args,
+            kwargs=kwargs,
         )
-        self._cached[key] = _CacheEntry(
-            value=task,
-            expire=self._next_expire_time(),
+        self._backend.store(
+            key,
+            self._serializer.encode(result),
+            expiration=self._expiration,
+        )
+        return result
+
+    def _compute(
+        self,
+        *,
+        instance: object | None,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Result:
+        if instance is None:
+            return self._function(*args, **kwargs)
+
+        else:
+            return cast(Callable[..., Result], self._function)(instance, *args, **kwargs)
+
+
+class _BackendAsyncCache[**Args, Result]:
+    def __init__(
+        self,
+        function: Callable[Args, Coroutine[None, None, Result]],
+        /,
+        backend: CacheBackend,
+        serializer: CacheSerializer[Result],
+        expiration: float | None,
+    ) -> None:
+        self._function: Callable[Args, Coroutine[None, None, Result]] = function
+        self._backend: CacheBackend = backend
+        self._serializer: CacheSerializer[Result] = serializer
+        self._expiration: float | None = expiration
+        self._prefix: str = f"{function.__module__}.{function.__qualname__}"
+        self._pending: dict[str, Task[Result]] = {}
+        self._hits: int = 0
+        self._misses: int = 0
+
+        # mimic function attributes if able
+        mimic_function(function, within=self)
+
+    @property
+    def statistics(self) -> CacheStatistics:
+        return CacheStatistics(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=0,
+            expirations=0,
+            size=0,
         )
-        if len(self._cached) > self._limit:
-            # if still running let it complete if able
-            self._cached.popitem(last=False)
+
+    def __get__(
+        self,
+        instance: object,
+        owner: type | None = None,
+        /,
+    ) -> Callable[Args, Coroutine[None, None, Result]]:
+        if owner is None:
+            return self
+        else:
+            return mimic_function(
+                self._function,
+                within=partial(
+                    self.__method_call__,
+                    instance,
+                ),
+            )
+
+    async def __call__(
+        self,
+        *args: Args.args,
+        **kwargs: Args.kwargs,
+    ) -> Result:
+        return await self._resolve(
+            instance=None,
+            args=args,
+            kwargs=kwargs,
+        )
+
+    async def __method_call__(
+        self,
+        __method_self: object,
+        *args: Args.args,
+        **kwargs: Args.kwargs,
+    ) -> Result:
+        return await self._resolve(
+            instance=__method_self,
+            args=args,
+            kwargs=kwargs,
+        )
+
+    async def _resolve(
+        self,
+        *,
+        instance: object | None,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Result:
+        key: str | None = _backend_key(
+            self._prefix,
+            instance=instance,
+            args=args,
+            kwargs=kwargs,
+        )
+        if key is None:  # arguments can't be encoded - skip caching
+            self._misses += 1
+            return await self._compute(
+                instance=instance,
+                args=args,
+                kwargs=kwargs,
+            )
+
+        if pending := self._pending.get(key):
+            self._hits += 1
+            return await shield(pending)
+
+        task: Task[Result] = get_running_loop().create_task(
+            self._load_or_compute(
+                key,
+                instance=instance,
+                args=args,
+                kwargs=kwargs,
+            )
+        )
+        self._pending[key] = task
+        task.add_done_callback(lambda _: self._pending.pop(key, None))
         return await shield(task)
+
+    async def _load_or_compute(
+        self,
+        key: str,
+        /,
+        *,
+        instance: object | None,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Result:
+        # backends may block - access them from a worker thread
+        if (data := await to_thread(self._backend.load, key)) is not None:
+            self._hits += 1
+            return self._serializer.decode(data)
+
+        self._misses += 1
+        result: Result = await self._compute(
+            instance=instance,
+            args=args,
+            kwargs=kwargs,
+        )
+        await to_thread(
+            self._backend.store,
+            key,
+            self._serializer.encode(result),
+            expiration=self._expiration,
+        )
+        return result
+
+    async def _compute(
+        self,
+        *,
+        instance: object | None,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Result:
+        if instance is None:
+            return await self._function(*args, **kwargs)
+
+        else:
+            return await cast(Callable[..., Coroutine[None, None, Result]], self._function)(
+                instance, *args, **kwargs
+            )
@@ -0,0 +1,489 @@
+import pickle  # nosec: B403
+import sqlite3
+from collections import OrderedDict
+from hashlib import sha256
+from os import replace, scandir, utime
+from pathlib import Path
+from struct import Struct
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from time import monotonic, time
+from typing import Any, NamedTuple, Protocol, runtime_checkable
+
+__all__ = [
+    "CacheBackend",
+    "CacheSerializer",
+    "FileCacheBackend",
+    "MemoryCacheBackend",
+    "PickleCacheSerializer",
+    "SQLiteCacheBackend",
+]
+
+
+@runtime_checkable
+class CacheSerializer[Value](Protocol):
+    def encode(
+        self,
+        value: Value,
+        /,
+    ) -> bytes: ...
+
+    def decode(
+        self,
+        data: bytes,
+        /,
+    ) -> Value: ...
+
+
+class PickleCacheSerializer(CacheSerializer[Any]):
+    """\
+    Cache serializer using pickle. Do not use it with backends \
+    which can be modified by untrusted parties.
+    """
+
+    def encode(
+        self,
+        value: Any,
+        /,
+    ) -> bytes:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def decode(
+        self,
+        data: bytes,
+        /,
+    ) -> Any:
+        return pickle.loads(data)  # nosec: B301
+
+
+@runtime_checkable
+class CacheBackend(Protocol):
+    """\
+    Storage of serialized cache entries. Backends have to be thread safe, \
+    expired entries can't be returned from load.
+    """
+
+    def load(
+        self,
+        key: str,
+        /,
+    ) -> bytes | None: ...
+
+    def store(
+        self,
+        key: str,
+        value: bytes,
+        /,
+        *,
+        expiration: float | None,
+    ) -> None: ...
+
+
+class _MemoryEntry(NamedTuple):
+    value: bytes
+    expire: float | None
+
+
+class MemoryCacheBackend(CacheBackend):
+    """\
+    Cache backend keeping serialized entries in memory of the current process. \
+    Least recently used entries are evicted when exceeding limits.
+
+    Parameters
+    ----------
+    limit: int | None
+        limit of entries to keep, default is None (no limit)
+    size_limit: int | None
+        limit of total size of entries in bytes, default is None (no limit)
+    """
+
+    def __init__(
+        self,
+        *,
+        limit: int | None = None,
+        size_limit: int | None = None,
+    ) -> None:
+        self._entries: OrderedDict[str, _MemoryEntry] = OrderedDict()
+        self._size: int = 0
+        self._limit: int | None = limit
+        self._size_limit: int | None = size_limit
+        self._lock: Lock = Lock()
+
+    def load(
+        self,
+        key: str,
+        /,
+    ) -> bytes | None:
+        with self._lock:
+            match self._entries.get(key):
+                case None:
+                    return None
+
+                case entry:
+                    if (expire := entry.expire) and expire < monotonic():
+                        del self._entries[key]
+                        self._size -= len(entry.value)
+                        return None
+
+                    else:
+                        self._entries.move_to_end(key)
+                        return entry.value
+
+    def store(
+        self,
+        key: str,
+        value: bytes,
+        /,
+        *,
+        expiration: float | None,
+    ) -> None:
+        with self._lock:
+            if replaced := self._entries.pop(key, None):
+                self._size -= len(replaced.value)
+
+            self._entries[key] = _MemoryEntry(
+                value=value,
+                expire=monotonic() + expiration if expiration else None,
+            )
+            self._size += len(value)
+
+            while self._entries and (
+                (self._limit is not None and len(self._entries) > self._limit)
+                or (self._size_limit is not None and self._size > self._size_limit)
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.value)
+
+
+_SQLITE_ACCESS_BATCH: int = 256  # loads between writes of access times
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """\
+    Cache backend using local SQLite database. Database file can be shared \
+    by multiple processes on the same host, entries survive restarts. \
+    Least recently used entries are evicted when exceeding limits, \
+    access times are written in batches and on stores.
+
+    Parameters
+    ----------
+    path: Path | str
+        path to the database file
+    limit: int | None
+        limit of entries to keep, default is None (no limit)
+    size_limit: int | None
+        limit of total size of entries in bytes, default is None (no limit)
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        *,
+        limit: int | None = None,
+        size_limit: int | None = None,
+    ) -> None:
+        self._connection: sqlite3.Connection = sqlite3.connect(
+            path,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries"
+            " (key TEXT PRIMARY KEY, value BLOB NOT NULL, expire REAL, accessed REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS cache_entries_accessed ON cache_entries (accessed)"
+        )
+        self._limit: int | None = limit
+        self._size_limit: int | None = size_limit
+        # access times of loaded entries, written in batches instead of on each load
+        self._accessed: dict[str, float] = {}
+        self._lock: Lock = Lock()
+
+    def load(
+        self,
+        key: str,
+        /,
+    ) -> bytes | None:
+        with self._lock:
+            now: float = time()
+            row: tuple[bytes, float | None] | None = self._connection.execute(
+                "SELECT value, expire FROM cache_entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            elif (expire := row[1]) and expire < now:
+                self._connection.execute(
+                    "DELETE FROM cache_entries WHERE key = ?",
+                    (key,),
+                )
+                self._accessed.pop(key, None)
+                return None
+
+            else:
+                self._accessed[key] = now
+                if len(self._accessed) >= _SQLITE_ACCESS_BATCH:
+                    self._commit_accessed()
+
+                return row[0]
+
+    def store(
+        self,
+        key: str,
+        value: bytes,
+        /,
+        *,
+        expiration: float | None,
+    ) -> None:
+        with self._lock:
+            now: float = time()
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO cache_entries (key, value, expire, accessed)"
+                    " VALUES (?, ?, ?, ?)",
+                    (key, value, now + expiration if expiration else None, now),
+                )
+                self._accessed.pop(key, None)
+                # eviction requires up to date access times
+                self._flush_accessed()
+                self._evict(now=now)
+                self._connection.execute("COMMIT")
+
+            except BaseException as exc:
+                self._connection.execute("ROLLBACK")
+                raise exc
+
+    def close(self) -> None:
+        with self._lock:
+            self._commit_accessed()
+            self._connection.close()
+
+    def _commit_accessed(self) -> None:
+        if not self._accessed:
+            return  # nothing to update
+
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            self._flush_accessed()
+            self._connection.execute("COMMIT")
+
+        except BaseException as exc:
+            self._connection.execute("ROLLBACK")
+            raise exc
+
+    def _flush_accessed(self) -> None:
+        if not self._accessed:
+            return  # nothing to update
+
+        self._connection.executemany(
+            "UPDATE cache_entries SET accessed = ? WHERE key = ?",
+            ((accessed, key) for key, accessed in self._accessed.items()),
+        )
+        self._accessed.clear()
+
+    def _evict(
+        self,
+        *,
+        now: float,
+    ) -> None:
+        self._connection.execute(
+            "DELETE FROM cache_entries WHERE expire < ?",
+            (now,),
+        )
+        if self._limit is not None:
+            self._connection.execute(
+                "DELETE FROM cache_entries WHERE key IN"
+                " (SELECT key FROM cache_entries ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self._limit,),
+            )
+
+        if self._size_limit is not None:
+            self._connection.execute(
+                "DELETE FROM cache_entries WHERE key IN"
+                " (SELECT key FROM (SELECT key, SUM(LENGTH(value))"
+                " OVER (ORDER BY accessed DESC ROWS UNBOUNDED PRECEDING) AS total"
+                " FROM cache_entries) WHERE total > ?)",
+                (self._size_limit,),
+            )
+
+
+_FILE_HEADER: Struct = Struct("!d")  # expire time, zero when not expiring
+_FILE_RESCAN_INTERVAL: int = 1024  # stores between directory scans
+
+
+class FileCacheBackend(CacheBackend):
+    """\
+    Cache backend keeping each entry in a separate file within a directory. \
+    The directory can be shared by multiple processes and hosts i.e. using \
+    a network volume, entries are replaced atomically and survive restarts. \
+    Least recently modified or loaded entries are evicted when exceeding limits, \
+    entries of other processes are accounted on periodic directory scans.
+
+    Parameters
+    ----------
+    directory: Path | str
+        path to the directory of entries, it is created if missing
+    limit: int | None
+        limit of entries to keep, default is None (no limit)
+    size_limit: int | None
+        limit of total size of entries in bytes, default is None (no limit)
+    """
+
+    def __init__(
+        self,
+        directory: Path | str,
+        *,
+        limit: int | None = None,
+        size_limit: int | None = None,
+    ) -> None:
+        self._directory: Path = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._limit: int | None = limit
+        self._size_limit: int | None = size_limit
+        # sizes of entries from the least recently used, loaded from the directory lazily
+        self._entries: OrderedDict[str, int] | None = None
+        self._size: int = 0
+        self._stores: int = 0
+        self._lock: Lock = Lock()
+
+    def load(
+        self,
+        key: str,
+        /,
+    ) -> bytes | None:
+        path: Path = self._path(key)
+        try:
+            data: bytes = path.read_bytes()
+
+        except FileNotFoundError:
+            self._untrack(path.name)
+            return None
+
+        (expire,) = _FILE_HEADER.unpack_from(data)
+        if expire and expire < time():
+            path.unlink(missing_ok=True)
+            self._untrack(path.name)
+            return None
+
+        try:  # mark as recently used also for other processes
+            utime(path)
+
+        except OSError:
+            pass  # ignore entries removed in the meantime
+
+        self._track(path.name, size=len(data))
+        return data[_FILE_HEADER.size :]
+
+    def store(
+        self,
+        key: str,
+        value: bytes,
+        /,
+        *,
+        expiration: float | None,
+    ) -> None:
+        # write to a temporary file first to make entries visible only when complete
+        with NamedTemporaryFile(
+            dir=self._directory,
+            prefix=".",
+            suffix=".tmp",
+            delete=False,
+        ) as file:
+            file.write(_FILE_HEADER.pack(time() + expiration if expiration else 0.0))
+            file.write(value)
+
+        path: Path = self._path(key)
+        replace(file.name, path)
+
+        if self._limit is None and self._size_limit is None:
+            return  # no need to track entries
+
+        with self._lock:
+            self._stores += 1
+            # scan the directory only periodically to include changes of other processes
+            if self._entries is None or self._stores % _FILE_RESCAN_INTERVAL == 0:
+                self._scan()
+
+            else:
+                self._track_locked(path.name, size=_FILE_HEADER.size + len(value))
+
+            self._evict()
+
+    def _path(
+        self,
+        key: str,
+        /,
+    ) -> Path:
+        return self._directory / sha256(key.encode()).hexdigest()
+
+    def _track(
+        self,
+        name: str,
+        /,
+        *,
+        size: int,
+    ) -> None:
+        if self._entries is None:
+            return  # not tracking entries
+
+        with self._lock:
+            self._track_locked(name, size=size)
+
+    def _track_locked(
+        self,
+        name: str,
+        /,
+        *,
+        size: int,
+    ) -> None:
+        assert self._entries is not None  # nosec: B101
+        if (replaced := self._entries.pop(name, None)) is not None:
+            self._size -= replaced
+
+        self._entries[name] = size
+        self._size += size
+
+    def _untrack(
+        self,
+        name: str,
+        /,
+    ) -> None:
+        if self._entries is None:
+            return  # not tracking entries
+
+        with self._lock:
+            if (removed := self._entries.pop(name, None)) is not None:
+                self._size -= removed
+
+    def _scan(self) -> None:
+        entries: list[tuple[float, int, str]] = []
+        for entry in scandir(self._directory):
+            if entry.name.startswith("."):
+                continue  # skip temporary files
+
+            try:
+                stat = entry.stat()
+
+            except FileNotFoundError:
+                continue  # removed in the meantime
+
+            entries.append((stat.st_mtime, stat.st_size, entry.name))
+
+        # order from the least recently used entries
+        entries.sort(key=lambda element: element[0])
+        self._entries = OrderedDict((name, size) for _, size, name in entries)
+        self._size = sum(size for _, size, _ in entries)
+
+    def _evict(self) -> None:
+        assert self._entries is not None  # nosec: B101
+        while self._entries and (
+            (self._limit is not None and len(self._entries) > self._limit)
+            or (self._size_limit is not None and self._size > self._size_limit)
+        ):
+            name, size = self._entries.popitem(last=False)
+            self._size -= size
+            (self._directory / name).unlink(missing_ok=True)
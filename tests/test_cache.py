@@ -1,8 +1,25 @@
-from asyncio import CancelledError, Task, sleep
+import subprocess  # nosec: B404
+import sys
+from asyncio import CancelledError, Task, gather, sleep
 from collections.abc import Callable, Generator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from threading import Barrier, Lock
 from time import sleep as sync_sleep
-
-from draive import cache
+from typing import Any
+
+from draive import (
+    CacheBackend,
+    CacheStatistics,
+    CacheUsage,
+    DataModel,
+    FileCacheBackend,
+    MemoryCacheBackend,
+    SQLiteCacheBackend,
+    cache,
+    cache_statistics,
+    ctx,
+)
 from pytest import fixture, mark, raises
 
 
@@ -189,3 +206,536 @@ async def test_async_fails_with_error():
 
     with raises(FakeException):
         await randomized("expected")
+
+
+def test_thread_safe_computes_once_for_concurrent_calls():
+    calls: list[str] = []
+    barrier = Barrier(8)
+
+    @cache(thread_safe=True)
+    def computed(value: str, /) -> str:
+        calls.append(value)
+        sync_sleep(0.05)
+        return value
+
+    def call() -> str:
+        barrier.wait()
+        return computed("expected")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results: list[str] = [
+            future.result() for future in [executor.submit(call) for _ in range(8)]
+        ]
+
+    assert results == ["expected"] * 8
+    assert calls == ["expected"]
+    assert cache_statistics(computed) == CacheStatistics(
+        hits=7,
+        misses=1,
+        evictions=0,
+        expirations=0,
+        size=1,
+    )
+
+
+def test_thread_safe_propagates_error_to_waiting_calls():
+    barrier = Barrier(4)
+
+    @cache(thread_safe=True)
+    def failing(_: str, /) -> int:
+        sync_sleep(0.05)
+        raise FakeException()
+
+    def call() -> int:
+        barrier.wait()
+        return failing("expected")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(call) for _ in range(4)]
+        for future in futures:
+            with raises(FakeException):
+                future.result()
+
+    assert cache_statistics(failing).size == 0
+
+
+def test_statistics_count_hits_misses_evictions_and_expirations():
+    @cache(limit=1, expiration=0.01)
+    def computed(value: str, /) -> str:
+        return value
+
+    computed("first")
+    computed("first")
+    computed("second")
+    sync_sleep(0.02)
+    computed("second")
+
+    assert cache_statistics(computed) == CacheStatistics(
+        hits=1,
+        misses=3,
+        evictions=1,
+        expirations=1,
+        size=1,
+    )
+
+
+def test_statistics_fails_for_not_cached_function():
+    def computed(value: str, /) -> str:
+        return value
+
+    with raises(ValueError):
+        cache_statistics(computed)
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_async_statistics_are_recorded_as_metric():
+    @cache(limit=2)
+    async def computed(value: str, /) -> str:
+        return value
+
+    await computed("first")
+    await computed("first")
+    await computed("second")
+    ctx.record(CacheUsage.of(computed, name="computed"))
+    await computed("second")
+    ctx.record(CacheUsage.of(computed, name="computed"))
+
+    usage = ctx._current_metrics().read(CacheUsage)
+    assert usage is not None
+    assert usage.usage["computed"].hits == 2
+    assert usage.usage["computed"].misses == 2
+    assert usage.usage["computed"].size == 2
+
+
+def test_expired_entries_are_removed_on_access_to_other_keys():
+    @cache(limit=8, expiration=0.01)
+    def computed(value: str, /) -> str:
+        return value
+
+    computed("first")
+    computed("second")
+    sync_sleep(0.02)
+    computed("third")
+
+    assert cache_statistics(computed) == CacheStatistics(
+        hits=0,
+        misses=3,
+        evictions=0,
+        expirations=2,
+        size=1,
+    )
+
+
+def test_size_limit_evicts_least_recently_used_entries():
+    @cache(limit=8, size_limit=2200)
+    def computed(value: str, /) -> str:
+        return value * 1000
+
+    computed("a")
+    computed("b")
+    computed("a")
+    computed("c")
+
+    statistics: CacheStatistics = cache_statistics(computed)
+    assert statistics.evictions == 1
+    assert statistics.size == 2
+    computed("a")
+    assert cache_statistics(computed).hits == 2
+
+
+def test_size_limit_keeps_most_recent_entry_exceeding_limit():
+    @cache(limit=8, size_limit=16)
+    def computed(value: str, /) -> list[str]:
+        return [value] * 100
+
+    computed("a")
+    computed("b")
+    computed("b")
+
+    assert cache_statistics(computed).size == 1
+    assert cache_statistics(computed).hits == 1
+
+
+@mark.asyncio
+async def test_async_expired_tasks_are_removed_on_access_to_other_keys():
+    @cache(limit=8, expiration=0.01)
+    async def computed(value: str, /) -> str:
+        return value
+
+    await computed("first")
+    await computed("second")
+    await sleep(0.02)
+    await computed("third")
+
+    assert cache_statistics(computed).expirations == 2
+    assert cache_statistics(computed).size == 1
+
+
+@mark.asyncio
+async def test_async_size_limit_accounts_completed_results():
+    @cache(limit=8, size_limit=2200)
+    async def computed(value: str, /) -> str:
+        await sleep(0)
+        return value * 1000
+
+    await computed("a")
+    await computed("b")
+    await computed("c")
+    await sleep(0)  # let completion callbacks run
+
+    assert cache_statistics(computed).size == 2
+    assert cache_statistics(computed).evictions == 1
+
+
+@mark.asyncio
+async def test_async_caches_failure_by_default():
+    calls: list[str] = []
+
+    @cache
+    async def failing(value: str, /) -> int:
+        calls.append(value)
+        raise FakeException()
+
+    for _ in range(2):
+        with raises(FakeException):
+            await failing("expected")
+
+    assert calls == ["expected"]
+
+
+@mark.asyncio
+async def test_async_evicts_failure_with_zero_failure_expiration():
+    calls: list[str] = []
+
+    @cache(failure_expiration=0)
+    async def failing(value: str, /) -> int:
+        calls.append(value)
+        raise FakeException()
+
+    for _ in range(2):
+        with raises(FakeException):
+            await failing("expected")
+
+    assert calls == ["expected", "expected"]
+
+
+@mark.asyncio
+async def test_async_caches_failure_for_failure_expiration():
+    calls: list[str] = []
+
+    @cache(expiration=10, failure_expiration=0.01)
+    async def failing(value: str, /) -> int:
+        calls.append(value)
+        raise FakeException()
+
+    for _ in range(2):
+        with raises(FakeException):
+            await failing("expected")
+
+    assert calls == ["expected"]
+    await sleep(0.02)
+    with raises(FakeException):
+        await failing("expected")
+
+    assert calls == ["expected", "expected"]
+
+
+@mark.asyncio
+async def test_async_returns_stale_value_while_refreshing():
+    results: list[int] = []
+
+    @cache(expiration=0.01, stale_expiration=10)
+    async def computed(_: str, /) -> int:
+        await sleep(0)
+        results.append(len(results))
+        return results[-1]
+
+    assert await computed("expected") == 0
+    await sleep(0.02)
+    assert await computed("expected") == 0  # stale, refreshing
+    assert await computed("expected") == 0  # stale, refresh in progress
+    await sleep(0.01)
+    assert await computed("expected") == 1
+    assert results == [0, 1]
+
+
+@mark.asyncio
+async def test_async_keeps_stale_value_when_refresh_fails():
+    calls: list[str] = []
+
+    @cache(expiration=0.01, stale_expiration=10, failure_expiration=10)
+    async def computed(value: str, /) -> str:
+        calls.append(value)
+        if len(calls) > 1:
+            raise FakeException()
+
+        return value
+
+    assert await computed("expected") == "expected"
+    await sleep(0.02)
+    assert await computed("expected") == "expected"
+    await sleep(0)  # let refresh fail
+    assert await computed("expected") == "expected"
+    await sleep(0)
+    assert calls == ["expected", "expected"]  # retry is delayed by failure expiration
+
+
+@mark.asyncio
+async def test_async_caches_failure_for_failure_expiration_with_stale_expiration():
+    calls: list[str] = []
+
+    @cache(expiration=0.01, stale_expiration=10, failure_expiration=10)
+    async def failing(value: str, /) -> int:
+        calls.append(value)
+        raise FakeException()
+
+    for _ in range(5):
+        with raises(FakeException):
+            await failing("expected")
+
+        await sleep(0.005)
+
+    assert calls == ["expected"]
+
+
+class CachedModel(DataModel):
+    value: str
+    count: int
+
+
+@fixture(params=["memory", "sqlite", "file"])
+def cache_backend(request: Any, tmp_path: Path) -> CacheBackend:
+    match request.param:
+        case "memory":
+            return MemoryCacheBackend()
+
+        case "sqlite":
+            return SQLiteCacheBackend(tmp_path / "cache.db")
+
+        case _:
+            return FileCacheBackend(tmp_path / "cache")
+
+
+def test_backend_returns_cached_value_with_same_argument(cache_backend: CacheBackend):
+    calls: list[str] = []
+
+    @cache(backend=cache_backend)
+    def computed(value: str) -> dict[str, str]:
+        calls.append(value)
+        return {"value": value}
+
+    assert computed("expected") == {"value": "expected"}
+    assert computed("expected") == {"value": "expected"}
+    assert computed(value="other") == {"value": "other"}
+    assert calls == ["expected", "other"]
+
+
+def test_backend_shares_results_between_caches(cache_backend: CacheBackend):
+    calls: list[str] = []
+
+    def computed(value: str, /) -> str:
+        calls.append(value)
+        return value.upper()
+
+    assert cache(backend=cache_backend)(computed)("expected") == "EXPECTED"
+    # simulate restarted process using the same backend
+    restarted = cache(backend=cache_backend)(computed)
+    assert restarted("expected") == "EXPECTED"
+    assert calls == ["expected"]
+    assert cache_statistics(restarted).hits == 1
+
+
+def test_backend_returns_fresh_value_with_expiration_time_exceed(cache_backend: CacheBackend):
+    calls: list[str] = []
+
+    @cache(expiration=0.01, backend=cache_backend)
+    def computed(value: str, /) -> int:
+        calls.append(value)
+        return len(calls)
+
+    expected: int = computed("expected")
+    assert computed("expected") == expected
+    sync_sleep(0.02)
+    assert computed("expected") != expected
+
+
+def test_backend_keys_are_stable_across_processes(tmp_path: Path):
+    script: str = f"""
+from draive import FileCacheBackend, cache
+
+@cache(backend=FileCacheBackend({str(tmp_path / "cache")!r}))
+def computed(values: frozenset[str], /) -> str:
+    print("computed")
+    return ",".join(sorted(values))
+
+print(computed(frozenset({{"first", "second", "third", "fourth"}})))
+"""
+    outputs: list[str] = [
+        subprocess.run(  # nosec: B603
+            [sys.executable, "-c", script],
+            env={"PYTHONHASHSEED": seed, "PYTHONPATH": ":".join(sys.path)},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        for seed in ("1", "2")
+    ]
+    assert outputs[0] == "computed\nfirst,fourth,second,third\n"
+    assert outputs[1] == "first,fourth,second,third\n"
+
+
+def test_backend_method_keys_use_stable_instance_identity(cache_backend: CacheBackend):
+    calls: list[str] = []
+
+    class CachedMethods:
+        @cache(backend=cache_backend)
+        def computed(self, value: str, /) -> str:
+            calls.append(value)
+            return value.upper()
+
+    class CachedMethodsModel(DataModel):
+        prefix: str
+
+        @cache(backend=cache_backend)
+        def computed(self, value: str, /) -> str:
+            calls.append(value)
+            return f"{self.prefix}{value}"
+
+    # instances without data are identified by their type
+    assert CachedMethods().computed("expected") == "EXPECTED"
+    assert CachedMethods().computed("expected") == "EXPECTED"
+    assert calls == ["expected"]
+    # instances holding data are identified by their values
+    assert CachedMethodsModel(prefix="first:").computed("value") == "first:value"
+    assert CachedMethodsModel(prefix="second:").computed("value") == "second:value"
+    assert CachedMethodsModel(prefix="first:").computed("value") == "first:value"
+    assert calls == ["expected", "value", "value"]
+
+
+class LockHolder:
+    # default representation and unpicklable content
+    def __init__(self) -> None:
+        self.lock: Lock = Lock()
+
+
+def test_backend_skips_caching_arguments_which_can_not_be_encoded(cache_backend: CacheBackend):
+    calls: list[str] = []
+
+    @cache(backend=cache_backend)
+    def computed(value: str, holder: Any, /) -> str:
+        calls.append(value)
+        return value.upper()
+
+    holder = LockHolder()
+    assert computed("expected", holder) == "EXPECTED"
+    assert computed("expected", holder) == "EXPECTED"
+    assert computed("expected", holder.lock) == "EXPECTED"
+    assert computed("expected", lambda: None) == "EXPECTED"
+    assert calls == ["expected", "expected", "expected", "expected"]
+    assert cache_statistics(computed).misses == 4
+
+
+@mark.asyncio
+async def test_async_backend_skips_caching_arguments_which_can_not_be_encoded(
+    cache_backend: CacheBackend,
+):
+    calls: list[str] = []
+
+    @cache(backend=cache_backend)
+    async def computed(value: str, holder: LockHolder, /) -> str:
+        calls.append(value)
+        return value.upper()
+
+    holder = LockHolder()
+    assert await computed("expected", holder) == "EXPECTED"
+    assert await computed("expected", holder) == "EXPECTED"
+    assert calls == ["expected", "expected"]
+
+
+@mark.parametrize("kind", ["memory", "sqlite", "file"])
+def test_backend_evicts_least_recently_used_entries(kind: str, tmp_path: Path):
+    calls: list[str] = []
+    cache_backend: CacheBackend
+    match kind:
+        case "memory":
+            cache_backend = MemoryCacheBackend(limit=2)
+
+        case "sqlite":
+            cache_backend = SQLiteCacheBackend(tmp_path / "cache.db", limit=2)
+
+        case _:
+            cache_backend = FileCacheBackend(tmp_path / "cache", limit=2)
+
+    @cache(backend=cache_backend)
+    def computed(value: str, /) -> str:
+        calls.append(value)
+        sync_sleep(0.01)  # make access times distinct
+        return value
+
+    computed("first")
+    computed("second")
+    computed("first")
+    computed("third")
+    computed("first")
+    computed("second")
+    assert calls == ["first", "second", "third", "second"]
+
+
+def test_memory_backend_evicts_entries_exceeding_size_limit():
+    backend = MemoryCacheBackend(size_limit=8)
+    backend.store("first", b"12345", expiration=None)
+    backend.store("second", b"1234", expiration=None)
+    backend.store("large", b"123456789", expiration=None)
+
+    assert backend.load("first") is None
+    assert backend.load("second") is None
+    assert backend.load("large") is None
+
+
+def test_sqlite_backend_writes_access_times_on_close(tmp_path: Path):
+    backend = SQLiteCacheBackend(tmp_path / "cache.db", limit=2)
+    backend.store("first", b"first", expiration=None)
+    sync_sleep(0.01)  # make access times distinct
+    backend.store("second", b"second", expiration=None)
+    sync_sleep(0.01)
+    assert backend.load("first") == b"first"
+    backend.close()
+
+    restarted = SQLiteCacheBackend(tmp_path / "cache.db", limit=2)
+    restarted.store("third", b"third", expiration=None)
+    assert restarted.load("first") == b"first"
+    assert restarted.load("second") is None
+    assert restarted.load("third") == b"third"
+    restarted.close()
+
+
+def test_file_backend_evicts_entries_exceeding_size_limit(tmp_path: Path):
+    # entries include 8 bytes header with expire time
+    backend = FileCacheBackend(tmp_path / "cache", size_limit=30)
+    backend.store("first", b"12345", expiration=None)
+    backend.store("second", b"1234", expiration=None)
+    assert backend.load("first") == b"12345"
+    backend.store("third", b"123", expiration=None)
+
+    assert backend.load("first") == b"12345"
+    assert backend.load("second") is None
+    assert backend.load("third") == b"123"
+    assert len(list((tmp_path / "cache").iterdir())) == 2
+
+
+@mark.asyncio
+async def test_async_backend_computes_once_with_concurrent_calls(cache_backend: CacheBackend):
+    calls: list[str] = []
+
+    @cache(backend=cache_backend, serializer=CachedModel.cache_serializer())
+    async def computed(value: str, /) -> CachedModel:
+        calls.append(value)
+        await sleep(0.01)
+        return CachedModel(value=value, count=len(calls))
+
+    first, second = await gather(computed("expected"), computed("expected"))
+    assert first == second == CachedModel(value="expected", count=1)
+    assert await computed("expected") == CachedModel(value="expected", count=1)
+    assert calls == ["expected"]
+    assert cache_statistics(computed).hits == 2
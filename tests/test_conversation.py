@@ -0,0 +1,91 @@
+from collections.abc import Sequence
+from typing import Any
+
+from draive import (
+    LMM,
+    ConversationContextBudget,
+    ConversationMemoryTrimming,
+    ConversationMessage,
+    LMMCompletion,
+    LMMContextElement,
+    LMMInput,
+    Tokenization,
+    ctx,
+    lmm_conversation_completion,
+)
+from draive.types import LMMOutput
+from pytest import mark
+
+MEMORY: list[ConversationMessage] = [
+    ConversationMessage.user("one two three"),
+    ConversationMessage.model("four five"),
+    ConversationMessage.user("six"),
+    ConversationMessage.model("seven eight"),
+]
+
+
+def tokenize_words(text: str) -> list[int]:
+    return [len(word) for word in text.split()]
+
+
+class FakeInvocation:
+    def __init__(self) -> None:
+        self.context: Sequence[LMMContextElement] = ()
+        self.trimming: ConversationMemoryTrimming | None = None
+
+    async def __call__(
+        self,
+        *,
+        context: Sequence[LMMContextElement],
+        **extra: Any,
+    ) -> LMMOutput:
+        self.context = context
+        self.trimming = ctx.read(ConversationMemoryTrimming)
+        return LMMCompletion.of("done")
+
+
+@mark.asyncio
+async def test_uses_whole_memory_without_budget():
+    invocation = FakeInvocation()
+
+    @ctx.wrap("test", state=[LMM(invocation=invocation)])
+    async def complete() -> None:
+        await lmm_conversation_completion(
+            instruction="be nice",
+            input="nine ten",
+            memory=MEMORY,
+        )
+
+    await complete()
+    assert len(invocation.context) == 6  # instruction, memory and input
+
+
+@mark.asyncio
+async def test_drops_oldest_memory_messages_exceeding_budget():
+    invocation = FakeInvocation()
+
+    @ctx.wrap(
+        "test",
+        state=[
+            LMM(invocation=invocation),
+            Tokenization(tokenize_text=tokenize_words),
+            ConversationContextBudget(prompt_tokens=8),
+        ],
+    )
+    async def complete() -> None:
+        await lmm_conversation_completion(
+            instruction="be nice",
+            input="nine ten",
+            memory=MEMORY,
+        )
+
+    await complete()
+    # 2 tokens of instruction and 2 tokens of input leave 4 tokens for memory
+    assert invocation.context[1:] == [
+        LMMInput.of("six"),
+        LMMCompletion.of("seven eight"),
+        LMMInput.of("nine ten"),
+    ]
+    assert invocation.trimming is not None
+    assert invocation.trimming.messages == 2
+    assert invocation.trimming.tokens == 5
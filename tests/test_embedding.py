@@ -0,0 +1,254 @@
+from asyncio import sleep
+from collections.abc import AsyncIterator, Iterable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from draive import (
+    CacheHits,
+    CacheHitUsage,
+    Embedded,
+    Embedding,
+    SQLiteEmbeddingCacheStorage,
+    Tokenization,
+    ctx,
+    embed_text,
+    embedding_batches,
+    embedding_cache,
+)
+from draive.parameters import ParameterValidationError
+from pytest import mark, raises
+
+
+class FakeEmbedder:
+    def __init__(self) -> None:
+        self.requested: list[list[str]] = []
+
+    async def __call__(
+        self,
+        values: Iterable[str],
+        **extra: Any,
+    ) -> list[Embedded[str]]:
+        texts: list[str] = list(values)
+        self.requested.append(texts)
+        return [
+            Embedded(
+                value=text,
+                vector=[float(len(text)), float(ord(text[0])), 1.0],
+            )
+            for text in texts
+        ]
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_cache_embeds_only_unique_misses():
+    upstream = FakeEmbedder()
+    embedder = embedding_cache(upstream, identifier="fake")
+
+    first = await embedder(["a", "bb", "a"])
+    second = await embedder(["bb", "ccc"])
+
+    assert upstream.requested == [["a", "bb"], ["ccc"]]
+    assert [element.value for element in first] == ["a", "bb", "a"]
+    assert first[0].vector == first[2].vector == [1.0, 97.0, 1.0]
+    assert [element.value for element in second] == ["bb", "ccc"]
+    assert second[0].vector == first[1].vector
+    usage = ctx.read(CacheHitUsage)
+    assert usage is not None
+    assert usage.usage["embedding"] == CacheHits(hits=1, misses=3)
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_cache_separates_identifiers():
+    upstream = FakeEmbedder()
+
+    def identifier(model: str = "default", **extra: Any) -> str:
+        return f"fake|{model}"
+
+    embedder = embedding_cache(upstream, identifier=identifier)
+
+    await embedder(["a"])
+    await embedder(["a"], model="other")
+    await embedder(["a"], model="other")
+
+    assert upstream.requested == [["a"], ["a"]]
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_cache_evicts_least_recently_used():
+    upstream = FakeEmbedder()
+    embedder = embedding_cache(upstream, identifier="fake", limit=2)
+
+    await embedder(["a", "b"])
+    await embedder(["a"])
+    await embedder(["c"])  # evicts "b"
+    await embedder(["a", "b"])
+
+    assert upstream.requested == [["a", "b"], ["c"], ["b"]]
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_cache_uses_sqlite_storage(tmp_path: Path):
+    upstream = FakeEmbedder()
+    storage = SQLiteEmbeddingCacheStorage(tmp_path / "embeddings.db")
+    await embedding_cache(upstream, identifier="fake", storage=storage)(["a", "bb"])
+    storage.close()
+
+    storage = SQLiteEmbeddingCacheStorage(tmp_path / "embeddings.db")
+    result = await embedding_cache(upstream, identifier="fake", storage=storage)(["bb", "a"])
+    storage.close()
+
+    assert upstream.requested == [["a", "bb"]]
+    assert isinstance(result[0].vector, np.ndarray)
+    assert np.array_equal(result[0].vector, [2.0, 98.0, 1.0])
+    assert np.array_equal(result[1].vector, [1.0, 97.0, 1.0])
+
+
+class SlowEmbedder:
+    def __init__(self) -> None:
+        self.running: int = 0
+        self.max_running: int = 0
+
+    async def __call__(
+        self,
+        values: Iterable[str],
+        **extra: Any,
+    ) -> list[Embedded[str]]:
+        texts: list[str] = list(values)
+        self.running += 1
+        self.max_running = max(self.running, self.max_running)
+        # first batches take longest to complete
+        await sleep(0.01 / int(texts[0]) if int(texts[0]) else 0.02)
+        self.running -= 1
+        return [Embedded(value=text, vector=[float(text)]) for text in texts]
+
+
+@mark.asyncio
+async def test_stream_yields_ordered_batches_with_bounded_concurrency():
+    embedder = SlowEmbedder()
+
+    @ctx.wrap("test", state=[Embedding(embed_text=embedder)])
+    async def embed() -> list[list[str]]:
+        return [
+            [element.value for element in batch]
+            async for batch in await embed_text(
+                (str(idx) for idx in range(10)),
+                stream=True,
+                stream_batch_size=3,
+                stream_concurrency=2,
+            )
+        ]
+
+    assert await embed() == [["0", "1", "2"], ["3", "4", "5"], ["6", "7", "8"], ["9"]]
+    assert embedder.max_running == 2
+
+
+@mark.asyncio
+async def test_stream_yields_unordered_batches_as_completed():
+    embedder = SlowEmbedder()
+
+    async def values() -> AsyncIterator[str]:
+        for idx in range(4):
+            yield str(idx)
+
+    @ctx.wrap("test", state=[Embedding(embed_text=embedder)])
+    async def embed() -> list[list[str]]:
+        return [
+            [element.value for element in batch]
+            async for batch in await embed_text(
+                values(),
+                stream=True,
+                stream_batch_size=2,
+                stream_concurrency=2,
+                ordered=False,
+            )
+        ]
+
+    assert await embed() == [["2", "3"], ["0", "1"]]
+
+
+@mark.asyncio
+async def test_stream_batches_do_not_outlive_context():
+    embedder = SlowEmbedder()
+
+    @ctx.wrap("test", state=[Embedding(embed_text=embedder)])
+    async def embed() -> list[str]:
+        async for batch in await embed_text(
+            (str(idx) for idx in range(10)),
+            stream=True,
+            stream_batch_size=1,
+            stream_concurrency=4,
+        ):
+            return [element.value for element in batch]
+
+        return []
+
+    assert await embed() == ["0"]
+    assert embedder.running == 0
+
+
+@mark.asyncio
+async def test_embed_text_passes_batch_size_to_provider():
+    received: list[dict[str, Any]] = []
+
+    async def embedder(
+        values: Iterable[str],
+        **extra: Any,
+    ) -> list[Embedded[str]]:
+        received.append(extra)
+        return [Embedded(value=value, vector=[1.0]) for value in values]
+
+    @ctx.wrap("test", state=[Embedding(embed_text=embedder)])
+    async def embed() -> None:
+        await embed_text(["a"], batch_size=64)
+        async for _ in await embed_text(["b"], stream=True, stream_batch_size=1, batch_size=8):
+            pass
+
+    await embed()
+    assert received == [{"batch_size": 64}, {"batch_size": 8}]
+
+
+def test_embedded_converts_array_vectors_to_float32():
+    embedded = Embedded(
+        value="a",
+        vector=np.array([[1.0, 2.0, 3.0]], dtype=np.float64)[0, ::2],  # pyright: ignore[reportArgumentType]
+    )
+
+    assert isinstance(embedded.vector, np.ndarray)
+    assert embedded.vector.dtype == np.float32
+    assert embedded.vector.flags.c_contiguous
+    assert embedded.vector.tolist() == [1.0, 3.0]
+    assert Embedded(value="a", vector=[1, 2]).vector == [1.0, 2.0]
+    with raises(ParameterValidationError):
+        Embedded(value="a", vector=np.zeros((2, 2), dtype=np.float32))
+
+    with raises(ParameterValidationError):
+        Embedded(value="a", vector=["1.0"])  # pyright: ignore[reportArgumentType]
+
+
+def test_embedded_compares_array_vectors():
+    embedded = Embedded(value="a", vector=np.array([1.0, 2.0], dtype=np.float32))
+
+    assert embedded == Embedded(value="a", vector=np.array([1.0, 2.0], dtype=np.float32))
+    assert embedded == Embedded(value="a", vector=[1.0, 2.0])
+    assert embedded != Embedded(value="a", vector=np.array([1.0, 3.0], dtype=np.float32))
+    assert embedded != Embedded(value="b", vector=[1.0, 2.0])
+
+
+def test_batches_split_by_size_in_order():
+    assert embedding_batches(["a"] * 5, batch_size=2) == [[0, 1], [2, 3], [4]]
+    assert embedding_batches([], batch_size=2) == []
+
+
+@mark.asyncio
+@ctx.wrap("test", state=[Tokenization(tokenize_text=lambda text: list(range(len(text))))])
+async def test_batches_pack_values_within_token_budget():
+    values: list[str] = ["aaaaaa", "b", "cc", "ddd", "eeeeeeeeeeee", "f"]
+    batches: list[list[int]] = embedding_batches(values, batch_size=3, batch_tokens=6)
+
+    assert batches == [[1, 5, 2], [3], [0], [4]]
+    assert sorted(index for batch in batches for index in batch) == list(range(len(values)))
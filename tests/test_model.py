@@ -1,6 +1,8 @@
 import json
+import pickle
+from copy import deepcopy
 from datetime import UTC, datetime
-from typing import Any, Literal, NotRequired, Required, TypedDict
+from typing import Any, Literal, NotRequired, Required, Self, TypedDict
 from uuid import UUID
 
 from draive import (
@@ -9,10 +11,17 @@ from draive import (
     ConversationMessage,
     DataModel,
     Field,
+    ImageBase64Content,
     ImageURLContent,
     Missing,
     MultimodalContent,
 )
+from draive.parameters import (
+    ParameterValidationContext,
+    ParameterValidationError,
+    ParametrizedData,
+)
+from pytest import raises
 
 
 def invalid(value: str) -> None:
@@ -57,6 +66,240 @@ def test_validated_passes_with_default_values() -> None:
     ExampleModel()
 
 
+class FactoryModel(DataModel):
+    required: int
+    optional: str | Missing
+    values: list[int] = Field(default_factory=list)
+
+
+def test_initializer_validates_like_generic_initializer() -> None:
+    first: FactoryModel = FactoryModel(required=1)  # pyright: ignore[reportCallIssue]
+    second: FactoryModel = FactoryModel(required=1, optional="value", ignored=True)  # pyright: ignore[reportCallIssue]
+    assert first.optional is MISSING
+    assert second.optional == "value"
+    assert first.values == [] and first.values is not second.values
+
+    generic: FactoryModel = object.__new__(FactoryModel)
+    ParametrizedData.__init__(generic, required=1)
+    assert generic == first
+
+
+def test_initializer_reports_parameter_context() -> None:
+    with raises(ParameterValidationError) as missing:
+        FactoryModel()  # pyright: ignore[reportCallIssue]
+
+    assert missing.value.args[1] == ("FactoryModel", ".required")
+
+    with raises(ParameterValidationError) as invalid:
+        FactoryModel(required="invalid")  # pyright: ignore[reportCallIssue]
+
+    assert invalid.value.args[1] == ("FactoryModel", ".required")
+
+
+class CustomInitModel(DataModel):
+    value: int
+
+    def __init__(self, value: int | str) -> None:
+        super().__init__(value=int(value))  # pyright: ignore[reportCallIssue]
+
+
+class CustomInitSubModel(CustomInitModel):
+    other: int = 0
+
+
+def test_initializer_keeps_custom_initializers() -> None:
+    assert CustomInitModel("42").value == 42
+    assert CustomInitSubModel("42").value == 42  # pyright: ignore[reportCallIssue]
+
+
+def test_unchecked_skips_validation_and_uses_defaults() -> None:
+    first: FactoryModel = FactoryModel.unchecked(required="not validated")
+    second: FactoryModel = FactoryModel.unchecked(required=1, values=[2])
+    assert first.required == "not validated"
+    assert first.optional is MISSING
+    assert first.values == [] and first.values is not FactoryModel.unchecked(required=1).values
+    assert second == FactoryModel(required=1, values=[2])  # pyright: ignore[reportCallIssue]
+
+
+def test_updated_validates_only_replaced_parameters() -> None:
+    model: ExampleModel = ExampleModel(string="value")
+    updated: ExampleModel = model.updated(alias=42, answer={"string": "nested"})
+    assert updated.string == "value"
+    assert updated.number == 42
+    assert updated.nested == ExampleNestedModel(string="nested")  # pyright: ignore[reportCallIssue]
+    assert updated.full is model.full
+    assert model.updated() is model
+
+    with raises(ParameterValidationError) as invalid:
+        model.updated(number="invalid")
+
+    assert invalid.value.args[1] == ("ExampleModel", ".number")
+
+
+def test_updated_keeps_custom_initializers() -> None:
+    assert CustomInitModel("1").updated(value="42").value == 42
+
+
+class SlottedModel(DataModel, slots=True):
+    required: int
+    values: list[int] = Field(default_factory=list[int])
+
+
+class SlottedSubModel(SlottedModel, slots=True):
+    required: int = 42
+    extra: str = "extra"
+
+
+def test_slotted_instances_use_slots() -> None:
+    model: SlottedSubModel = SlottedSubModel()  # pyright: ignore[reportCallIssue]
+    assert not hasattr(model, "__dict__")
+    assert SlottedSubModel.__slots__ == ("extra",)  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
+    assert model.required == 42
+    assert SlottedModel(required=1).values == []  # pyright: ignore[reportCallIssue]
+
+    with raises(RuntimeError):
+        model.extra = "modified"  # pyright: ignore[reportAttributeAccessIssue]
+
+
+def test_instances_can_be_pickled() -> None:
+    model: SlottedSubModel = SlottedSubModel(values=[1, 2])  # pyright: ignore[reportCallIssue]
+    assert pickle.loads(pickle.dumps(model)) == model  # nosec: B301
+    assert deepcopy(model) == model
+
+    regular: FactoryModel = FactoryModel(required=1, values=[1, 2])  # pyright: ignore[reportCallIssue]
+    assert pickle.loads(pickle.dumps(regular)) == regular  # nosec: B301
+
+
+class MixedFirstModel(DataModel):
+    first: int = 1
+
+
+class MixedSecondModel(DataModel):
+    second: str
+
+
+class MixedModel(MixedFirstModel, MixedSecondModel):
+    third: bool = True
+
+
+class MixedSlottedModel(SlottedModel, MixedSecondModel):
+    third: bool = True
+
+
+def test_multiple_inheritance_combines_parameters() -> None:
+    model: MixedModel = MixedModel(second="second")  # pyright: ignore[reportCallIssue]
+    assert (model.first, model.second, model.third) == (1, "second", True)
+    assert isinstance(model, MixedFirstModel) and isinstance(model, MixedSecondModel)
+    assert model.updated(first=2).first == 2
+
+    slotted: MixedSlottedModel = MixedSlottedModel(required=1, second="second")  # pyright: ignore[reportCallIssue]
+    assert (slotted.required, slotted.second, slotted.third) == (1, "second", True)
+
+
+class OverriddenDefaultModel(MixedFirstModel):
+    first: int = 2
+
+
+class OverriddenSlottedModel(SlottedModel):
+    required: int = 3
+
+
+def test_regular_types_keep_defaults_as_class_attributes() -> None:
+    assert MixedFirstModel.first == 1
+    assert MixedModel.third is True
+    assert OverriddenDefaultModel.first == 2
+    assert OverriddenDefaultModel().first == 2  # pyright: ignore[reportCallIssue]
+    assert OverriddenSlottedModel.required == 3
+    assert OverriddenSlottedModel().required == 3  # pyright: ignore[reportCallIssue]
+    assert OverriddenSlottedModel(required=4).required == 4  # pyright: ignore[reportCallIssue]
+
+
+class FirstVariantModel(DataModel):
+    kind: Literal["first"] = "first"
+    value: int
+
+
+class SecondVariantModel(DataModel):
+    kind: Literal["second"] = Field(alias="type", default="second")
+    value: int
+    extra: str
+
+
+class VariantsModel(DataModel):
+    variant: FirstVariantModel | SecondVariantModel | str | None
+    number: float | int
+    image: ImageBase64Content | ImageURLContent | None = None
+
+
+def test_union_dispatches_values_like_alternatives_in_order() -> None:
+    model: VariantsModel = VariantsModel(variant="text", number=1)  # pyright: ignore[reportCallIssue]
+    assert model.variant == "text"
+    assert isinstance(model.number, float)
+    assert VariantsModel(variant=None, number=1).variant is None  # pyright: ignore[reportCallIssue]
+
+    first: FirstVariantModel = FirstVariantModel(value=1)  # pyright: ignore[reportCallIssue]
+    assert VariantsModel(variant=first, number=1).variant is first  # pyright: ignore[reportCallIssue]
+
+    with raises(ParameterValidationError):
+        VariantsModel(variant=42, number=1)  # pyright: ignore[reportCallIssue, reportArgumentType]
+
+
+def test_union_discriminates_parametrized_mappings() -> None:
+    assert VariantsModel.from_dict(
+        {"variant": {"kind": "second", "value": 1, "extra": "extra"}, "number": 1}
+    ).variant == SecondVariantModel(value=1, extra="extra")  # pyright: ignore[reportCallIssue]
+    assert VariantsModel.from_dict(
+        {"variant": {"value": 1, "extra": "extra"}, "number": 1}
+    ).variant == FirstVariantModel(value=1)  # pyright: ignore[reportCallIssue]
+    assert VariantsModel.from_dict(
+        {"variant": None, "number": 1, "image": {"image_url": "https://miquido.com/image"}}
+    ).image == ImageURLContent(image_url="https://miquido.com/image")
+
+    with raises(ParameterValidationError):
+        VariantsModel.from_dict({"variant": {"kind": "third", "value": 1}, "number": 1})
+
+
+class TagModel(DataModel):
+    name: str
+
+    @classmethod
+    def validator(
+        cls,
+        /,
+        value: Any,
+        context: ParameterValidationContext,
+    ) -> Self:
+        match value:
+            case str() as name:
+                return cls(name=name)
+
+            case other:
+                return super().validator(other, context)
+
+
+class TaggedModel(DataModel):
+    tag: TagModel | int
+
+
+def test_union_uses_custom_validators() -> None:
+    assert TaggedModel.from_dict({"tag": "tag"}).tag == TagModel(name="tag")
+    assert TaggedModel.from_dict({"tag": {"name": "tag"}}).tag == TagModel(name="tag")
+    assert TaggedModel.from_dict({"tag": 1}).tag == 1
+
+
+def test_multimodal_content_of_contents_keeps_elements() -> None:
+    image: ImageURLContent = ImageURLContent(image_url="https://miquido.com/image")
+    content: MultimodalContent = MultimodalContent.of(
+        MultimodalContent.of("text"),
+        MultimodalContent.of(image),
+    )
+    assert content == MultimodalContent(elements=("text", image))
+    assert content.extending(MultimodalContent.of("more")).elements == ("text", image, "more")
+
+    with raises(ParameterValidationError):
+        MultimodalContent.of(42)  # pyright: ignore[reportArgumentType]
+
+
 class DatetimeModel(DataModel):
     value: datetime
 
@@ -113,3 +113,35 @@ def test_dict_item_path_points_to_item():
     assert path(data_model) == data_model.dict_models["B"]
     assert path.__repr__() == "DataModel.dict_models[B]"
     assert str(path) == "dict_models[B]"
+
+
+def test_attribute_path_updates_attribute() -> None:
+    updated: DataModel = data_model.updating(DataModel._.answer, "updated")
+    assert updated.answer == "updated"
+    assert updated.nested is data_model.nested
+    assert data_model.answer == "testing"
+
+
+def test_nested_attribute_path_updates_nested_attribute() -> None:
+    updated: DataModel = data_model.updating(DataModel._.nested.value, 2.0)
+    assert updated.nested.value == 2.0
+    assert updated.recursive is data_model.recursive
+    assert data_model.nested.value == 3.14
+
+
+def test_item_paths_update_items() -> None:
+    updated: DataModel = data_model.updating(
+        DataModel._.list_models[1],
+        SequenceDataModel(value=0),
+    )
+    assert updated.list_models == [SequenceDataModel(value=65), SequenceDataModel(value=0)]
+    assert updated.list_models[0] is data_model.list_models[0]
+    assert data_model.list_models[1].value == 66
+
+    updated = data_model.updating(DataModel._.tuple_models[0].value, 0)
+    assert updated.tuple_models == (SequenceDataModel(value=0), SequenceDataModel(value=21))
+    assert updated.tuple_models[1] is data_model.tuple_models[1]
+
+    updated = data_model.updating(DataModel._.dict_models["B"].key, "C")
+    assert updated.dict_models["B"] == DictDataModel(key="C")
+    assert updated.dict_models["A"] is data_model.dict_models["A"]
@@ -0,0 +1,313 @@
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from draive import (
+    Embedded,
+    IVFVectorIndex,
+    QuantizedVectorIndex,
+    VectorIndex,
+    VectorStore,
+    batch_similarity_search,
+    mmr_similarity_search,
+    similarity_scores,
+    similarity_search,
+)
+from numpy.typing import NDArray
+
+
+def reference_mmr(
+    query_vector: NDArray[Any],
+    values_vectors: NDArray[Any],
+    limit: int,
+    lambda_multiplier: float,
+) -> list[int]:
+    def cosine(a: NDArray[Any], b: NDArray[Any]) -> float:
+        return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
+
+    selected: list[int] = [
+        int(np.argmax([cosine(value, query_vector) for value in values_vectors])),
+    ]
+    while len(selected) < min(limit, len(values_vectors)):
+        best_score: float = -np.inf
+        best_index: int = -1
+        for idx, value in enumerate(values_vectors):
+            if idx in selected:
+                continue
+
+            score: float = lambda_multiplier * cosine(value, query_vector) - (
+                1 - lambda_multiplier
+            ) * max(cosine(value, values_vectors[other]) for other in selected)
+
+            if score > best_score:
+                best_score = score
+                best_index = idx
+
+        selected.append(best_index)
+
+    return selected
+
+
+def test_mmr_returns_empty_without_values():
+    assert mmr_similarity_search([1.0, 0.0], [], limit=3) == []
+
+
+def test_mmr_returns_most_similar_first():
+    values: list[list[float]] = [[0.0, 1.0], [1.0, 0.1], [0.5, 0.5]]
+    assert mmr_similarity_search([1.0, 0.0], values, limit=1) == [1]
+
+
+def test_mmr_limits_results_to_available_values():
+    values: list[list[float]] = [[0.0, 1.0], [1.0, 0.1], [0.5, 0.5]]
+    assert sorted(mmr_similarity_search([1.0, 0.0], values, limit=10)) == [0, 1, 2]
+
+
+def test_mmr_matches_reference_implementation():
+    generator = np.random.default_rng(seed=42)
+    values: NDArray[Any] = generator.normal(size=(64, 16))
+    query: NDArray[Any] = generator.normal(size=16)
+
+    for lambda_multiplier in (0.0, 0.3, 0.5, 1.0):
+        assert mmr_similarity_search(
+            query,
+            list(values),
+            limit=12,
+            lambda_multiplier=lambda_multiplier,
+        ) == reference_mmr(
+            query,
+            values,
+            limit=12,
+            lambda_multiplier=lambda_multiplier,
+        )
+
+
+def test_search_returns_best_matches_ordered():
+    values: list[list[float]] = [[0.0, 1.0], [1.0, 0.1], [0.5, 0.5], [1.0, 0.0]]
+    assert similarity_search([1.0, 0.0], values, limit=2) == [3, 1]
+
+
+def test_search_skips_values_below_threshold():
+    values: list[list[float]] = [[0.0, 1.0], [1.0, 0.1], [0.5, 0.5], [1.0, 0.0]]
+    assert similarity_search([1.0, 0.0], values, limit=4, score_threshold=0.5) == [3, 1, 2]
+
+
+def test_index_search_matches_list_search():
+    generator = np.random.default_rng(seed=42)
+    values: NDArray[Any] = generator.normal(size=(128, 16))
+    query: NDArray[Any] = generator.normal(size=16)
+    index: VectorIndex[int] = VectorIndex.of(
+        Embedded(value=idx, vector=list(vector)) for idx, vector in enumerate(values)
+    )
+
+    expected: list[int] = similarity_search(query, list(values), limit=10)
+    assert similarity_search(query, index, limit=10) == expected
+    assert index.search(query, limit=10) == expected
+    assert mmr_similarity_search(query, index, limit=10) == mmr_similarity_search(
+        query,
+        list(values),
+        limit=10,
+    )
+
+
+def test_search_uses_embedded_float32_arrays():
+    generator = np.random.default_rng(seed=42)
+    values: NDArray[np.float32] = generator.normal(size=(64, 16)).astype(np.float32)
+    query: NDArray[Any] = generator.normal(size=16)
+    embedded: list[Embedded[int]] = [
+        Embedded(value=idx, vector=np.frombuffer(vector.tobytes(), dtype="<f4"))
+        for idx, vector in enumerate(values)
+    ]
+
+    assert isinstance(embedded[0].vector, np.ndarray)
+    expected: list[int] = similarity_search(query, values.tolist(), limit=5)
+    assert similarity_search(query, [element.vector for element in embedded], limit=5) == expected
+    assert VectorIndex.of(embedded).search(query, limit=5) == expected
+
+
+def test_index_grows_and_removes_entries():
+    index: VectorIndex[str] = VectorIndex(capacity=1)
+    identifiers: list[str] = index.add(
+        [
+            Embedded(value="x", vector=[1.0, 0.0]),
+            Embedded(value="y", vector=[0.0, 1.0]),
+            Embedded(value="z", vector=[1.0, 1.0]),
+        ]
+    )
+    assert len(index) == 3
+
+    index.remove(identifiers[0])
+    assert len(index) == 2
+    assert identifiers[0] not in index
+    assert index.value(identifiers[2]) == "z"
+    assert index.search([1.0, 0.0], limit=3) == ["z", "y"]
+
+    index.add([Embedded(value="w", vector=[1.0, 0.0])], identifiers=[identifiers[1]])
+    assert len(index) == 2
+    assert index.search([1.0, 0.0], limit=1) == ["w"]
+
+
+def test_ivf_index_with_all_probes_matches_exact_search():
+    generator = np.random.default_rng(seed=42)
+    values: NDArray[Any] = generator.normal(size=(512, 16))
+    query: NDArray[Any] = generator.normal(size=16)
+    index: IVFVectorIndex[int] = IVFVectorIndex.of(
+        (Embedded(value=idx, vector=list(vector)) for idx, vector in enumerate(values)),
+        clusters=8,
+        seed=42,
+    )
+
+    assert index.clusters == 8
+    assert index.search(query, limit=10, probes=8) == similarity_search(
+        query,
+        list(values),
+        limit=10,
+    )
+
+
+def test_ivf_index_finds_nearest_cluster_members():
+    generator = np.random.default_rng(seed=42)
+    centers: NDArray[Any] = generator.normal(size=(8, 16))
+    values: NDArray[Any] = np.repeat(centers, 32, axis=0) + generator.normal(
+        scale=0.05,
+        size=(256, 16),
+    )
+    index: IVFVectorIndex[int] = IVFVectorIndex.of(
+        (Embedded(value=idx, vector=list(vector)) for idx, vector in enumerate(values)),
+        clusters=8,
+        probes=1,
+        seed=42,
+    )
+
+    assert index.search(centers[3], limit=5) == similarity_search(
+        centers[3],
+        list(values),
+        limit=5,
+    )
+
+
+def test_ivf_index_save_and_load(tmp_path: Path):
+    generator = np.random.default_rng(seed=42)
+    values: NDArray[Any] = generator.normal(size=(64, 8))
+    query: NDArray[Any] = generator.normal(size=8)
+    index: IVFVectorIndex[str] = IVFVectorIndex.of(
+        (Embedded(value=f"value_{idx}", vector=list(vector)) for idx, vector in enumerate(values)),
+        clusters=4,
+        seed=42,
+    )
+    for path in (tmp_path / "index.npz", tmp_path / "index"):
+        index.save(path)
+        loaded: IVFVectorIndex[str] = IVFVectorIndex.load(path)
+
+        assert len(loaded) == len(index)
+        assert loaded.search(query, limit=5, probes=2) == index.search(query, limit=5, probes=2)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["index", "index.npz"]
+
+
+def test_vector_store_appends_and_reopens(tmp_path: Path):
+    generator = np.random.default_rng(seed=42)
+    values: NDArray[Any] = generator.normal(size=(32, 8))
+    query: NDArray[Any] = generator.normal(size=8)
+
+    with VectorStore[str].create(tmp_path / "store", dimensions=8) as store:
+        store.append(
+            Embedded(value=f"value_{idx}", vector=vector)
+            for idx, vector in enumerate(values[:16].tolist())
+        )
+        identifiers: list[str] = store.append(
+            Embedded(value=f"value_{idx + 16}", vector=vector)
+            for idx, vector in enumerate(values[16:].tolist())
+        )
+        assert len(store) == 32
+        assert store.value(store.position(identifiers[0])) == "value_16"
+
+    with VectorStore[str](tmp_path / "store") as reopened:
+        assert len(reopened) == 32
+        assert np.allclose(reopened.vectors, values)
+        assert reopened.search(query, limit=5) == [
+            f"value_{idx}" for idx in similarity_search(query, list(values), limit=5)
+        ]
+
+
+def test_vector_store_refresh_reads_rows_appended_by_other_writer(tmp_path: Path):
+    writer: VectorStore[str] = VectorStore.create(tmp_path / "store", dimensions=2)
+    reader: VectorStore[str] = VectorStore(tmp_path / "store")
+    writer.append([Embedded(value="x", vector=[1.0, 0.0])], identifiers=["x"])
+    assert len(reader) == 0
+
+    reader.refresh()
+    assert len(reader) == 1
+    assert reader.embedded(reader.position("x")).value == "x"
+
+
+def test_quantized_index_with_rescoring_matches_exact_search():
+    generator = np.random.default_rng(seed=42)
+    values: NDArray[Any] = generator.normal(size=(256, 64))
+    query: NDArray[Any] = values[7] + generator.normal(scale=0.1, size=64)
+    expected: list[int] = similarity_search(query, list(values), limit=5)
+
+    for quantization in ("int8", "binary"):
+        index: QuantizedVectorIndex[int] = QuantizedVectorIndex.of(
+            (Embedded(value=idx, vector=vector) for idx, vector in enumerate(values.tolist())),
+            quantization=quantization,
+            oversampling=256,  # rescoring all values gives exact results
+        )
+        assert index.search(query, limit=5) == expected
+        assert index.search(query, limit=1, score_threshold=0.5) == [7]
+
+
+def test_quantized_index_codes_are_compact():
+    vectors: list[list[float]] = np.random.default_rng(seed=42).normal(size=(16, 64)).tolist()
+    int8_index: QuantizedVectorIndex[int] = QuantizedVectorIndex.of(
+        (Embedded(value=idx, vector=vector) for idx, vector in enumerate(vectors)),
+        quantization="int8",
+    )
+    binary_index: QuantizedVectorIndex[int] = QuantizedVectorIndex.of(
+        (Embedded(value=idx, vector=vector) for idx, vector in enumerate(vectors)),
+        quantization="binary",
+    )
+
+    assert int8_index.codes_size == 16 * 64
+    assert binary_index.codes_size == 16 * 8
+
+
+def test_quantized_index_rescores_using_vector_store(tmp_path: Path):
+    generator = np.random.default_rng(seed=42)
+    values: NDArray[Any] = generator.normal(size=(64, 16))
+    query: NDArray[Any] = generator.normal(size=16)
+    store: VectorStore[int] = VectorStore.create(tmp_path / "store", dimensions=16)
+    store.append(Embedded(value=idx, vector=vector) for idx, vector in enumerate(values.tolist()))
+    index: QuantizedVectorIndex[int] = QuantizedVectorIndex.of_store(
+        store,
+        quantization="binary",
+        oversampling=64,
+    )
+
+    assert index.search(query, limit=3) == similarity_search(query, list(values), limit=3)
+
+
+def test_batch_search_matches_single_query_search():
+    generator = np.random.default_rng(seed=42)
+    values: NDArray[Any] = generator.normal(size=(128, 16))
+    queries: NDArray[Any] = generator.normal(size=(8, 16))
+    index: VectorIndex[int] = VectorIndex.of(
+        Embedded(value=idx, vector=vector) for idx, vector in enumerate(values.tolist())
+    )
+
+    indices, scores = batch_similarity_search(queries, list(values), limit=5)
+    index_indices, _ = batch_similarity_search(queries, index, limit=5)
+    assert indices.shape == scores.shape == (8, 5)
+    assert np.array_equal(indices, index_indices)
+    for query, query_indices, query_scores in zip(queries, indices, scores, strict=True):
+        assert query_indices.tolist() == similarity_search(query, list(values), limit=5)
+        assert np.allclose(query_scores, similarity_scores(query, values)[0, query_indices])
+
+
+def test_batch_search_limits_results_to_available_values():
+    indices, scores = batch_similarity_search(
+        [[1.0, 0.0], [0.0, 1.0]],
+        [[1.0, 0.1], [0.1, 1.0]],
+        limit=4,
+    )
+    assert indices.tolist() == [[0, 1], [1, 0]]
+    assert scores.shape == (2, 2)
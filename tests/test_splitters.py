@@ -0,0 +1,154 @@
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from io import StringIO
+from pathlib import Path
+
+from draive import split_text, split_text_stream, split_texts
+from pytest import mark, raises
+
+TEXT: str = (
+    "alpha beta\n\ngamma delta epsilon\n\nzeta\n\n"
+    "eta theta iota kappa lambda mu nu xi omicron pi rho\n\nsigma"
+)
+
+
+def count_words(text: str) -> int:
+    return len(text.split())
+
+
+def test_returns_small_text_as_is():
+    assert split_text("alpha beta", part_size=4, count_size=count_words) == ["alpha beta"]
+
+
+def test_merges_parts_and_splits_oversized_parts():
+    assert split_text(TEXT, part_size=4, count_size=count_words) == [
+        "alpha beta",
+        "gamma delta epsilon",
+        "zeta",
+        "eta theta iota",
+        "kappa lambda mu",
+        "nu xi omicron",
+        "pi rho",
+        "sigma",
+    ]
+
+
+def test_overlaps_parts():
+    assert split_text(TEXT, part_size=4, count_size=count_words, part_overlap_size=2) == [
+        "alpha beta",
+        "gamma delta epsilon",
+        "zeta",
+        "eta theta iota",
+        "iota kappa lambda",
+        "lambda mu nu",
+        "nu xi omicron",
+        "omicron pi rho",
+        "sigma",
+    ]
+
+
+def test_counts_each_part_once():
+    counted: list[str] = []
+
+    def count_size(text: str) -> int:
+        counted.append(text)
+        return count_words(text)
+
+    split_text(TEXT, part_size=4, count_size=count_size, part_overlap_size=2)
+    assert counted.count("zeta") == 1
+    assert counted.count("eta theta iota kappa lambda mu nu xi omicron pi rho") == 1
+
+
+def test_fails_without_separators():
+    with raises(ValueError):
+        split_text("abcdef", part_size=4, count_size=len)
+
+
+def test_stream_matches_split_text_for_text_pieces():
+    pieces: list[str] = [TEXT[index : index + 7] for index in range(0, len(TEXT), 7)]
+    assert list(
+        split_text_stream(pieces, part_size=4, count_size=count_words, part_overlap_size=2)
+    ) == split_text(TEXT, part_size=4, count_size=count_words, part_overlap_size=2)
+
+
+def test_stream_matches_split_text_for_files(tmp_path: Path):
+    path: Path = tmp_path / "text.txt"
+    path.write_text(TEXT)
+    expected: list[str] = split_text(TEXT, part_size=4, count_size=count_words)
+
+    assert list(split_text_stream(path, part_size=4, count_size=count_words, block_size=5)) == (
+        expected
+    )
+    assert (
+        list(split_text_stream(StringIO(TEXT), part_size=4, count_size=count_words, block_size=5))
+        == expected
+    )
+
+
+def test_stream_splits_text_without_primary_separator_incrementally():
+    lines: list[str] = [f"line {index} of log" for index in range(200)]
+    text: str = "\n".join(lines)
+    consumed: list[str] = []
+
+    def pieces() -> Iterator[str]:
+        for index in range(0, len(text), 7):
+            consumed.append(text[index : index + 7])
+            yield consumed[-1]
+
+    parts: Iterator[str] = split_text_stream(
+        pieces(),
+        part_size=8,
+        count_size=count_words,
+        buffer_size=64,
+    )
+    first: str = next(parts)
+    assert len("".join(consumed)) < len(text) // 4  # not waiting for the whole text
+    result: list[str] = [first, *parts]
+    assert all(count_words(part) <= 8 for part in result)
+    assert " ".join(result).split() == text.split()
+
+
+@mark.asyncio
+async def test_stream_matches_split_text_for_async_pieces():
+    async def pieces() -> AsyncIterator[str]:
+        for index in range(0, len(TEXT), 3):
+            yield TEXT[index : index + 3]
+
+    assert [
+        part async for part in split_text_stream(pieces(), part_size=4, count_size=count_words)
+    ] == split_text(TEXT, part_size=4, count_size=count_words)
+
+
+@mark.asyncio
+async def test_split_texts_in_worker_processes():
+    texts: list[str] = [TEXT, "alpha beta", TEXT.replace("zeta", "zeta eta theta")]
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results: list[list[str]] = await split_texts(
+            texts,
+            part_size=4,
+            count_size=count_words,
+            part_overlap_size=2,
+            executor=executor,
+        )
+
+    assert results == [
+        split_text(text, part_size=4, count_size=count_words, part_overlap_size=2) for text in texts
+    ]
+
+
+@mark.asyncio
+async def test_split_texts_streams_results_in_order():
+    texts: list[str] = [TEXT[index:] for index in range(0, 40, 4)]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results: list[list[str]] = [
+            parts
+            async for parts in await split_texts(
+                texts,
+                part_size=4,
+                count_size=count_words,
+                executor=executor,
+                stream=True,
+            )
+        ]
+
+    assert results == [split_text(text, part_size=4, count_size=count_words) for text in texts]
@@ -0,0 +1,91 @@
+from collections.abc import Sequence
+
+from draive import (
+    CacheHits,
+    CacheHitUsage,
+    Tokenization,
+    count_text_tokens,
+    count_texts_tokens,
+    ctx,
+    tokenization_cache,
+    tokenize_text,
+    tokenize_texts,
+)
+from pytest import mark
+
+
+def tokenize_words(text: str) -> list[int]:
+    return [len(word) for word in text.split()]
+
+
+@mark.asyncio
+@ctx.wrap("test", state=[Tokenization(tokenize_text=tokenize_words)])
+async def test_batch_functions_fall_back_to_text_tokenizer():
+    assert tokenize_text("a bb") == [1, 2]
+    assert tokenize_texts(["a bb", "ccc"]) == [[1, 2], [3]]
+    assert count_text_tokens("a bb ccc") == 3
+    assert count_texts_tokens(["a bb", "ccc", ""]) == [2, 1, 0]
+
+
+@mark.asyncio
+async def test_batch_functions_use_specialized_implementations():
+    calls: list[str] = []
+
+    def count_texts(texts: Sequence[str]) -> list[int]:
+        calls.append("count_texts")
+        return [len(text.split()) for text in texts]
+
+    def count_text(text: str) -> int:
+        calls.append("count_text")
+        return len(text.split())
+
+    @ctx.wrap(
+        "test",
+        state=[
+            Tokenization(
+                tokenize_text=tokenize_words,
+                count_text_tokens=count_text,
+                count_texts_tokens=count_texts,
+            )
+        ],
+    )
+    async def count() -> tuple[int, list[int]]:
+        return (count_text_tokens("a bb"), count_texts_tokens(["a", "b c"]))
+
+    assert await count() == (2, [1, 2])
+    assert calls == ["count_text", "count_texts"]
+
+
+@mark.asyncio
+async def test_cache_counts_each_text_once():
+    counted: list[str] = []
+
+    def tokenize(text: str) -> list[int]:
+        counted.append(text)
+        return tokenize_words(text)
+
+    @ctx.wrap(
+        "test",
+        state=[
+            tokenization_cache(
+                Tokenization(tokenize_text=tokenize),
+                identifier="words",
+                limit=2,
+            )
+        ],
+    )
+    async def count() -> list[int]:
+        results: list[int] = [
+            count_text_tokens("a bb"),
+            count_text_tokens("a bb"),
+            *count_texts_tokens(["a bb", "ccc"]),
+            count_text_tokens("d e f"),  # evicts "a bb"
+            count_text_tokens("a bb"),
+        ]
+        usage = ctx.read(CacheHitUsage)
+        assert usage is not None
+        assert usage.usage["tokenization"] == CacheHits(hits=2, misses=4)
+        return results
+
+    assert await count() == [2, 2, 2, 1, 3, 2]
+    assert counted == ["a bb", "ccc", "d e f", "a bb"]